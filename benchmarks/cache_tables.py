@@ -0,0 +1,134 @@
+"""
+VARCHAR vs ENUM parameter columns in the cache tables
+
+Builds two copies of recommendation_queries / venue_queries parameter
+columns (the old VARCHAR(20) layout and the current ENUM layout), seeds both
+with the same random rows, then reports the size of the composite parameter
+index and the time of the /stats GROUP BY over each copy.
+
+Index sizes are only meaningful on MySQL (SQLite stores both layouts as text).
+
+Usage:
+    DB_URL=mysql+aiomysql://root:pw@localhost/bench python -m benchmarks.cache_tables --rows 200000
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, Index, func, insert, select, text
+
+from src.database import engine
+from src.database.models import RecommendationQuery, VenueQuery
+
+PARAM_COLUMNS = {
+    RecommendationQuery: ("arm_length", "leg_length", "neck_length", "face_shape", "body_type"),
+    VenueQuery: ("guest_count", "budget", "region", "style_preference", "season"),
+}
+
+metadata = MetaData()
+
+
+def _bench_table(model, layout: str) -> Table:
+    """Parameter columns of model with either VARCHAR(20) or the model's ENUM types"""
+    name = f"bench_{layout}_{model.__tablename__}"
+    columns = [
+        Column(
+            column,
+            String(20) if layout == "varchar" else model.__table__.c[column].type.copy(),
+            nullable=False
+        )
+        for column in PARAM_COLUMNS[model]
+    ]
+    return Table(
+        name,
+        metadata,
+        Column("id", Integer, primary_key=True, autoincrement=True),
+        *columns,
+        Index(f"idx_{name}_params", *PARAM_COLUMNS[model])
+    )
+
+
+TABLES = {
+    model: {layout: _bench_table(model, layout) for layout in ("varchar", "enum")}
+    for model in PARAM_COLUMNS
+}
+
+
+def _random_row(model) -> dict:
+    return {
+        column: random.choice(model.__table__.c[column].type.enums)
+        for column in PARAM_COLUMNS[model]
+    }
+
+
+async def seed(rows: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+        await conn.run_sync(metadata.create_all)
+
+    for model, tables in TABLES.items():
+        for start in range(0, rows, 5000):
+            batch = [_random_row(model) for _ in range(min(5000, rows - start))]
+            async with engine.begin() as conn:
+                for table in tables.values():
+                    await conn.execute(insert(table), batch)
+
+
+async def index_bytes(conn, table: Table) -> int:
+    index_name = f"idx_{table.name}_params"
+    if conn.dialect.name == "mysql":
+        await conn.execute(text(f"ANALYZE TABLE {table.name}"))
+        result = await conn.execute(
+            text(
+                "SELECT stat_value * @@innodb_page_size FROM mysql.innodb_index_stats "
+                "WHERE database_name = DATABASE() AND table_name = :table_name "
+                "AND index_name = :index_name AND stat_name = 'size'"
+            ),
+            {"table_name": table.name, "index_name": index_name}
+        )
+    else:
+        result = await conn.execute(
+            text("SELECT SUM(pgsize) FROM dbstat WHERE name = :index_name"),
+            {"index_name": index_name}
+        )
+    return int(result.scalar() or 0)
+
+
+async def time_stats_query(conn, model, table: Table, repeat: int) -> float:
+    """Best-of-N latency (ms) of the get_stats combination GROUP BY"""
+    columns = [table.c[column] for column in PARAM_COLUMNS[model]]
+    stmt = select(*columns, func.count(table.c.id)).group_by(*columns)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        (await conn.execute(stmt)).all()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+async def main(rows: int, repeat: int, keep: bool) -> None:
+    await seed(rows)
+
+    print(f"rows={rows} dialect={engine.dialect.name} (best of {repeat})")
+    async with engine.connect() as conn:
+        for model, tables in TABLES.items():
+            print(f"  {model.__tablename__}")
+            for layout, table in tables.items():
+                size = await index_bytes(conn, table)
+                ms = await time_stats_query(conn, model, table, repeat)
+                print(f"    {layout:<8} index {size / 1024:10.1f} KiB   stats query {ms:8.2f} ms")
+
+    if not keep:
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.drop_all)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="Keep the bench_* tables afterwards")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat, args.keep))
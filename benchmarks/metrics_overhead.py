@@ -0,0 +1,107 @@
+"""
+HTTP metrics instrumentation overhead
+
+Drives a minimal FastAPI app directly through ASGI (no sockets) with
+RequestContextMiddleware recording metrics on and off and reports the added
+cost per request, plus the /metrics render time for the resulting registry. Exits non-zero when the
+per-request overhead exceeds the budget, so it can gate changes to the
+instrumentation.
+
+Usage:
+    python -m benchmarks.metrics_overhead --requests 20000 --budget-us 25
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+from fastapi import FastAPI
+
+from src.api.middleware import RequestContextMiddleware
+from src.services.metrics import annotate_request, render_prometheus
+
+# 요청당 지표 기록에 허용하는 추가 시간(마이크로초)
+DEFAULT_BUDGET_US = 25.0
+
+
+def build_app(instrumented: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        annotate_request(source="memory_cache")
+        return {"item_id": item_id}
+
+    app.add_middleware(RequestContextMiddleware, record_metrics=instrumented)
+    return app
+
+
+async def drive(app, requests: int) -> float:
+    """Seconds per request for sequential ASGI calls"""
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for i in range(requests):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": f"/items/{i % 100}",
+            "raw_path": f"/items/{i % 100}".encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [],
+            "server": ("bench", 80),
+            "client": ("bench", 1234),
+        }
+        await app(scope, receive, send)
+    return (time.perf_counter() - start) / requests
+
+
+async def measure(requests: int, rounds: int) -> dict:
+    baseline_app, instrumented_app = build_app(False), build_app(True)
+    # 라우터/미들웨어 스택 초기화와 JIT 성격의 캐시를 먼저 채움
+    await drive(baseline_app, 500)
+    await drive(instrumented_app, 500)
+
+    baseline, instrumented = [], []
+    for _ in range(rounds):
+        baseline.append(await drive(baseline_app, requests))
+        instrumented.append(await drive(instrumented_app, requests))
+    return {
+        "baseline_us": statistics.median(baseline) * 1e6,
+        "instrumented_us": statistics.median(instrumented) * 1e6,
+    }
+
+
+def main(requests: int, rounds: int, budget_us: float) -> None:
+    result = asyncio.run(measure(requests, rounds))
+    overhead = result["instrumented_us"] - result["baseline_us"]
+
+    start = time.perf_counter()
+    body = render_prometheus()
+    render_ms = (time.perf_counter() - start) * 1000
+
+    print(f"baseline      {result['baseline_us']:7.1f} us/request")
+    print(f"instrumented  {result['instrumented_us']:7.1f} us/request")
+    print(f"overhead      {overhead:7.1f} us/request (budget {budget_us:.1f} us)")
+    print(f"/metrics render {render_ms:.2f} ms ({len(body.splitlines())} lines)")
+    if overhead > budget_us:
+        print("❌ Instrumentation overhead over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--budget-us", type=float, default=DEFAULT_BUDGET_US)
+    args = parser.parse_args()
+    main(args.requests, args.rounds, args.budget_us)
@@ -0,0 +1,106 @@
+"""
+Offset vs keyset pagination benchmark
+
+Seeds the surveys table (DB_URL, e.g. a throwaway SQLite file) and times
+page 1 and a deep page with get_all (OFFSET) and get_page (cursor).
+
+Usage:
+    DB_URL=sqlite+aiosqlite:///./bench.db python -m benchmarks.pagination --rows 200000 --page 10000
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, func, select
+
+from src.database import engine, AsyncSessionLocal, init_db
+from src.database.models import Survey
+from src.database.pagination import encode_cursor
+from src.database.repositories.survey import survey_repo
+from src.services.schemas import ArmLength, LegLength, NeckLength, FaceShape, BodyType
+
+
+async def seed(rows: int) -> None:
+    async with AsyncSessionLocal() as db:
+        existing = (await db.execute(select(func.count(Survey.id)))).scalar()
+    if existing >= rows:
+        return
+
+    start = datetime.utcnow() - timedelta(days=365)
+    batch = []
+    async with engine.begin() as conn:
+        for i in range(existing, rows):
+            batch.append({
+                "arm_length": random.choice(list(ArmLength)),
+                "leg_length": random.choice(list(LegLength)),
+                "neck_length": random.choice(list(NeckLength)),
+                "face_shape": random.choice(list(FaceShape)),
+                "body_type": random.choice(list(BodyType)),
+                "created_at": start + timedelta(seconds=i * 10),
+                "updated_at": start + timedelta(seconds=i * 10)
+            })
+            if len(batch) == 5000:
+                await conn.execute(insert(Survey), batch)
+                batch = []
+        if batch:
+            await conn.execute(insert(Survey), batch)
+
+
+async def time_call(coro_factory, repeat: int) -> float:
+    """Best-of-N latency in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await coro_factory()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+async def main(rows: int, page: int, page_size: int, repeat: int) -> None:
+    await init_db()
+    await seed(rows)
+
+    # 깊은 페이지의 커서를 미리 구해둠 (측정 대상 아님)
+    cursor = None
+    async with AsyncSessionLocal() as db:
+        skip = (page - 1) * page_size
+        if skip:
+            anchor = (await survey_repo.get_all(db, skip=skip - 1, limit=1))[0]
+            cursor = encode_cursor(anchor.created_at, anchor.id)
+
+        async def offset_first():
+            await survey_repo.get_all(db, skip=0, limit=page_size)
+
+        async def offset_deep():
+            await survey_repo.get_all(db, skip=skip, limit=page_size)
+
+        async def keyset_first():
+            await survey_repo.get_page(db, limit=page_size)
+
+        async def keyset_deep():
+            await survey_repo.get_page(db, cursor=cursor, limit=page_size)
+
+        results = {
+            "offset page 1": await time_call(offset_first, repeat),
+            f"offset page {page}": await time_call(offset_deep, repeat),
+            "keyset page 1": await time_call(keyset_first, repeat),
+            f"keyset page {page}": await time_call(keyset_deep, repeat),
+        }
+
+    await engine.dispose()
+
+    print(f"rows={rows} page_size={page_size} (best of {repeat})")
+    for name, ms in results.items():
+        print(f"  {name:<22} {ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--page", type=int, default=10_000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.page, args.page_size, args.repeat))
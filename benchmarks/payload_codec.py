@@ -0,0 +1,112 @@
+"""
+Recommendation payload codec benchmark
+
+Builds dress recommendation payloads the way DressRecommender does (local
+style details + Korean advice), trains a dictionary on one half and reports
+stored size, compression ratio and per-hit encode/decode cost on the other
+half for each codec. --from-db samples stored rows instead (DB_URL).
+
+Usage:
+    python -m benchmarks.payload_codec --payloads 2000
+    DB_URL=... python -m benchmarks.payload_codec --from-db
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from itertools import product
+from typing import List
+
+from src.database import codec
+from src.database.codec import PayloadCodec, train_dictionary
+from src.services.dress_data import get_all_style_names, get_style_details
+from src.services.schemas import ArmLength, LegLength, NeckLength, FaceShape, BodyType
+
+ADVICE = [
+    "허리 라인을 살리는 실루엣으로 균형 잡힌 비율을 연출해 보세요.",
+    "목선이 드러나는 네크라인으로 상체를 더 길어 보이게 하세요.",
+    "가벼운 소재와 심플한 액세서리로 우아함을 강조해 보세요.",
+    "하이힐과 업스타일 헤어로 전체적인 비율을 맞추는 것을 추천드립니다.",
+]
+
+
+def synthetic_payloads(count: int) -> List[dict]:
+    """Payloads shaped like DressRecommender.generate output"""
+    styles = get_all_style_names()
+    combos = list(product(ArmLength, LegLength, NeckLength, FaceShape, BodyType))
+    payloads = []
+    for _ in range(count):
+        arm, leg, neck, face, body = random.choice(combos)
+        why_parts = [f"{arm.value} 팔", f"{leg.value} 다리", f"{neck.value} 목", f"{face.value} 얼굴형", f"{body.value} 체형"]
+        payloads.append({
+            "recommendations": [
+                {
+                    "style_name": style["style_name"],
+                    "description": style["description"],
+                    "why_recommended": f"{', '.join(why_parts)}에 잘 어울립니다.",
+                    "styling_tips": style["styling_tips"]
+                }
+                for style in get_style_details(random.sample(styles, random.randint(1, 5)))
+            ],
+            "overall_advice": random.choice(ADVICE)
+        })
+    return payloads
+
+
+async def stored_payloads(count: int) -> List[dict]:
+    from src.database import engine
+    from src.database.codec_tools import load_samples
+    try:
+        samples = await load_samples(count)
+    finally:
+        await engine.dispose()
+    return [json.loads(sample) for sample in samples]
+
+
+def measure(payload_codec: PayloadCodec, payloads: List[dict]) -> dict:
+    start = time.perf_counter()
+    encoded = [payload_codec.encode(payload) for payload in payloads]
+    encode_us = (time.perf_counter() - start) / len(payloads) * 1e6
+
+    start = time.perf_counter()
+    for data in encoded:
+        payload_codec.decode(data)
+    decode_us = (time.perf_counter() - start) / len(payloads) * 1e6
+
+    return {"bytes": sum(len(data) for data in encoded), "encode_us": encode_us, "decode_us": decode_us}
+
+
+def main(count: int, dict_size: int, from_db: bool) -> None:
+    payloads = asyncio.run(stored_payloads(count)) if from_db else synthetic_payloads(count)
+    if len(payloads) < 20:
+        raise SystemExit("Need at least 20 payloads")
+    random.shuffle(payloads)
+    train, test = payloads[: len(payloads) // 2], payloads[len(payloads) // 2:]
+    samples = [json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode() for payload in train]
+
+    configs = [("none", None), ("zlib", None), ("zlib+dict", train_dictionary(samples, dict_size, "zlib"))]
+    if codec.zstandard is not None:
+        configs += [("zstd", None), ("zstd+dict", train_dictionary(samples, dict_size, "zstd"))]
+
+    results = {}
+    for name, dictionary in configs:
+        payload_codec = PayloadCodec(name.split("+")[0], dictionaries=[dictionary] if dictionary else None)
+        results[name] = measure(payload_codec, test)
+
+    raw_bytes = results["none"]["bytes"]
+    print(f"payloads={len(test)} (trained on {len(train)}) raw={raw_bytes / len(test):.0f} B/row")
+    for name, result in results.items():
+        print(
+            f"  {name:<10} {result['bytes'] / len(test):7.0f} B/row  ratio {raw_bytes / result['bytes']:5.2f}x"
+            f"  encode {result['encode_us']:7.1f} us  decode {result['decode_us']:7.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--payloads", type=int, default=2000)
+    parser.add_argument("--dict-size", type=int, default=16 * 1024)
+    parser.add_argument("--from-db", action="store_true")
+    args = parser.parse_args()
+    main(args.payloads, args.dict_size, args.from_db)
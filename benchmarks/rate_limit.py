@@ -0,0 +1,121 @@
+"""
+Rate limiter overhead
+
+Measures the cost of one RateLimiter.check() per request, the way the routes
+call it: client identity from the ASGI scope, then a token bucket take. It
+runs against the in-process store and, with --redis, against the fake Redis
+backend, which includes the client wrapper and script dispatch but not the
+network round trip. The clients are spread over a large population so that
+dict growth and pruning are part of the measurement. Exits non-zero when the
+in-process check exceeds the budget.
+
+Usage:
+    python -m benchmarks.rate_limit --checks 200000 --clients 50000 --budget-us 5
+    REDIS_BACKEND=fake python -m benchmarks.rate_limit --redis
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+
+from src.config.redis import redis_client
+from src.services.metrics import current_request_scope
+from src.services.rate_limit import RateLimited, RateLimiter, TokenBucketStore
+
+# 요청당 허용하는 limiter 비용(마이크로초)
+DEFAULT_BUDGET_US = 5.0
+
+
+def build_scopes(clients: int, api_key_ratio: float) -> list:
+    scopes = []
+    for i in range(clients):
+        headers = [(b"content-type", b"application/json"), (b"user-agent", b"bench")]
+        if random.random() < api_key_ratio:
+            headers.append((b"x-api-key", f"key-{i}".encode()))
+        scopes.append({"type": "http", "headers": headers, "client": (f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}", 5000)})
+    return scopes
+
+
+async def run(limiter: RateLimiter, scopes: list, checks: int) -> float:
+    """Seconds per check (allowed and rejected checks both count)"""
+    order = [random.randrange(len(scopes)) for _ in range(checks)]
+    start = time.perf_counter()
+    for index in order:
+        token = current_request_scope.set(scopes[index])
+        try:
+            await limiter.check("cache")
+        except RateLimited:
+            pass
+        finally:
+            current_request_scope.reset(token)
+    return (time.perf_counter() - start) / checks
+
+
+async def baseline(scopes: list, checks: int) -> float:
+    """Same loop without the limiter (context var + await only)"""
+    async def noop():
+        pass
+    order = [random.randrange(len(scopes)) for _ in range(checks)]
+    start = time.perf_counter()
+    for index in order:
+        token = current_request_scope.set(scopes[index])
+        try:
+            await noop()
+        finally:
+            current_request_scope.reset(token)
+    return (time.perf_counter() - start) / checks
+
+
+async def measure(args) -> dict:
+    scopes = build_scopes(args.clients, args.api_key_ratio)
+    budgets = {"cache": (args.rate, args.burst)}
+    # 보낸 키가 모두 등록된 키인 경우 (등록되지 않은 키는 IP 경로와 같음)
+    api_keys = [f"key-{i}" for i in range(args.clients)]
+    memory = RateLimiter(budgets, TokenBucketStore(args.max_entries), "memory", api_keys)
+
+    results = {"baseline": [], "memory": [], "redis": []}
+    for _ in range(args.rounds):
+        results["baseline"].append(await baseline(scopes, args.checks))
+        results["memory"].append(await run(memory, scopes, args.checks))
+
+    if args.redis:
+        await redis_client.connect()
+        shared = RateLimiter(budgets, TokenBucketStore(args.max_entries), "redis", api_keys)
+        for _ in range(args.rounds):
+            results["redis"].append(await run(shared, scopes, args.checks // 10))
+        await redis_client.disconnect()
+
+    summary = {name: statistics.median(values) * 1e6 for name, values in results.items() if values}
+    summary["buckets"] = len(memory.store)
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--checks", type=int, default=200_000)
+    parser.add_argument("--clients", type=int, default=50_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--rate", type=float, default=10.0)
+    parser.add_argument("--burst", type=float, default=60.0)
+    parser.add_argument("--api-key-ratio", type=float, default=0.5, help="Share of clients sending X-API-Key")
+    parser.add_argument("--max-entries", type=int, default=100_000)
+    parser.add_argument("--redis", action="store_true", help="Also measure the Redis backend (REDIS_BACKEND)")
+    parser.add_argument("--budget-us", type=float, default=DEFAULT_BUDGET_US)
+    args = parser.parse_args()
+
+    result = asyncio.run(measure(args))
+    overhead = result["memory"] - result["baseline"]
+    print(f"baseline        {result['baseline']:6.2f} us/check")
+    print(f"memory          {result['memory']:6.2f} us/check  ({result['buckets']} buckets)")
+    if "redis" in result:
+        print(f"redis ({redis_client.backend})    {result['redis']:6.2f} us/check (+ network round trip)")
+    print(f"overhead        {overhead:6.2f} us/check (budget {args.budget_us:.1f} us)")
+    if overhead > args.budget_us:
+        print("❌ Rate limiter overhead over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+Request replay harness
+
+Replays recommendation traffic against a running API and reports throughput,
+latency percentiles and where responses were served from (source). The
+workload is either synthetic (Zipf-skewed over the dress/venue key spaces) or
+recorded traffic from event_logs (recommendation_served events, --from-db).
+
+--compare-workers starts `python -m src.api.server --workers N` for each N in
+turn (same environment / DB_URL), waits for /health, warms it up, replays the
+same workload and prints the speedup against the first run. --seed first fills
+the cache tables with synthetic recommendations so no request reaches OpenAI.
+
+Usage:
+    python -m benchmarks.replay --url http://localhost:8000 --requests 5000
+    DB_URL=sqlite+aiosqlite:///./bench.db python -m benchmarks.replay --seed --compare-workers 1,4
+"""
+import argparse
+import asyncio
+import os
+import random
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from typing import List, Tuple
+
+import httpx
+
+from src.services.query_keys import DRESS_KEYS, VENUE_KEYS
+
+DRESS_FIELDS = ("arm_length", "leg_length", "neck_length", "face_shape", "body_type", "num_recommendations")
+VENUE_FIELDS = ("guest_count", "budget", "region", "style_preference", "season", "num_recommendations")
+
+Request = Tuple[str, dict]
+
+
+def dress_request(key: int) -> Request:
+    return "/recommend", dict(zip(DRESS_FIELDS, DRESS_KEYS.decode(key)))
+
+
+def venue_request(key: int) -> Request:
+    return "/recommend/venue", dict(zip(VENUE_FIELDS, VENUE_KEYS.decode(key)))
+
+
+def synthetic_workload(count: int, skew: float, venue_ratio: float) -> List[Request]:
+    """Zipf-like popularity: the k-th most popular key has weight 1 / k^skew"""
+    workload = []
+    for key_space, build, share in ((DRESS_KEYS, dress_request, 1 - venue_ratio), (VENUE_KEYS, venue_request, venue_ratio)):
+        n = round(count * share)
+        if n == 0:
+            continue
+        keys = list(range(key_space.size))
+        random.shuffle(keys)
+        weights = [1 / (rank + 1) ** skew for rank in range(len(keys))]
+        workload += [build(key) for key in random.choices(keys, weights, k=n)]
+    random.shuffle(workload)
+    return workload
+
+
+async def recorded_workload(count: int) -> List[Request]:
+    """Most recent recommendation_served events, replayed in their original order"""
+    from sqlalchemy import select
+    from src.database import engine
+    from src.database.models import EventLog
+
+    try:
+        async with engine.connect() as conn:
+            rows = (await conn.execute(
+                select(EventLog.event_metadata)
+                .where(EventLog.event_type == "recommendation_served")
+                .order_by(EventLog.id.desc())
+                .limit(count)
+            )).scalars().all()
+    finally:
+        await engine.dispose()
+
+    builders = {"dress": dress_request, "venue": venue_request}
+    return [builders[row["kind"]](row["query_key"]) for row in reversed(rows) if row.get("kind") in builders]
+
+
+async def seed_cache_tables() -> int:
+    """Insert a synthetic recommendation for every key missing from the cache tables"""
+    from sqlalchemy import insert, select
+    from src.database import engine, init_db
+    from src.database.models import RecommendationQuery, VenueQuery
+    from benchmarks.payload_codec import synthetic_payloads
+
+    venue_payload = {
+        "recommendations": [{
+            "venue_name": "벤치마크 웨딩홀",
+            "description": "리플레이 벤치마크용 합성 추천입니다.",
+            "capacity": "200-300명",
+            "location": "서울",
+            "price_range": "중",
+            "estimated_cost": "3,000만원",
+            "why_recommended": "합성 데이터"
+        }],
+        "overall_advice": "합성 데이터"
+    }
+    tables = (
+        (RecommendationQuery, DRESS_KEYS, DRESS_FIELDS[:5], synthetic_payloads),
+        (VenueQuery, VENUE_KEYS, VENUE_FIELDS[:5], lambda n: [venue_payload] * n),
+    )
+
+    inserted = 0
+    try:
+        await init_db()
+        async with engine.begin() as conn:
+            for model, key_space, fields, payloads in tables:
+                existing = set((await conn.execute(select(model.query_key))).scalars())
+                missing = [key for key in range(key_space.size) if key not in existing]
+                rows = [
+                    {"query_key": key, "recommendation": payload, **dict(zip(fields, key_space.decode(key)))}
+                    for key, payload in zip(missing, payloads(len(missing)))
+                ]
+                for start in range(0, len(rows), 1000):
+                    await conn.execute(insert(model), rows[start:start + 1000])
+                inserted += len(rows)
+    finally:
+        await engine.dispose()
+    return inserted
+
+
+async def replay(url: str, workload: List[Request], concurrency: int) -> dict:
+    latencies: List[float] = []
+    sources: Counter = Counter()
+    errors = 0
+    # 워커 재시작 시 유휴 keep-alive 연결이 닫히면서 생기는 실패 (HTTP/1.1 특성, 서버 오류와 분리)
+    disconnects = 0
+    queue = iter(workload)
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        nonlocal errors, disconnects
+        for path, body in queue:
+            start = time.perf_counter()
+            try:
+                response = await client.post(path, json=body)
+            except (httpx.ReadError, httpx.RemoteProtocolError):
+                disconnects += 1
+                continue
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+            if response.status_code == 200:
+                sources[response.json().get("source", "unknown")] += 1
+            else:
+                errors += 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*[worker(client) for _ in range(concurrency)])
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else 0.0
+
+    return {
+        "requests": len(workload),
+        "errors": errors,
+        "disconnects": disconnects,
+        "elapsed_seconds": elapsed,
+        "rps": len(workload) / elapsed if elapsed else 0.0,
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "sources": dict(sources)
+    }
+
+
+def print_result(label: str, result: dict) -> None:
+    print(
+        f"{label:<12} {result['rps']:8.0f} req/s  mean {result['mean_ms']:6.1f} ms  p50 {result['p50_ms']:6.1f}"
+        f"  p95 {result['p95_ms']:6.1f}  p99 {result['p99_ms']:6.1f}  errors {result['errors']}"
+        f"  disconnects {result['disconnects']}  {result['sources']}"
+    )
+
+
+async def wait_until_healthy(url: str, process: subprocess.Popen, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=url, timeout=2) as client:
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise SystemExit(f"Server exited with code {process.returncode}")
+            try:
+                if (await client.get("/health/")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.5)
+    raise SystemExit("Server did not become healthy in time")
+
+
+async def compare_workers(
+    worker_counts: List[int],
+    port: int,
+    workload: List[Request],
+    warmup: List[Request],
+    concurrency: int
+) -> None:
+    url = f"http://127.0.0.1:{port}"
+    results = []
+    for workers in worker_counts:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "src.api.server", "--workers", str(workers), "--host", "127.0.0.1", "--port", str(port)],
+            env=os.environ.copy(),
+            stdout=subprocess.DEVNULL
+        )
+        try:
+            await wait_until_healthy(url, process)
+            await replay(url, warmup, concurrency)
+            result = await replay(url, workload, concurrency)
+        finally:
+            process.send_signal(signal.SIGTERM)
+            process.wait(timeout=60)
+        results.append(result)
+        print_result(f"workers={workers}", result)
+
+    baseline = results[0]["rps"]
+    for workers, result in zip(worker_counts, results):
+        print(f"  workers={workers:<3} speedup {result['rps'] / baseline:5.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000", help="Running API (ignored with --compare-workers)")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent for synthetic traffic")
+    parser.add_argument("--venue-ratio", type=float, default=0.2)
+    parser.add_argument("--from-db", action="store_true", help="Replay recorded event_logs traffic (DB_URL)")
+    parser.add_argument("--seed", action="store_true", help="Fill cache tables so no request calls OpenAI")
+    parser.add_argument("--compare-workers", help="Comma-separated worker counts, e.g. 1,4")
+    parser.add_argument("--port", type=int, default=18000, help="Port for servers started by --compare-workers")
+    parser.add_argument("--warmup", type=int, default=2000, help="Requests replayed before measuring")
+    args = parser.parse_args()
+
+    if args.seed:
+        print(f"seeded {asyncio.run(seed_cache_tables())} rows")
+
+    if args.from_db:
+        workload = asyncio.run(recorded_workload(args.requests))
+    else:
+        workload = synthetic_workload(args.requests, args.skew, args.venue_ratio)
+    if not workload:
+        raise SystemExit("Empty workload")
+    warmup = synthetic_workload(args.warmup, args.skew, args.venue_ratio) if args.warmup else []
+
+    if args.compare_workers:
+        worker_counts = [int(value) for value in args.compare_workers.split(",")]
+        asyncio.run(compare_workers(worker_counts, args.port, workload, warmup, args.concurrency))
+    else:
+        print_result("replay", asyncio.run(replay(args.url, workload, args.concurrency)))
+
+
+if __name__ == "__main__":
+    main()
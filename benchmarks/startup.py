@@ -0,0 +1,94 @@
+"""
+Startup profile
+
+Reports the import cost of src.api.main (python -X importtime, slowest
+modules by cumulative time) and, with --boot, the time from process start
+until /health answers (live) and until /health/ready returns 200 (ready),
+including the warm-up steps the app recorded.
+
+Usage:
+    python -m benchmarks.startup --top 15
+    APP_ROLES=images python -m benchmarks.startup --boot
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+
+import httpx
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def profile_imports(top: int) -> None:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.api.main"],
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise SystemExit(result.stderr.splitlines()[-1])
+
+    modules = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            modules.append((int(match.group(2)), len(match.group(3)), match.group(4)))
+    total = next((cumulative for cumulative, _, name in modules if name == "src.api.main"), 0)
+    print(f"import src.api.main: {total / 1000:.0f} ms")
+    # 최상위(들여쓰기 1) import 기준으로 정렬해야 중복 합산이 없음
+    for cumulative, depth, name in sorted((m for m in modules if m[1] <= 3), reverse=True)[1:top + 1]:
+        print(f"  {cumulative / 1000:7.1f} ms  {name}")
+
+
+def profile_boot(port: int, timeout: float) -> None:
+    url = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.api.main:app", "--host", "127.0.0.1", "--port", str(port)],
+        env=os.environ.copy(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    live_at = ready_at = None
+    status = {}
+    try:
+        with httpx.Client(base_url=url, timeout=1) as client:
+            while time.perf_counter() - start < timeout and ready_at is None:
+                if process.poll() is not None:
+                    raise SystemExit(f"Server exited with code {process.returncode}")
+                try:
+                    if live_at is None and client.get("/health/").status_code == 200:
+                        live_at = time.perf_counter() - start
+                    if live_at is not None:
+                        response = client.get("/health/ready")
+                        status = response.json()
+                        if response.status_code == 200:
+                            ready_at = time.perf_counter() - start
+                except httpx.HTTPError:
+                    pass
+                time.sleep(0.01)
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+    print(f"roles={os.environ.get('APP_ROLES', 'default')}")
+    print(f"  live  after {live_at * 1000:7.0f} ms" if live_at else "  never live")
+    print(f"  ready after {ready_at * 1000:7.0f} ms" if ready_at else f"  never ready: {status.get('error')}")
+    for step, seconds in status.get("steps", {}).items():
+        print(f"    {step:<22} {seconds * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to list")
+    parser.add_argument("--boot", action="store_true", help="Also time live/ready for a real server process")
+    parser.add_argument("--port", type=int, default=18010)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+    profile_imports(args.top)
+    if args.boot:
+        profile_boot(args.port, args.timeout)
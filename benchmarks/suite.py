@@ -0,0 +1,392 @@
+"""
+Recommendation hot-path benchmark suite with JSON baselines
+
+Micro benchmarks: venue SQL building, venue catalog filtering, style
+lookups, prompt catalog strings, dense key encoding, venue row formatting,
+and response model construction / JSON serialization.
+
+End-to-end benchmarks: in-process requests through the full app (middleware,
+routes, SQLite, fake OpenAI client). Each case takes one path: memory hit,
+MySQL (SQLite) hit, dress generation, venue generation and a GET 304
+revalidation.
+
+Each case reports the median time per operation over several rounds.
+Results are written as JSON. `compare` flags cases slower than the baseline
+by more than --threshold and exits non-zero, so it can gate changes.
+Baselines are machine-specific: save them on the machine that compares
+against them.
+
+Usage:
+    python -m benchmarks.suite run --save main               # benchmarks/baselines/main.json
+    python -m benchmarks.suite run --compare main            # run and compare against a baseline
+    python -m benchmarks.suite run --filter micro --output /tmp/after.json
+    python -m benchmarks.suite compare main /tmp/after.json --threshold 0.15
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+# 종단 간 케이스용 격리 환경 (설정은 첫 import 시 읽히므로 src import 전에 지정)
+_BENCH_DB = Path(tempfile.gettempdir()) / f"bench_suite_{os.getpid()}.db"
+BENCH_ENV = {
+    "DB_URL": f"sqlite+aiosqlite:///{_BENCH_DB}",
+    "DB_PASSWORD": "bench",
+    "OPENAI_API_KEY": "bench",
+    "DB_CREATE_TABLES_ON_STARTUP": "true",
+    "DB_POOL_WARMUP": "0",
+    "REDIS_BACKEND": "none",
+    "RATE_LIMIT_ENABLED": "false",
+    "EVENTS_ENABLED": "false",
+    "CACHE_RETENTION_ENABLED": "false",
+}
+
+Case = Callable[[], object]
+E2E_CASES = (
+    "e2e.dress_generate", "e2e.dress_db_hit", "e2e.dress_memory_hit", "e2e.dress_get_304",
+    "e2e.venue_generate", "e2e.venue_memory_hit"
+)
+
+
+# ---------------------------------------------------------------------------
+# Micro benchmarks
+# ---------------------------------------------------------------------------
+
+def micro_cases() -> Dict[str, Case]:
+    import itertools
+    from src.services.dress_data import get_style_details, get_styles_with_suitability, get_all_style_names
+    from src.services.dress_recommender import DressRecommender
+    from src.services.query_keys import DRESS_KEYS, VENUE_KEYS
+    from src.services.schemas import (
+        DressRecommendation, RecommendationRequest, RecommendationResponse,
+        VenueRecommendation, VenueRecommendationRequest, VenueRecommendationResponse
+    )
+    from src.services.venue_query_builder import build_venue_query
+    from src.services.venue_recommender import VenueRecommender
+    from src.services.venues_data import filter_venues
+
+    dress_inputs = itertools.cycle([DRESS_KEYS.decode(key) for key in range(0, DRESS_KEYS.size, 7)])
+    venue_inputs = itertools.cycle([VENUE_KEYS.decode(key) for key in range(0, VENUE_KEYS.size, 11)])
+    style_names = get_all_style_names()[:3]
+    venue_recommender = VenueRecommender()
+    rows = [
+        {
+            "name": f"웨딩홀 {i}", "venueType": venue_type, "parking": 100 + i, "address": "서울 강남구",
+            "phone": "02-000-0000", "imageUrl": ""
+        }
+        for i, venue_type in enumerate(["HOTEL", "WEDDING_HALL", "GARDEN", "RESTAURANT", "HOUSE_STUDIO"])
+    ]
+    venue_params = VENUE_KEYS.decode(0)
+    venue_payload = venue_recommender.format_rows(rows[:3], *venue_params[:5])
+    dress_payload = DressRecommender._build_result(style_names, "조언 " * 20, "short", "long", "medium", "oval", "thin")
+    dress_request = RecommendationRequest(**dict(zip(
+        ("arm_length", "leg_length", "neck_length", "face_shape", "body_type", "num_recommendations"),
+        DRESS_KEYS.decode(0)
+    )))
+    venue_request = VenueRecommendationRequest(**dict(zip(
+        ("guest_count", "budget", "region", "style_preference", "season", "num_recommendations"),
+        venue_params
+    )))
+
+    def dress_response():
+        return RecommendationResponse(
+            request_params=dress_request,
+            recommendations=[DressRecommendation(**rec) for rec in dress_payload["recommendations"]],
+            overall_advice=dress_payload["overall_advice"],
+            cached=True,
+            source="memory_cache"
+        )
+
+    def venue_response():
+        return VenueRecommendationResponse(
+            request_params=venue_request,
+            recommendations=[VenueRecommendation(**rec) for rec in venue_payload["recommendations"]],
+            overall_advice=venue_payload["overall_advice"],
+            cached=True,
+            source="memory_cache"
+        )
+
+    built_dress, built_venue = dress_response(), venue_response()
+    return {
+        "micro.build_venue_query": lambda: build_venue_query(*next(venue_inputs)),
+        "micro.filter_venues": lambda: filter_venues(*next(venue_inputs)),
+        "micro.get_style_details": lambda: get_style_details(style_names),
+        "micro.get_styles_with_suitability": get_styles_with_suitability,
+        "micro.get_styles_with_suitability.uncached": get_styles_with_suitability.__wrapped__,
+        "micro.dress_generate_key": lambda: DressRecommender.generate_key(*next(dress_inputs)),
+        "micro.venue_generate_key": lambda: VenueRecommender.generate_key(*next(venue_inputs)),
+        "micro.venue_format_rows": lambda: venue_recommender.format_rows(rows, *venue_params[:5]),
+        "micro.dress_response.build": dress_response,
+        "micro.dress_response.dump_json": built_dress.model_dump_json,
+        "micro.venue_response.build": venue_response,
+        "micro.venue_response.dump_json": built_venue.model_dump_json,
+    }
+
+
+def time_case(case: Case, rounds: int, min_time: float) -> List[float]:
+    """Seconds per operation for each round (iterations calibrated to ~min_time per round)"""
+    timer = timeit.Timer(case)
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    return [total / number for total in timer.repeat(repeat=rounds, number=number)]
+
+
+# ---------------------------------------------------------------------------
+# End-to-end benchmarks (in-process ASGI)
+# ---------------------------------------------------------------------------
+
+def _fake_openai_client():
+    from types import SimpleNamespace
+    from src.services.dress_data import get_all_style_names
+
+    styles = get_all_style_names()
+
+    async def create(**kwargs):
+        content = json.dumps({"style_names": styles[:3], "overall_advice": "체형에 맞는 라인을 고르세요."}, ensure_ascii=False)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(prompt_tokens=900, completion_tokens=40)
+        )
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+async def _seed_venues(count: int = 300) -> None:
+    from sqlalchemy import text
+    from src.database import engine
+
+    venue_types = ["HOTEL", "WEDDING_HALL", "GARDEN", "OUTDOOR", "RESTAURANT", "HOUSE_STUDIO", "OTHER"]
+    regions = ["서울 강남구", "경기 성남시", "인천 연수구", "부산 해운대구"]
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS tb_wedding_hall (id INTEGER PRIMARY KEY, name TEXT, venueType TEXT, "
+            "parking INTEGER, address TEXT, phone TEXT, email TEXT, imageUrl TEXT)"
+        ))
+        await conn.execute(text("DELETE FROM tb_wedding_hall"))
+        await conn.execute(
+            text(
+                "INSERT INTO tb_wedding_hall (name, venueType, parking, address, phone, email, imageUrl) "
+                "VALUES (:name, :venue_type, :parking, :address, '02-000-0000', '', '')"
+            ),
+            [
+                {
+                    "name": f"웨딩홀 {i}", "venue_type": venue_types[i % len(venue_types)],
+                    "parking": (i * 37) % 400, "address": regions[i % len(regions)]
+                }
+                for i in range(count)
+            ]
+        )
+
+
+async def run_e2e(requests: int, rounds: int) -> Dict[str, List[float]]:
+    """Seconds per request for each round, per end-to-end case"""
+    import asyncio
+    from urllib.parse import urlencode
+
+    import httpx
+
+    from benchmarks.replay import dress_request, venue_request
+    from src.api.main import app, lifespan
+    from src.api.readiness import readiness
+    from src.services.dress_recommender import recommender
+    from src.services.query_keys import DRESS_KEYS, VENUE_KEYS
+    from src.services.recommendation_cache import dress_cache
+
+    # 라운드마다 새 키로 생성 경로를 타야 하므로 키 공간 안에서 요청 수 제한
+    requests = min(requests, DRESS_KEYS.size // rounds)
+    recommender._client = _fake_openai_client()
+    results: Dict[str, List[float]] = {}
+
+    async with lifespan(app):
+        for _ in range(100):
+            if readiness.ready:
+                break
+            await asyncio.sleep(0.1)
+        await _seed_venues()
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            async def timed(name: str, calls: list, headers: dict = None, expect: int = 200) -> None:
+                start = time.perf_counter()
+                for method, path, body in calls:
+                    if method == "GET":
+                        response = await client.get(path, headers=headers)
+                    else:
+                        response = await client.post(path, json=body)
+                    if response.status_code != expect:
+                        raise SystemExit(f"{name}: {path} returned {response.status_code} {response.text[:200]}")
+                results.setdefault(name, []).append((time.perf_counter() - start) / len(calls))
+
+            dress_keys = iter(range(DRESS_KEYS.size))
+            venue_keys = iter(range(0, VENUE_KEYS.size, 3))
+            for _ in range(rounds):
+                keys = [next(dress_keys) for _ in range(requests)]
+                calls = [("POST", *dress_request(key)) for key in keys]
+                await timed("e2e.dress_generate", calls)
+                dress_cache.discard(keys)
+                await timed("e2e.dress_db_hit", calls)
+                # 첫 메모리 히트는 사전 압축 본문을 만드므로 한 번 훑은 뒤 측정
+                await timed("warmup", calls)
+                await timed("e2e.dress_memory_hit", calls)
+
+                path, body = dress_request(keys[0])
+                url = f"{path}?{urlencode(body)}"
+                etag = (await client.get(url)).headers["etag"]
+                await timed("e2e.dress_get_304", [("GET", url, None)] * requests, {"If-None-Match": etag}, expect=304)
+
+                venue_calls = [("POST", *venue_request(next(venue_keys))) for _ in range(requests)]
+                await timed("e2e.venue_generate", venue_calls)
+                await timed("warmup", venue_calls)
+                await timed("e2e.venue_memory_hit", venue_calls)
+
+    from src.database import engine
+    await engine.dispose()
+    _BENCH_DB.unlink(missing_ok=True)
+    results.pop("warmup", None)
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Results / baselines
+# ---------------------------------------------------------------------------
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def summarize(samples: Dict[str, List[float]]) -> dict:
+    return {
+        name: {
+            "median_ns": statistics.median(values) * 1e9,
+            "min_ns": min(values) * 1e9,
+            "rounds": len(values)
+        }
+        for name, values in samples.items()
+    }
+
+
+def baseline_path(name_or_path: str) -> Path:
+    """A baseline name (benchmarks/baselines/<name>.json) or an explicit path"""
+    path = Path(name_or_path)
+    if path.suffix == ".json" or path.exists():
+        return path
+    return BASELINE_DIR / f"{name_or_path}.json"
+
+
+def format_ns(ns: float) -> str:
+    if ns >= 1e6:
+        return f"{ns / 1e6:8.2f} ms"
+    if ns >= 1e3:
+        return f"{ns / 1e3:8.2f} us"
+    return f"{ns:8.0f} ns"
+
+
+def run(args) -> dict:
+    def selected(name: str) -> bool:
+        return not args.filter or any(pattern in name for pattern in args.filter)
+
+    def report(name: str, values: List[float]) -> None:
+        samples[name] = values
+        print(f"{name:<45} {format_ns(statistics.median(values) * 1e9)}")
+
+    samples: Dict[str, List[float]] = {}
+    for name, case in micro_cases().items():
+        if selected(name):
+            report(name, time_case(case, args.rounds, args.min_time))
+    if any(selected(name) for name in E2E_CASES):
+        import asyncio
+        for name, values in asyncio.run(run_e2e(args.requests, args.rounds)).items():
+            if selected(name):
+                report(name, values)
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git": git_revision(),
+            "python": platform.python_version(),
+            "machine": platform.node(),
+            "rounds": args.rounds
+        },
+        "results": summarize(samples)
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> bool:
+    """Print per-case change; True when no case regressed beyond threshold"""
+    ok = True
+    print(f"{'case':<45} {'baseline':>11} {'current':>11} {'change':>8}")
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<45} {'-':>11} {format_ns(result['median_ns'])}      new")
+            continue
+        change = result["median_ns"] / base["median_ns"] - 1
+        flag = ""
+        if change > threshold:
+            flag, ok = "  ❌ regression", False
+        elif change < -threshold:
+            flag = "  ✅ faster"
+        print(f"{name:<45} {format_ns(base['median_ns'])} {format_ns(result['median_ns'])} {change:+7.1%}{flag}")
+    skipped = len(baseline["results"].keys() - current["results"].keys())
+    if skipped:
+        print(f"({skipped} baseline cases not run)")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the suite")
+    run_parser.add_argument("--filter", nargs="*", default=[], help="Only cases containing one of these substrings (micro, e2e, ...)")
+    run_parser.add_argument("--rounds", type=int, default=5)
+    run_parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per micro benchmark round")
+    run_parser.add_argument("--requests", type=int, default=200, help="Requests per end-to-end round")
+    run_parser.add_argument("--output", help="Write results JSON to this path")
+    run_parser.add_argument("--save", metavar="NAME", help="Save results as baseline NAME")
+    run_parser.add_argument("--compare", metavar="BASELINE", help="Compare against a baseline name or path")
+    run_parser.add_argument("--threshold", type=float, default=0.15, help="Allowed slowdown (0.15 = 15%%)")
+
+    compare_parser = commands.add_parser("compare", help="Compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.15)
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        baseline = json.loads(baseline_path(args.baseline).read_text())
+        current = json.loads(baseline_path(args.current).read_text())
+        sys.exit(0 if compare(baseline, current, args.threshold) else 1)
+
+    for key, value in BENCH_ENV.items():
+        os.environ.setdefault(key, value)
+    result = run(args)
+    for target in filter(None, [args.output, args.save and str(BASELINE_DIR / f"{args.save}.json")]):
+        Path(target).parent.mkdir(parents=True, exist_ok=True)
+        Path(target).write_text(json.dumps(result, indent=2, ensure_ascii=False))
+        print(f"✅ Results written to {target}")
+    if args.compare:
+        baseline = json.loads(baseline_path(args.compare).read_text())
+        print()
+        if not compare(baseline, result, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
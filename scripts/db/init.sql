@@ -16,7 +16,8 @@ CREATE TABLE IF NOT EXISTS wedding_dresses (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     INDEX idx_style (style),
-    INDEX idx_availability (availability)
+    INDEX idx_availability (availability),
+    INDEX idx_availability_id (availability, id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Table: surveys
@@ -46,7 +47,7 @@ CREATE TABLE IF NOT EXISTS surveys (
     FOREIGN KEY (dress_id) REFERENCES wedding_dresses(id) ON DELETE SET NULL,
     INDEX idx_body_type (arm_length, leg_length, neck_length, face_shape, body_type),
     INDEX idx_dress (dress_id),
-    INDEX idx_created_at (created_at)
+    INDEX idx_created_at_id (created_at, id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Sample data for wedding_dresses
@@ -0,0 +1,11 @@
+-- Keyset pagination indexes
+-- surveys: 최신순 (created_at DESC, id DESC) 커서 페이지네이션
+-- wedding_dresses: available_only 필터 + id 커서 페이지네이션
+-- idx_created_at(created_at)은 idx_created_at_id의 접두사이므로 제거
+
+ALTER TABLE surveys
+    ADD INDEX idx_created_at_id (created_at, id),
+    DROP INDEX idx_created_at;
+
+ALTER TABLE wedding_dresses
+    ADD INDEX idx_availability_id (availability, id);
@@ -0,0 +1,71 @@
+-- Dense integer query keys (replaces SHA-256 query_hash)
+-- query_key = 파라미터 조합의 혼합 기수 인코딩 (src/services/query_keys.py의 DRESS_KEYS / VENUE_KEYS와 같은 순서)
+-- 기존 해시에는 num_recommendations가 포함되어 있으므로 1-5를 대입해 같은 해시가 나오는 값으로 복원
+-- 키 공간 밖의 값(예: 예전 'normal')으로 만들어진 행은 API로 조회될 수 없으므로 삭제
+
+-- ----------------------------------------------------------------------------
+-- recommendation_queries: (arm, leg, neck, face, body, num) → 0..1619
+-- ----------------------------------------------------------------------------
+ALTER TABLE recommendation_queries ADD COLUMN query_key SMALLINT NULL AFTER id;
+
+UPDATE recommendation_queries q
+JOIN (SELECT 1 AS n UNION ALL SELECT 2 UNION ALL SELECT 3 UNION ALL SELECT 4 UNION ALL SELECT 5) nums
+    ON q.query_hash = SHA2(CONCAT_WS('_', q.arm_length, q.leg_length, q.neck_length, q.face_shape, q.body_type, nums.n), 256)
+SET q.query_key = (((((
+      FIELD(q.arm_length, 'short', 'medium', 'long') - 1) * 3
+    + FIELD(q.leg_length, 'short', 'medium', 'long') - 1) * 3
+    + FIELD(q.neck_length, 'short', 'medium', 'long') - 1) * 4
+    + FIELD(q.face_shape, 'oval', 'wide', 'angular', 'long') - 1) * 3
+    + FIELD(q.body_type, 'thin', 'medium', 'heavy') - 1) * 5
+    + nums.n - 1
+WHERE FIELD(q.arm_length, 'short', 'medium', 'long') > 0
+  AND FIELD(q.leg_length, 'short', 'medium', 'long') > 0
+  AND FIELD(q.neck_length, 'short', 'medium', 'long') > 0
+  AND FIELD(q.face_shape, 'oval', 'wide', 'angular', 'long') > 0
+  AND FIELD(q.body_type, 'thin', 'medium', 'heavy') > 0;
+
+-- event_logs: 해시 FK 대신 query_key 기록
+ALTER TABLE event_logs ADD COLUMN query_key SMALLINT NULL AFTER event_type, ADD INDEX idx_query_key (query_key);
+
+UPDATE event_logs e
+JOIN recommendation_queries q ON e.query_hash = q.query_hash
+SET e.query_key = q.query_key;
+
+DELETE FROM recommendation_queries WHERE query_key IS NULL;
+
+-- scripts/init.sql로 만든 FK (이름은 MySQL 자동 생성값)
+ALTER TABLE event_logs DROP FOREIGN KEY event_logs_ibfk_1;
+ALTER TABLE event_logs DROP INDEX idx_query_hash, DROP COLUMN query_hash;
+
+ALTER TABLE recommendation_queries
+    MODIFY query_key SMALLINT NOT NULL,
+    ADD UNIQUE INDEX uq_query_key (query_key),
+    DROP COLUMN query_hash;
+
+-- ----------------------------------------------------------------------------
+-- venue_queries: (guest_count, budget, region, style, season, num) → 0..5039
+-- ----------------------------------------------------------------------------
+ALTER TABLE venue_queries ADD COLUMN query_key SMALLINT NULL AFTER id;
+
+UPDATE venue_queries q
+JOIN (SELECT 1 AS n UNION ALL SELECT 2 UNION ALL SELECT 3 UNION ALL SELECT 4 UNION ALL SELECT 5) nums
+    ON q.query_hash = SHA2(CONCAT_WS('_', q.guest_count, q.budget, q.region, q.style_preference, q.season, nums.n), 256)
+SET q.query_key = (((((
+      FIELD(q.guest_count, '소규모', '중규모', '대규모') - 1) * 3
+    + FIELD(q.budget, '저', '중', '고') - 1) * 4
+    + FIELD(q.region, '서울', '경기', '인천', '상관없음') - 1) * 7
+    + FIELD(q.style_preference, '럭셔리', '모던', '클래식', '자연친화', '야외정원', '미니멀', '유니크') - 1) * 4
+    + FIELD(q.season, '봄', '여름', '가을', '겨울') - 1) * 5
+    + nums.n - 1
+WHERE FIELD(q.guest_count, '소규모', '중규모', '대규모') > 0
+  AND FIELD(q.budget, '저', '중', '고') > 0
+  AND FIELD(q.region, '서울', '경기', '인천', '상관없음') > 0
+  AND FIELD(q.style_preference, '럭셔리', '모던', '클래식', '자연친화', '야외정원', '미니멀', '유니크') > 0
+  AND FIELD(q.season, '봄', '여름', '가을', '겨울') > 0;
+
+DELETE FROM venue_queries WHERE query_key IS NULL;
+
+ALTER TABLE venue_queries
+    MODIFY query_key SMALLINT NOT NULL,
+    ADD UNIQUE INDEX uq_query_key (query_key),
+    DROP COLUMN query_hash;
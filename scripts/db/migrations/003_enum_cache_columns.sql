@@ -0,0 +1,21 @@
+-- Dictionary-encoded parameter columns in cache tables
+-- VARCHAR(20)(한글은 글자당 3-4바이트) → ENUM(행당 1바이트 코드)
+-- idx_query_params / idx_venue_params도 함께 재구성되어 크기가 줄어듦
+-- 002 마이그레이션 이후 키 공간 밖의 값은 없으므로 그대로 변환됨 (strict 모드에서 잘못된 값은 오류)
+-- 측정: python -m benchmarks.cache_tables (적용 전/후 인덱스 크기와 get_stats 시간)
+
+ALTER TABLE recommendation_queries
+    MODIFY arm_length ENUM('short', 'medium', 'long') NOT NULL,
+    MODIFY leg_length ENUM('short', 'medium', 'long') NOT NULL,
+    MODIFY neck_length ENUM('short', 'medium', 'long') NOT NULL,
+    MODIFY face_shape ENUM('oval', 'wide', 'angular', 'long') NOT NULL,
+    MODIFY body_type ENUM('thin', 'medium', 'heavy') NOT NULL;
+
+ALTER TABLE venue_queries
+    MODIFY guest_count ENUM('소규모', '중규모', '대규모') NOT NULL,
+    MODIFY budget ENUM('저', '중', '고') NOT NULL,
+    MODIFY region ENUM('서울', '경기', '인천', '상관없음') NOT NULL,
+    MODIFY style_preference ENUM('럭셔리', '모던', '클래식', '자연친화', '야외정원', '미니멀', '유니크') NOT NULL,
+    MODIFY season ENUM('봄', '여름', '가을', '겨울') NOT NULL;
+
+ANALYZE TABLE recommendation_queries, venue_queries;
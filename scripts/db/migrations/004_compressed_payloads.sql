@@ -0,0 +1,9 @@
+-- Compressed recommendation payloads
+-- JSON → MEDIUMBLOB: 기존 행은 JSON 텍스트 그대로 남고 헤더가 없으므로 그대로 읽힘
+-- 압축은 RECOMMENDATION_CODEC 설정 후 새로 쓰는 행부터 적용, 기존 행은 아래 명령으로 일괄 재압축
+--   python -m src.database.codec_tools train --output /data/codec/recommendations.dict
+--   RECOMMENDATION_CODEC=zstd RECOMMENDATION_CODEC_DICTS=/data/codec/recommendations.dict python -m src.database.codec_tools recompress
+-- 사전 파일은 모든 API 서버에 배포되어 있어야 하며, 교체 시 이전 사전도 RECOMMENDATION_CODEC_DICTS 뒤쪽에 유지
+
+ALTER TABLE recommendation_queries MODIFY recommendation MEDIUMBLOB NOT NULL;
+ALTER TABLE venue_queries MODIFY recommendation MEDIUMBLOB NOT NULL;
@@ -9,17 +9,18 @@ USE wedding_dress_db;
 -- Recommendation queries table
 CREATE TABLE IF NOT EXISTS recommendation_queries (
     id INT AUTO_INCREMENT PRIMARY KEY,
-    query_hash VARCHAR(64) UNIQUE NOT NULL,
+    -- (arm, leg, neck, face, body, num) 조합 번호 (src/services/query_keys.py DRESS_KEYS)
+    query_key SMALLINT NOT NULL,
 
     -- Input parameters
-    arm_length VARCHAR(20) NOT NULL,
-    leg_length VARCHAR(20) NOT NULL,
-    neck_length VARCHAR(20) NOT NULL,
-    face_shape VARCHAR(20) NOT NULL,
-    body_type VARCHAR(20) NOT NULL,
+    arm_length ENUM('short', 'medium', 'long') NOT NULL,
+    leg_length ENUM('short', 'medium', 'long') NOT NULL,
+    neck_length ENUM('short', 'medium', 'long') NOT NULL,
+    face_shape ENUM('oval', 'wide', 'angular', 'long') NOT NULL,
+    body_type ENUM('thin', 'medium', 'heavy') NOT NULL,
 
-    -- Result (JSON)
-    recommendation JSON NOT NULL,
+    -- Result (JSON, RECOMMENDATION_CODEC 사용 시 헤더 + 압축 본문)
+    recommendation MEDIUMBLOB NOT NULL,
 
     -- Metadata
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -27,7 +28,7 @@ CREATE TABLE IF NOT EXISTS recommendation_queries (
     last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
 
     -- Indexes
-    INDEX idx_query_hash (query_hash),
+    UNIQUE INDEX uq_query_key (query_key),
     INDEX idx_created_at (created_at),
     INDEX idx_query_params (arm_length, leg_length, neck_length, face_shape, body_type),
     INDEX idx_access_count (access_count)
@@ -37,14 +38,12 @@ CREATE TABLE IF NOT EXISTS recommendation_queries (
 CREATE TABLE IF NOT EXISTS event_logs (
     id BIGINT AUTO_INCREMENT PRIMARY KEY,
     event_type VARCHAR(50) NOT NULL,
-    query_hash VARCHAR(64),
+    query_key SMALLINT,
     user_id VARCHAR(100),
     metadata JSON,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
     INDEX idx_event_type (event_type),
     INDEX idx_created_at (created_at),
-    INDEX idx_query_hash (query_hash),
-    FOREIGN KEY (query_hash) REFERENCES recommendation_queries(query_hash)
-        ON DELETE SET NULL
+    INDEX idx_query_key (query_key)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -0,0 +1,150 @@
+"""
+Response compression (gzip / brotli)
+
+Accept-Encoding is negotiated once per distinct header value. Memory-cache
+hits are served from bodies compressed once per cache entry (see
+RecommendationCache.body) at the highest level, so a hit costs no
+compression CPU. CompressionMiddleware compresses the other JSON responses
+on the fly at a cheaper level, skipping bodies under COMPRESSION_MIN_SIZE.
+Responses that already carry Content-Encoding are passed through untouched.
+"""
+import gzip
+from functools import lru_cache
+from typing import Callable, Optional
+
+from fastapi import Response
+from pydantic import BaseModel
+from starlette.datastructures import MutableHeaders
+
+from src.config import settings
+from src.services.metrics import Counter, current_request_scope
+
+try:
+    import brotli
+except ImportError:  # brotli는 선택 의존성 (requirements.txt 참고), 없으면 gzip만 사용
+    brotli = None
+
+RESPONSE_COMPRESSION = Counter(
+    "http_response_compression_total",
+    "Compressible responses by encoding and mode (precompressed, compressed, too_small)",
+    labelnames=("encoding", "mode")
+)
+
+# 캐시 항목별로 한 번만 압축하므로 최고 레벨 사용
+PRECOMPRESS_LEVELS = {"gzip": 9, "br": 11}
+COMPRESSIBLE_TYPES = (b"application/json", b"text/")
+
+
+@lru_cache(maxsize=256)
+def negotiate(accept_encoding: str) -> Optional[str]:
+    """Preferred supported encoding for an Accept-Encoding value (br > gzip), None for identity"""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    wildcard = accepted.get("*", 0.0)
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def accepted_encoding(scope: Optional[dict]) -> Optional[str]:
+    if scope is None or not settings.compression_enabled:
+        return None
+    for name, value in scope["headers"]:
+        if name == b"accept-encoding":
+            return negotiate(value.decode("latin-1"))
+    return None
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def cached_response(cache, key: int, build: Callable[[], BaseModel]):
+    """
+    Response for a memory-cache hit
+
+    Returns the entry's precompressed body when the client accepts gzip/br
+    (compressing and storing it on the first hit), otherwise the model itself
+    so FastAPI serializes it as usual.
+    """
+    encoding = accepted_encoding(current_request_scope.get())
+    if encoding is None:
+        return build()
+    body = cache.body(key, encoding)
+    if body is None:
+        raw = build().model_dump_json().encode()
+        if len(raw) < settings.compression_min_size:
+            RESPONSE_COMPRESSION.inc(encoding="identity", mode="too_small")
+            return Response(raw, media_type="application/json", headers={"Vary": "Accept-Encoding"})
+        body = compress(raw, encoding, PRECOMPRESS_LEVELS[encoding])
+        cache.put_body(key, encoding, body)
+    RESPONSE_COMPRESSION.inc(encoding=encoding, mode="precompressed")
+    return Response(
+        body,
+        media_type="application/json",
+        headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"}
+    )
+
+
+class CompressionMiddleware:
+    """Compress JSON/text responses on the fly (buffers the body of compressible responses)"""
+
+    def __init__(self, app, minimum_size: int = 512, gzip_level: int = 6, brotli_quality: int = 5):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {"gzip": gzip_level, "br": brotli_quality}
+
+    async def __call__(self, scope, receive, send):
+        encoding = accepted_encoding(scope) if scope["type"] == "http" else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        chunks = []
+
+        async def send_compressed(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                content_type = headers.get("content-type", "").encode()
+                if "content-encoding" in headers or not content_type.startswith(COMPRESSIBLE_TYPES):
+                    await send(message)
+                    return
+                start_message = message
+                return
+            if start_message is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if len(body) < self.minimum_size:
+                RESPONSE_COMPRESSION.inc(encoding="identity", mode="too_small")
+            else:
+                body = compress(body, encoding, self.levels[encoding])
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                RESPONSE_COMPRESSION.inc(encoding=encoding, mode="compressed")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,177 @@
+"""
+Background dependency health checks
+
+Health endpoints used to check MySQL/Redis on every probe, so aggressive
+orchestrator probes across replicas became a steady stream of pool checkouts.
+The prober runs each registered check on an interval, with a timeout, and
+keeps the last result (status, latency, timestamps). Endpoints only read that
+state.
+
+Critical checks gate readiness. Non-critical ones (Redis, OpenAI, image storage) are
+reported but the app degrades around them. If no probe round completes for
+HEALTH_PROBE_STALE_AFTER seconds (stuck event loop, crashed loop), liveness
+fails.
+"""
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Optional
+
+from src.config import settings
+from src.services.metrics import Gauge
+
+HEALTH_CHECK_UP = Gauge("health_check_up", "Last background health check result (1 ok, 0 failed)", labelnames=("check",))
+HEALTH_CHECK_LATENCY = Gauge("health_check_latency_seconds", "Last background health check latency", labelnames=("check",))
+
+Check = Callable[[], Awaitable[None]]
+
+
+def _utc_iso(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat(timespec="seconds")
+
+
+class CheckState:
+    """Last known result of one check"""
+
+    def __init__(self, critical: bool):
+        self.critical = critical
+        self.ok: Optional[bool] = None
+        self.latency: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self.last_ok_at: Optional[float] = None
+        self.error: Optional[str] = None
+
+    def status(self) -> dict:
+        return {
+            "status": "unknown" if self.ok is None else ("ok" if self.ok else "failed"),
+            "critical": self.critical,
+            "latency_ms": round(self.latency * 1000, 2) if self.latency is not None else None,
+            "checked_at": _utc_iso(self.checked_at),
+            "last_ok_at": _utc_iso(self.last_ok_at),
+            "error": self.error
+        }
+
+
+class HealthProber:
+    """Runs registered dependency checks in the background and caches the results"""
+
+    def __init__(self, interval: float = 10.0, timeout: float = 2.0, stale_after: float = 60.0):
+        self.interval = interval
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self._checks: Dict[str, Check] = {}
+        self._states: Dict[str, CheckState] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.last_round_at: Optional[float] = None
+
+    def register(self, name: str, check: Check, critical: bool = True) -> None:
+        self._checks[name] = check
+        self._states[name] = CheckState(critical)
+
+    def clear(self) -> None:
+        self._checks.clear()
+        self._states.clear()
+        self.last_round_at = None
+
+    async def _run(self, name: str, check: Check) -> None:
+        state = self._states[name]
+        started_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(check(), self.timeout)
+            state.ok, state.error = True, None
+        except asyncio.TimeoutError:
+            state.ok, state.error = False, f"timed out after {self.timeout}s"
+        except Exception as e:
+            state.ok, state.error = False, str(e) or type(e).__name__
+        state.latency = time.perf_counter() - started_at
+        state.checked_at = time.time()
+        if state.ok:
+            state.last_ok_at = state.checked_at
+        HEALTH_CHECK_UP.set(1 if state.ok else 0, check=name)
+        HEALTH_CHECK_LATENCY.set(state.latency, check=name)
+
+    async def probe(self) -> None:
+        """Run every check once, concurrently"""
+        await asyncio.gather(*[self._run(name, check) for name, check in self._checks.items()])
+        self.last_round_at = time.monotonic()
+
+    async def _loop(self) -> None:
+        while True:
+            await self.probe()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def alive(self) -> bool:
+        """The probe loop is running and has completed a round recently"""
+        if self._task is None or self._task.done():
+            return False
+        # 첫 라운드 전에는 시작 직후이므로 살아 있는 것으로 봄
+        return self.last_round_at is None or time.monotonic() - self.last_round_at < self.stale_after
+
+    @property
+    def healthy(self) -> bool:
+        """Every critical check passed on its last run"""
+        return all(state.ok for state in self._states.values() if state.critical)
+
+    def checks(self, names: Optional[set] = None) -> dict:
+        return {
+            name: state.status()
+            for name, state in self._states.items()
+            if names is None or name in names
+        }
+
+
+# 각 검사는 실패 시 예외를 던짐 (역할별 모듈은 검사 시점에 import)
+async def check_mysql() -> None:
+    from sqlalchemy import text
+    from src.database import engine
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def check_redis() -> None:
+    from src.config.redis import redis_client
+    if not redis_client.enabled:
+        return
+    if not await redis_client.ping():
+        raise RuntimeError(f"Redis unavailable: {redis_client.last_error}")
+
+
+async def check_openai() -> None:
+    # 호출 비용 때문에 실제 요청은 보내지 않음 - 클라이언트 준비 여부와 마지막 호출 결과로 판단
+    from src.services.dress_recommender import recommender
+    if not recommender.initialized:
+        raise RuntimeError("OpenAI client not initialized yet")
+    if recommender.last_outcome == "error":
+        raise RuntimeError("Last chat completion failed")
+
+
+async def check_image_storage() -> None:
+    path = settings.image_base_path
+    # 네트워크 스토리지에서 stat이 멈출 수 있어 스레드에서 실행
+    readable = await asyncio.to_thread(lambda: os.path.isdir(path) and os.access(path, os.R_OK))
+    if not readable:
+        raise RuntimeError(f"Image storage not readable: {path}")
+
+
+# Global health prober instance
+health_prober = HealthProber(
+    settings.health_probe_interval,
+    settings.health_probe_timeout,
+    settings.health_probe_stale_after
+)
@@ -0,0 +1,93 @@
+"""
+HTTP caching for the GET recommendation endpoints
+
+A recommendation is deterministic for its input tuple and catalog, so the
+ETag is derived from the dense query key plus a catalog version. It can be
+checked against If-None-Match before any cache lookup, and a match returns
+304 without touching Redis or MySQL. Query strings are redirected (301) to one
+canonical order with every parameter present, so edge caches keep a single
+entry per tuple.
+
+The ETag is weak because "source" / "cached" in the body depend on the tier
+that served it. Degraded answers are never cacheable.
+"""
+import hashlib
+import json
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from fastapi.responses import RedirectResponse
+from pydantic import BaseModel
+
+from src.config import settings
+from src.services.metrics import annotate_request
+
+
+@lru_cache(maxsize=None)
+def catalog_version(kind: str) -> str:
+    """Short digest of what a recommendation depends on besides its inputs"""
+    parts = [kind, settings.recommendation_catalog_version]
+    if kind == "dress":
+        # 스타일 카탈로그와 모델이 바뀌면 같은 입력이라도 결과가 달라짐
+        from src.services.dress_data import WEDDING_DRESS_STYLES
+        from src.services.dress_recommender import OPENAI_MODEL
+        parts += [json.dumps(WEDDING_DRESS_STYLES, ensure_ascii=False, sort_keys=True), OPENAI_MODEL]
+    return hashlib.sha1("\0".join(parts).encode()).hexdigest()[:12]
+
+
+def recommendation_etag(kind: str, key: int) -> str:
+    return f'W/"{kind}-{key:x}-{catalog_version(kind)}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison against an If-None-Match header value"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def canonical_query(params: BaseModel) -> str:
+    """Every field in schema order (enum values), URL-encoded"""
+    return urlencode([(name, getattr(value, "value", value)) for name, value in params])
+
+
+def canonical_redirect(request: Request, params: BaseModel) -> Optional[RedirectResponse]:
+    """301 to the canonical query string when the request uses another order / omits defaults"""
+    canonical = canonical_query(params)
+    if request.url.query == canonical:
+        return None
+    response = RedirectResponse(f"{request.url.path}?{canonical}", status_code=301)
+    response.headers["Cache-Control"] = f"public, max-age={settings.http_cache_max_age}"
+    return response
+
+
+def cache_control() -> str:
+    return (
+        f"public, max-age={settings.http_cache_max_age}, "
+        f"stale-while-revalidate={settings.http_cache_stale_while_revalidate}"
+    )
+
+
+def not_modified(etag: str) -> Response:
+    annotate_request(source="not_modified")
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control()})
+
+
+def with_validators(result, response: Response, etag: str):
+    """Attach ETag / Cache-Control to a route result (model or prebuilt Response)"""
+    if isinstance(result, Response):
+        headers = result.headers
+    else:
+        headers = response.headers
+        if result.source == "degraded":
+            # 과부하 시 대체 추천은 정상 결과가 아니므로 캐시 금지
+            headers["Cache-Control"] = "no-store"
+            return result
+    headers["ETag"] = etag
+    headers["Cache-Control"] = cache_control()
+    return result
@@ -1,53 +1,218 @@
 """
 FastAPI Gateway
+
+APP_ROLES selects the routers and background components this instance runs
+(dress, venue, images); modules for other roles are never imported. Startup
+only does what requests strictly need, then pools, Redis, memory caches and
+the OpenAI client are warmed in the background and /health/ready flips.
 """
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
 
-from src.database import init_db
 from src.config import settings
-from src.api.routes import dress_recommend, health, images, venue_recommend
+from src.api.compression import CompressionMiddleware
+from src.api.middleware import RequestContextMiddleware
+from src.api.health_prober import (
+    check_image_storage, check_mysql, check_openai, check_redis, health_prober
+)
+from src.api.readiness import readiness
+from src.api.routes import health, metrics
+
+ROLES = settings.roles
+RECOMMENDATION_ROLES = ROLES & {"dress", "venue"}
+# images 전용 인스턴스는 DB/Redis를 사용하지 않음
+USES_DATABASE = bool(RECOMMENDATION_ROLES) or settings.debug_endpoints_enabled or settings.admin_endpoints_enabled
+
+if "dress" in ROLES and not settings.openai_api_key:
+    raise RuntimeError("APP_ROLES includes dress but OPENAI_API_KEY is not set")
+
+
+def _memory_caches() -> list:
+    from src.services.recommendation_cache import dress_cache, venue_cache
+    return [cache for role, cache in (("dress", dress_cache), ("venue", venue_cache)) if role in ROLES]
+
+
+def _register_health_checks() -> None:
+    """Background checks for the dependencies of this instance's roles"""
+    health_prober.clear()
+    if USES_DATABASE:
+        health_prober.register("mysql", check_mysql)
+    if RECOMMENDATION_ROLES:
+        # Redis/OpenAI 장애 시에도 MySQL/캐시로 응답하므로 준비 상태에는 반영하지 않음
+        health_prober.register("redis", check_redis, critical=False)
+    if "dress" in ROLES:
+        health_prober.register("openai", check_openai, critical=False)
+    if "images" in ROLES:
+        # 이미지 저장소 장애는 이미지 요청만 404로 실패하고 추천 등 나머지 기능은 정상이므로 표시만 함
+        health_prober.register("image_storage", check_image_storage, critical=False)
+
+
+async def _timed(step: str, awaitable) -> None:
+    start = time.perf_counter()
+    await awaitable
+    readiness.record(step, time.perf_counter() - start)
+
+
+async def warm_up() -> None:
+    """Warm pools, Redis and caches after startup, then mark the instance ready"""
+    try:
+        if USES_DATABASE:
+            from src.database import engine, replica_engines, replica_router
+            from src.database.pool import warm_up_pool
+            if settings.db_pool_warmup > 0:
+                for pool_engine in [engine, *replica_engines]:
+                    await _timed(
+                        f"pool:{pool_engine.pool.metrics_label}",
+                        warm_up_pool(pool_engine, settings.db_pool_warmup)
+                    )
+            await _timed("replicas", replica_router.start(settings.db_replica_check_interval))
+
+        if RECOMMENDATION_ROLES:
+            from src.config.redis import redis_client
+            from src.services.cache_coordination import cache_coordinator
+            await _timed("redis", redis_client.connect())
+            if settings.redis_warm_memory_cache:
+                for memory_cache in _memory_caches():
+                    await _timed(f"memory_cache:{memory_cache.name}", memory_cache.warm_from_redis(redis_client))
+            cache_coordinator.start()
+
+        if "dress" in ROLES:
+            from src.services.dress_recommender import recommender
+            # openai import는 수백 ms가 걸려 이벤트 루프 밖에서 처리
+            await _timed("openai", asyncio.to_thread(lambda: recommender.client))
+
+        readiness.mark_ready()
+        print(f"✅ Ready after {readiness.ready_after}s {readiness.steps}")
+    except Exception as e:
+        readiness.mark_failed(e)
+        print(f"⚠️ Warm-up failed, instance stays not ready: {e}")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
-    await init_db()
-    # Redis disabled
-    # await redis_client.connect()
-    print("✅ API Gateway started")
+    readiness.reset()
+    if USES_DATABASE:
+        from src.database import init_db
+        from src.database.maintenance import retention_scheduler
+        if settings.db_create_tables_on_startup:
+            await _timed("create_all", init_db())
+        if settings.cache_retention_enabled:
+            retention_scheduler.start()
+    if RECOMMENDATION_ROLES:
+        from src.services.events import event_pipeline
+        if settings.events_enabled:
+            event_pipeline.start()
+        for memory_cache in _memory_caches():
+            memory_cache.start()
+    if "dress" in ROLES:
+        from src.database.aggregates import aggregate_reconciler
+        aggregate_reconciler.start()
+    if settings.metrics_enabled:
+        from src.services.metrics_multiprocess import multiprocess_metrics
+        multiprocess_metrics.start()
+    _register_health_checks()
+    health_prober.start()
+    warm_up_task = asyncio.create_task(warm_up())
+    print(f"✅ API Gateway started (roles: {', '.join(sorted(ROLES))})")
 
     yield
 
     # Shutdown
-    # Redis disabled
-    # await redis_client.disconnect()
+    readiness.mark_draining()
+    warm_up_task.cancel()
+    await asyncio.gather(warm_up_task, return_exceptions=True)
+    await health_prober.stop()
+    if settings.metrics_enabled:
+        await multiprocess_metrics.stop()
+    if "dress" in ROLES:
+        await aggregate_reconciler.stop()
+    if RECOMMENDATION_ROLES:
+        from src.config.redis import redis_client
+        from src.services.cache_coordination import cache_coordinator
+        await cache_coordinator.stop()
+        for memory_cache in reversed(_memory_caches()):
+            await memory_cache.stop()
+        await event_pipeline.stop()
+        await redis_client.disconnect()
+    if USES_DATABASE:
+        from src.database import replica_router
+        await retention_scheduler.stop()
+        await replica_router.stop()
     print("👋 API Gateway shutdown")
 
 
-# FastAPI app
-app = FastAPI(
-    title="Wedding Recommendation API",
-    description="AI-powered wedding dress and venue recommendation service",
-    version="4.0.0",
-    lifespan=lifespan
-)
+def create_app() -> FastAPI:
+    """Build the app with the routers for APP_ROLES"""
+    app = FastAPI(
+        title="Wedding Recommendation API",
+        description="AI-powered wedding dress and venue recommendation service",
+        version="4.0.0",
+        lifespan=lifespan
+    )
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    # CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_min_size,
+            gzip_level=settings.compression_gzip_level,
+            brotli_quality=settings.compression_brotli_quality
+        )
+    if settings.profiling_enabled:
+        from src.api.profiling import Profiler, ProfilingMiddleware, profile_store
+        if Profiler is None:
+            print("⚠️ PROFILING_ENABLED but pyinstrument is not installed, profiling disabled")
+        else:
+            app.add_middleware(
+                ProfilingMiddleware,
+                store=profile_store,
+                secret=settings.profiling_secret,
+                sample_rate=settings.profiling_sample_rate,
+                interval=settings.profiling_interval,
+                max_concurrent=settings.profiling_max_concurrent
+            )
+    # 가장 바깥 계층 (지표의 지연 시간에 압축 포함)
+    app.add_middleware(RequestContextMiddleware, record_metrics=settings.metrics_enabled)
 
-# Include routers
-app.include_router(dress_recommend.router)
-app.include_router(venue_recommend.router)
-app.include_router(health.router)
-app.include_router(images.router)
+    # Include routers
+    app.include_router(health.router)
+    if settings.metrics_enabled:
+        app.include_router(metrics.router)
+    if "dress" in ROLES:
+        from src.api.routes import dress_recommend, stats
+        app.include_router(dress_recommend.router)
+        app.include_router(stats.router)
+    if "venue" in ROLES:
+        from src.api.routes import venue_recommend
+        app.include_router(venue_recommend.router)
+    if "images" in ROLES:
+        from src.api.routes import images
+        app.include_router(images.router)
+    if settings.debug_endpoints_enabled:
+        from src.api.routes import debug
+        app.include_router(debug.router)
+    if settings.admin_endpoints_enabled:
+        from src.api.routes import cache, imports
+        app.include_router(imports.router)
+        app.include_router(cache.router)
+    return app
+
+
+# FastAPI app
+app = create_app()
 
 
 if __name__ == "__main__":
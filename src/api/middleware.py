@@ -0,0 +1,71 @@
+"""ASGI middleware"""
+import time
+
+from src.services.metrics import Counter, Gauge, Histogram, current_request_scope
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template, status and response source",
+    labelnames=("method", "route", "status", "source")
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests currently being handled")
+HTTP_METRICS_OVERHEAD = Counter(
+    "http_metrics_overhead_seconds_total",
+    "Time spent recording HTTP request metrics (divide by request count for per-request cost)"
+)
+
+
+class RequestContextMiddleware:
+    """
+    Expose the current request scope to lower layers (route attribution for metrics)
+
+    With record_metrics, also records latency by route template / status /
+    response source and the in-flight count. Both jobs share one middleware
+    layer because each extra ASGI layer costs more than the metrics themselves.
+    """
+
+    def __init__(self, app, record_metrics: bool = False):
+        self.app = app
+        self.record_metrics = record_metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = current_request_scope.set(scope)
+        if not self.record_metrics:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                current_request_scope.reset(token)
+            return
+
+        start = time.perf_counter()
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        overhead = time.perf_counter() - start
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            current_request_scope.reset(token)
+            end = time.perf_counter()
+            # 매칭되지 않은 경로(404 스캔 등)는 실제 path 대신 하나로 묶어 라벨 수를 제한
+            route = scope.get("route")
+            labels = scope.get("metrics_labels")
+            HTTP_REQUEST_DURATION.observe(
+                end - start,
+                method=scope["method"],
+                route=route.path if route is not None else "unmatched",
+                status=status,
+                source=labels.get("source", "-") if labels else "-"
+            )
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            HTTP_METRICS_OVERHEAD.inc(overhead + time.perf_counter() - end)
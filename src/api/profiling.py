@@ -0,0 +1,235 @@
+"""
+On-demand request profiling (speedscope output)
+
+A slow request in production used to be a black box: Pydantic, SQLAlchemy,
+JSON encoding or awaiting OpenAI. With PROFILING_ENABLED, ProfilingMiddleware
+runs pyinstrument's statistical profiler around a single request when either
+- the request carries a valid X-Profile-Token (HMAC of expiry, method and
+  path with PROFILING_SECRET, see `sign_token` / `python -m src.api.profiling`), or
+- it is picked by PROFILING_SAMPLE_RATE.
+
+The profiler is bound to the request's async context, so time spent awaiting
+I/O shows up as await frames and concurrent requests are not mixed in.
+Profiles are written as speedscope JSON (open in https://www.speedscope.app)
+to PROFILING_DIR, pruned to PROFILING_MAX_FILES / PROFILING_MAX_MB, and
+served by /debug/profiles. The response carries X-Profile-Id.
+
+When disabled the middleware is not installed at all, so there is no
+per-request cost.
+"""
+import asyncio
+import hashlib
+import hmac
+import json
+import random
+import re
+import secrets
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+from src.config import settings
+from src.services.metrics import Counter
+
+try:
+    from pyinstrument import Profiler
+    from pyinstrument.renderers import SpeedscopeRenderer
+except ImportError:  # pyinstrument는 선택 의존성 (requirements.txt 참고), 없으면 프로파일링 비활성
+    Profiler = None
+
+PROFILES_CAPTURED = Counter(
+    "request_profiles_total",
+    "Request profiles by trigger (signed, sampled) and result (saved, busy, failed)",
+    labelnames=("trigger", "result")
+)
+
+PROFILE_TOKEN_HEADER = b"x-profile-token"
+PROFILE_ID_PATTERN = re.compile(r"^\d{8}T\d{6}-[0-9a-f]{8}$")
+# 샘플링 대상에서 제외 (프로브/수집 요청이 예산을 다 쓰지 않도록)
+UNSAMPLED_PREFIXES = ("/health", "/metrics", "/debug")
+
+
+def _signature(secret: str, expires: int, method: str, path: str) -> str:
+    message = f"{expires}:{method.upper()}:{path}".encode()
+    return hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+
+
+def sign_token(method: str, path: str, ttl: int = 300, secret: Optional[str] = None) -> str:
+    """X-Profile-Token value for one method + path, valid for ttl seconds"""
+    secret = secret or settings.profiling_secret
+    if not secret:
+        raise ValueError("PROFILING_SECRET is not set")
+    expires = int(time.time()) + ttl
+    return f"{expires}.{_signature(secret, expires, method, path)}"
+
+
+def verify_token(token: str, method: str, path: str, secret: str) -> bool:
+    expires, _, signature = token.partition(".")
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    return hmac.compare_digest(signature, _signature(secret, int(expires), method, path))
+
+
+class ProfileStore:
+    """Speedscope profiles plus a small metadata sidecar each, bounded by count and size"""
+
+    def __init__(self, directory: str, max_files: int = 100, max_bytes: int = 200 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+
+    def _profile_path(self, profile_id: str) -> Path:
+        return self.directory / f"{profile_id}.speedscope.json"
+
+    def _meta_path(self, profile_id: str) -> Path:
+        return self.directory / f"{profile_id}.meta.json"
+
+    def save(self, profile_id: str, profile: str, meta: dict) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # 임시 파일에 쓴 뒤 rename해 목록 조회 시 쓰다 만 파일이 보이지 않도록 함
+        for path, content in ((self._profile_path(profile_id), profile), (self._meta_path(profile_id), json.dumps(meta))):
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(content)
+            tmp.replace(path)
+        self.prune()
+
+    def _entries(self) -> List[tuple]:
+        entries = []
+        for path in self.directory.glob("*.speedscope.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # 다른 워커가 방금 정리함
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path.name.removesuffix(".speedscope.json")))
+        return sorted(entries, reverse=True)
+
+    def prune(self) -> None:
+        """Delete the oldest profiles beyond max_files / max_bytes"""
+        total = 0
+        for index, (_, size, profile_id) in enumerate(self._entries()):
+            total += size
+            if index >= self.max_files or total > self.max_bytes:
+                self._profile_path(profile_id).unlink(missing_ok=True)
+                self._meta_path(profile_id).unlink(missing_ok=True)
+
+    def list(self) -> List[dict]:
+        """Metadata of stored profiles, newest first"""
+        if not self.directory.is_dir():
+            return []
+        profiles = []
+        for _, size, profile_id in self._entries():
+            try:
+                meta = json.loads(self._meta_path(profile_id).read_text())
+            except (FileNotFoundError, ValueError):
+                meta = {}
+            profiles.append({"id": profile_id, "size_bytes": size, **meta})
+        return profiles
+
+    def path(self, profile_id: str) -> Optional[Path]:
+        """Profile file for an id (None for unknown or malformed ids)"""
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        path = self._profile_path(profile_id)
+        return path if path.is_file() else None
+
+
+class ProfilingMiddleware:
+    """Profile single requests picked by a signed header or by sampling"""
+
+    def __init__(
+        self,
+        app,
+        store: ProfileStore,
+        secret: Optional[str] = None,
+        sample_rate: float = 0.0,
+        interval: float = 0.001,
+        max_concurrent: int = 1
+    ):
+        self.app = app
+        self.store = store
+        self.secret = secret
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.max_concurrent = max_concurrent
+        self.active = 0
+
+    def _trigger(self, scope) -> Optional[str]:
+        if self.secret:
+            for name, value in scope["headers"]:
+                if name == PROFILE_TOKEN_HEADER:
+                    valid = verify_token(value.decode("latin-1"), scope["method"], scope["path"], self.secret)
+                    return "signed" if valid else None
+        if self.sample_rate > 0 and random.random() < self.sample_rate and not scope["path"].startswith(UNSAMPLED_PREFIXES):
+            return "sampled"
+        return None
+
+    async def __call__(self, scope, receive, send):
+        trigger = self._trigger(scope) if scope["type"] == "http" else None
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+        # 프로파일러가 켜져 있는 동안은 같은 스레드의 모든 요청이 느려지므로 동시 실행 수 제한
+        if self.active >= self.max_concurrent:
+            PROFILES_CAPTURED.inc(trigger=trigger, result="busy")
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{secrets.token_hex(4)}"
+        status = 500
+
+        async def send_with_profile_id(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = [*message.get("headers", []), (b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        self.active += 1
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        start = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.stop()
+            duration = time.perf_counter() - start
+            self.active -= 1
+            labels = scope.get("metrics_labels")
+            meta = {
+                "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status,
+                "duration_ms": round(duration * 1000, 2),
+                "trigger": trigger,
+                "source": labels.get("source") if labels else None
+            }
+            try:
+                # 렌더링과 파일 쓰기는 응답 전송 후 스레드에서 처리
+                await asyncio.to_thread(
+                    lambda: self.store.save(profile_id, profiler.output(SpeedscopeRenderer()), meta)
+                )
+                PROFILES_CAPTURED.inc(trigger=trigger, result="saved")
+            except Exception as e:
+                PROFILES_CAPTURED.inc(trigger=trigger, result="failed")
+                print(f"⚠️ Failed to save profile {profile_id}: {e}")
+
+
+# Global profile store instance
+profile_store = ProfileStore(
+    settings.profiling_dir,
+    settings.profiling_max_files,
+    settings.profiling_max_mb * 1024 * 1024
+)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Print an X-Profile-Token header value (uses PROFILING_SECRET)")
+    parser.add_argument("method", help="HTTP method, e.g. POST")
+    parser.add_argument("path", help="Request path without query string, e.g. /recommend")
+    parser.add_argument("--ttl", type=int, default=300, help="Seconds the token stays valid")
+    args = parser.parse_args()
+    print(sign_token(args.method, args.path, args.ttl))
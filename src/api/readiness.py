@@ -0,0 +1,51 @@
+"""Startup readiness state (served by /health/ready)"""
+import time
+from typing import Dict, Optional
+
+
+class Readiness:
+    """
+    Tracks the background warm-up after the process starts accepting requests
+
+    The lifespan only does what requests strictly need and returns, so the
+    process is live almost immediately; pool / Redis / cache warm-up runs in
+    the background and readiness flips once it has finished. Load balancers
+    and autoscalers should route traffic on /health/ready, not /health.
+    """
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.ready = False
+        self.ready_after: Optional[float] = None
+        self.steps: Dict[str, float] = {}
+        self.error: Optional[str] = None
+
+    def reset(self) -> None:
+        self.__init__()
+
+    def record(self, step: str, seconds: float) -> None:
+        self.steps[step] = round(seconds, 3)
+
+    def mark_ready(self) -> None:
+        self.ready = True
+        self.ready_after = round(time.monotonic() - self.started_at, 3)
+
+    def mark_failed(self, error: Exception) -> None:
+        self.error = str(error)
+
+    def mark_draining(self) -> None:
+        # 종료 시작 시 새 트래픽을 받지 않도록 먼저 내림
+        self.ready = False
+
+    def status(self) -> dict:
+        return {
+            "ready": self.ready,
+            "ready_after_seconds": self.ready_after,
+            "uptime_seconds": round(time.monotonic() - self.started_at, 3),
+            "steps": self.steps,
+            "error": self.error
+        }
+
+
+# Global readiness instance
+readiness = Readiness()
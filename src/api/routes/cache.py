@@ -0,0 +1,42 @@
+"""Recommendation cache administration routes (enabled with ADMIN_ENDPOINTS_ENABLED)"""
+from fastapi import APIRouter, Depends, HTTPException
+
+from src.database import UnitOfWork, get_unit_of_work
+from src.database.repositories.dress import recommendation_repo
+from src.database.repositories.venue import venue_repo
+from src.services.cache_coordination import cache_coordinator
+from src.services.recommendation_cache import dress_cache, venue_cache
+from src.services.schemas import CacheInvalidationRequest, CacheKind
+
+router = APIRouter(prefix="/cache", tags=["cache"])
+
+CACHES = {
+    CacheKind.DRESS: (dress_cache, recommendation_repo),
+    CacheKind.VENUE: (venue_cache, venue_repo),
+}
+
+
+@router.post("/invalidate")
+async def invalidate_cache(
+    request: CacheInvalidationRequest,
+    uow: UnitOfWork = Depends(get_unit_of_work)
+):
+    """
+    Drop recommendation cache entries on every replica
+
+    Keys are removed from Redis and from each replica's in-process cache via the
+    invalidation channel. With delete_rows the MySQL rows are deleted as well,
+    so the next request regenerates the recommendation (e.g. after a catalog change).
+    """
+    cache, repo = CACHES[request.kind]
+    if request.query_keys is not None:
+        invalid = [key for key in request.query_keys if not 0 <= key < cache.key_space.size]
+        if invalid:
+            raise HTTPException(status_code=422, detail=f"Unknown query keys: {invalid[:10]}")
+
+    deleted_rows = 0
+    if request.delete_rows:
+        # 행을 먼저 지워야 무효화 직후 다른 레플리카가 옛 행으로 다시 채우지 않음
+        deleted_rows = await repo.delete_by_keys(uow.session, request.query_keys)
+    invalidated = await cache_coordinator.invalidate(cache, request.query_keys)
+    return {"kind": request.kind.value, "invalidated_keys": invalidated, "deleted_rows": deleted_rows}
@@ -0,0 +1,78 @@
+"""Diagnostics routes (enabled with DEBUG_ENDPOINTS_ENABLED)"""
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import FileResponse
+
+from src.database import engine, replica_engines, replica_router
+from src.database.instrumentation import top_statements, slow_queries, reset_statement_stats
+from src.database.pool import pool_status
+from src.database.maintenance import run_retention, retention_scheduler
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+
+@router.get("/sql")
+async def sql_top_statements(
+    limit: int = Query(default=20, ge=1, le=200),
+    order_by: Literal["total_ms", "mean_ms", "max_ms", "calls"] = "total_ms"
+):
+    """
+    Get the top-N SQL statements since startup (or last reset)
+
+    Each entry has call count, total/mean/max latency, rows and per-route call counts.
+    """
+    return {"statements": top_statements(limit, order_by)}
+
+
+@router.get("/sql/slow")
+async def sql_slow_queries():
+    """Get recent slow queries with bind parameter shapes and stack traces"""
+    return {"slow_queries": slow_queries()}
+
+
+@router.delete("/sql")
+async def sql_reset():
+    """Reset aggregated SQL statement stats"""
+    reset_statement_stats()
+    return {"status": "reset"}
+
+
+@router.get("/pool")
+async def db_pool_status():
+    """Get connection pool occupancy and checkout wait histogram"""
+    return {"pools": [pool_status(pool_engine) for pool_engine in [engine, *replica_engines]]}
+
+
+@router.get("/replicas")
+async def db_replica_status():
+    """Get read replica health and replication lag"""
+    return {"replicas": replica_router.status()}
+
+
+@router.get("/retention")
+async def cache_retention_report():
+    """Dry-run cache retention: rows and bytes that the next run would reclaim"""
+    return {
+        "dry_run": await run_retention(dry_run=True),
+        "scheduler_runs": retention_scheduler.runs,
+        "last_report": retention_scheduler.last_report
+    }
+
+
+@router.get("/profiles")
+async def list_profiles():
+    """List stored request profiles (newest first) with method, path, status and duration"""
+    # 프로파일링이 꺼져 있으면 모듈 자체를 불러오지 않도록 요청 시점에 import
+    from src.api.profiling import profile_store
+    return {"profiles": profile_store.list()}
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(profile_id: str):
+    """Download one profile as speedscope JSON (open in https://www.speedscope.app)"""
+    from src.api.profiling import profile_store
+    path = profile_store.path(profile_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="application/json", filename=path.name)
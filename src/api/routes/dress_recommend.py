@@ -1,18 +1,31 @@
 """Recommendation routes"""
-from fastapi import APIRouter, HTTPException
+import time
 
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+
+from src.api.compression import cached_response
+from src.api.http_cache import canonical_redirect, etag_matches, not_modified, recommendation_etag, with_validators
 from src.services.schemas import RecommendationRequest, RecommendationResponse, DressRecommendation
 from src.services.dress_recommender import recommender, DressRecommender
-from src.database import AsyncSessionLocal
+from src.database import UnitOfWork, get_unit_of_work
+from src.services.events import record_recommendation, served_from_cache
+from src.services.recommendation_cache import dress_cache
+from src.services.cache_coordination import cache_coordinator
+from src.services.admission import AdmissionRejected, admission, overloaded
+from src.services.rate_limit import RateLimited, rate_limiter, too_many_requests
 from src.database.repositories.dress import recommendation_repo
-# Redis disabled
-# from src.config import redis_client
+from src.config.redis import redis_client
 
 router = APIRouter(prefix="", tags=["recommendations"])
 
 
 @router.post("/recommend", response_model=RecommendationResponse)
-async def recommend_dress(request: RecommendationRequest):
+async def recommend_dress(
+    request: RecommendationRequest,
+    uow: UnitOfWork = Depends(get_unit_of_work)
+):
     """
     Get wedding dress recommendations
 
@@ -26,7 +39,10 @@ async def recommend_dress(request: RecommendationRequest):
 
     Returns wedding dress recommendations with styling tips
     """
+    started_at = time.perf_counter()
     try:
+        # 클라이언트별 요청 예산 (캐시 적중 포함 모든 요청)
+        await rate_limiter.check("cache")
         arm_length = request.arm_length.value
         leg_length = request.leg_length.value
         neck_length = request.neck_length.value
@@ -34,32 +50,53 @@ async def recommend_dress(request: RecommendationRequest):
         body_type = request.body_type.value
         num_recommendations = request.num_recommendations
 
-        # Generate query hash
-        query_hash = DressRecommender.generate_hash(
+        # Get dense query key
+        query_key = DressRecommender.generate_key(
             arm_length, leg_length, neck_length, face_shape, body_type, num_recommendations
         )
 
-        # 1. Check Redis cache (temporarily disabled for testing)
-        # cached_result = await redis_client.get(f"recommendation:{query_hash}")
-        # if cached_result:
-        #     return RecommendationResponse(
-        #         request_params=request,
-        #         recommendations=[
-        #             DressRecommendation(**rec)
-        #             for rec in cached_result["recommendations"]
-        #         ],
-        #         overall_advice=cached_result["overall_advice"],
-        #         cached=True,
-        #         source="redis_cache"
-        #     )
-
-        # 2. Check MySQL database
-        async with AsyncSessionLocal() as db:
-            db_record = await recommendation_repo.get_by_hash(db, query_hash)
+        # 1. Check in-process cache
+        cached_result = dress_cache.get(query_key)
+        if cached_result:
+            record_recommendation("dress", query_key, "memory_cache", started_at)
+            # 응답 본문이 query_key로 결정되므로 항목별로 압축해 둔 본문을 재사용
+            return cached_response(dress_cache, query_key, lambda: RecommendationResponse(
+                request_params=request,
+                recommendations=[
+                    DressRecommendation(**rec)
+                    for rec in cached_result["recommendations"]
+                ],
+                overall_advice=cached_result["overall_advice"],
+                cached=True,
+                source="memory_cache"
+            ))
+
+        # 2-3. 공유 캐시 조회는 cache 풀에서 (DB 커넥션 점유 수 제한)
+        async with admission.slot("cache"):
+            # 2. Check Redis cache (shared across replicas)
+            cached_result = await redis_client.get(dress_cache.redis_key(query_key))
+            if cached_result:
+                dress_cache.put(query_key, cached_result)
+                dress_cache.record_hit(query_key)
+                record_recommendation("dress", query_key, "redis_cache", started_at)
+                return RecommendationResponse(
+                    request_params=request,
+                    recommendations=[
+                        DressRecommendation(**rec)
+                        for rec in cached_result["recommendations"]
+                    ],
+                    overall_advice=cached_result["overall_advice"],
+                    cached=True,
+                    source="redis_cache"
+                )
+
+            # 3. Check MySQL database
+            db_record = await recommendation_repo.get_by_key(uow.session, query_key)
             if db_record:
                 result = db_record.recommendation
-                # Redis disabled
-                # await redis_client.set(f"recommendation:{query_hash}", result)
+                dress_cache.put(query_key, result)
+                record_recommendation("dress", query_key, "mysql_db", started_at)
+                await redis_client.set(dress_cache.redis_key(query_key), result)
 
                 return RecommendationResponse(
                     request_params=request,
@@ -72,18 +109,38 @@ async def recommend_dress(request: RecommendationRequest):
                     source="mysql_db"
                 )
 
-            # 3. Generate new recommendation
-            recommendation = await recommender.generate(
-                arm_length, leg_length, neck_length, face_shape, body_type, num_recommendations
-            )
+            # LLM 호출 동안 커넥션을 점유하지 않도록 반환
+            await uow.release()
+
+        # 캐시 미스 - 클라이언트의 생성 예산 차감 (결과 대기로 끝나도 차감)
+        await rate_limiter.check("generation")
 
-            # Save to database
-            await recommendation_repo.create(
-                db, query_hash, arm_length, leg_length, neck_length, face_shape, recommendation, body_type
+        # 4. Generate new recommendation (키마다 한 요청/레플리카만 생성, 나머지는 결과 대기)
+        async def generate():
+            async with admission.slot("dress_generation"):
+                recommendation = await recommender.generate(
+                    arm_length, leg_length, neck_length, face_shape, body_type, num_recommendations
+                )
+
+            # Save to database (다른 워커가 먼저 저장했으면 저장된 결과로 응답)
+            stored = await recommendation_repo.create(
+                uow.session, query_key, arm_length, leg_length, neck_length, face_shape, recommendation, body_type
             )
+            await redis_client.set(dress_cache.redis_key(query_key), stored.recommendation)
+            return stored.recommendation
 
-        # Redis disabled
-        # await redis_client.set(f"recommendation:{query_hash}", recommendation)
+        async def reload():
+            db_record = await recommendation_repo.get_by_key(uow.session, query_key)
+            return db_record.recommendation if db_record else None
+
+        # 생성 풀 포화 시 LLM 없이 카탈로그 기반 추천 (캐시에 저장하지 않아 다음 요청은 정상 생성)
+        recommendation, source = await cache_coordinator.serve_generated(
+            dress_cache, query_key, generate, reload,
+            lambda: recommender.fallback(
+                arm_length, leg_length, neck_length, face_shape, body_type, num_recommendations
+            )
+        )
+        record_recommendation("dress", query_key, source, started_at)
 
         return RecommendationResponse(
             request_params=request,
@@ -92,9 +149,43 @@ async def recommend_dress(request: RecommendationRequest):
                 for rec in recommendation["recommendations"]
             ],
             overall_advice=recommendation["overall_advice"],
-            cached=False,
-            source="ai_generated"
+            cached=served_from_cache(source),
+            source=source
         )
 
+    except RateLimited as e:
+        raise too_many_requests(e)
+    except AdmissionRejected as e:
+        raise overloaded(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/recommend", response_model=RecommendationResponse)
+async def recommend_dress_get(
+    http_request: Request,
+    response: Response,
+    params: Annotated[RecommendationRequest, Query()],
+    uow: UnitOfWork = Depends(get_unit_of_work)
+):
+    """
+    Cacheable GET variant of POST /recommend (same parameters as a query string)
+
+    Query strings are redirected (301) to the canonical parameter order so
+    browsers and edge caches keep one entry per input tuple. Responses carry
+    a weak ETag (query key + catalog version) and Cache-Control; a matching
+    If-None-Match returns 304 before any cache lookup.
+    """
+    redirect = canonical_redirect(http_request, params)
+    if redirect is not None:
+        return redirect
+
+    query_key = DressRecommender.generate_key(
+        params.arm_length.value, params.leg_length.value, params.neck_length.value,
+        params.face_shape.value, params.body_type.value, params.num_recommendations
+    )
+    etag = recommendation_etag("dress", query_key)
+    if etag_matches(http_request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+
+    return with_validators(await recommend_dress(params, uow), response, etag)
@@ -1,9 +1,9 @@
-"""Health check and database connection test routes"""
-from fastapi import APIRouter, HTTPException
-from sqlalchemy import text
-from src.database import AsyncSessionLocal
-# Redis disabled
-# from src.config import redis_client
+"""Health check routes (served from the background prober's last results)"""
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from src.api.health_prober import health_prober
+from src.api.readiness import readiness
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -11,65 +11,60 @@ router = APIRouter(prefix="/health", tags=["health"])
 @router.get("/")
 async def health_check():
     """
-    Basic health check endpoint
+    Detailed health status
 
-    Returns:
-    - status: API server status
+    Returns the last result of every background check (status, latency,
+    timestamps). Always 200; use /health/live and /health/ready for probes.
     """
     return {
-        "status": "healthy",
-        "message": "API is running"
+        "status": "healthy" if health_prober.healthy else "degraded",
+        "message": "API is running",
+        "checks": health_prober.checks()
     }
 
 
-@router.get("/db")
-async def database_health():
+@router.get("/live")
+async def liveness_check():
     """
-    Database connection test endpoint
+    Liveness endpoint for container restarts
 
-    Tests connections to:
-    - MySQL database
-
-    Returns detailed connection status for each service
+    200 while the process serves requests and the background prober keeps
+    completing rounds; 503 when it has stalled. Dependencies being down does
+    not fail liveness (restarting would not fix them).
     """
-    result = {
-        "mysql": {"status": "unknown", "message": ""}
-    }
+    alive = health_prober.alive
+    return JSONResponse(
+        status_code=200 if alive else 503,
+        content={"alive": alive, "uptime_seconds": readiness.status()["uptime_seconds"]}
+    )
 
-    # Test MySQL connection
-    try:
-        async with AsyncSessionLocal() as db:
-            await db.execute(text("SELECT 1"))
-            result["mysql"]["status"] = "connected"
-            result["mysql"]["message"] = "MySQL connection successful"
-    except Exception as e:
-        result["mysql"]["status"] = "failed"
-        result["mysql"]["message"] = f"MySQL connection failed: {str(e)}"
 
-    # Redis disabled
-    # try:
-    #     await redis_client.set("health_check", {"status": "ok"}, ttl=10)
-    #     value = await redis_client.get("health_check")
-    #     if value and value.get("status") == "ok":
-    #         result["redis"]["status"] = "connected"
-    #         result["redis"]["message"] = "Redis connection successful"
-    #     else:
-    #         result["redis"]["status"] = "failed"
-    #         result["redis"]["message"] = "Redis read/write test failed"
-    # except Exception as e:
-    #     result["redis"]["status"] = "failed"
-    #     result["redis"]["message"] = f"Redis connection failed: {str(e)}"
+@router.get("/ready")
+async def readiness_check():
+    """
+    Readiness endpoint for load balancers / autoscaling
 
-    # Determine overall status
-    all_connected = all(
-        service["status"] == "connected"
-        for service in result.values()
-    )
+    200 once the background warm-up (DB pools, Redis, memory caches, OpenAI
+    client) has finished and every critical check passed on its last run;
+    503 before that, while a critical dependency is down and while shutting down.
+    """
+    status = readiness.status()
+    status["ready"] = status["ready"] and health_prober.healthy and health_prober.alive
+    status["checks"] = health_prober.checks()
+    return JSONResponse(status_code=200 if status["ready"] else 503, content=status)
 
-    if not all_connected:
-        raise HTTPException(status_code=503, detail=result)
 
-    return {
-        "status": "healthy",
-        "services": result
-    }
+@router.get("/db")
+async def database_health():
+    """
+    Database connection status
+
+    Last known MySQL / Redis check results from the background prober; no
+    connection is opened on the request path.
+    """
+    services = health_prober.checks({"mysql", "redis"})
+    healthy = all(service["status"] == "ok" for service in services.values())
+    return JSONResponse(
+        status_code=200 if healthy else 503,
+        content={"status": "healthy" if healthy else "unhealthy", "services": services}
+    )
@@ -2,37 +2,56 @@
 Image serving routes
 DB에 저장된 이미지 경로로 실제 이미지 파일을 제공하는 API
 """
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+import os
+import uuid
 from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, StreamingResponse
+
 from src.config import settings
+from src.services.schemas import BulkImageRequest, ImageSizePreset
 
 router = APIRouter(prefix="/images", tags=["Images"])
 
+ALLOWED_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.gif', '.webp']
 
-@router.get("/{table_name}/{filename}")
-async def get_image(table_name: str, filename: str):
-    """
-    DB에 저장된 이미지 경로로 실제 이미지 파일 반환
+# 파일을 읽어 스트리밍할 때 사용하는 청크 크기
+BULK_CHUNK_SIZE = 64 * 1024
 
-    Args:
-        table_name: 테이블 이름 (tb_dress, tb_dress_shop, tb_wedding_hall 등)
-        filename: 파일명 (확장자 포함 또는 미포함)
 
-    Returns:
-        이미지 파일
+def _normalize_filename(filename: str) -> str:
+    """파일명에 확장자가 없으면 .png 추가"""
+    if not filename.endswith(tuple(ALLOWED_EXTENSIONS)):
+        filename = f"{filename}.png"
+    return filename
 
-    Example:
-        GET /images/tb_dress/dress_1.png
-        GET /images/tb_dress_shop/shop_5.png
+
+def _resolve_image_path(
+    table_name: str,
+    filename: str,
+    size: Optional[ImageSizePreset] = None
+) -> Path:
     """
-    # 파일명에 확장자가 없으면 .png 추가
-    if not filename.endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp')):
-        filename = f"{filename}.png"
+    요청된 이미지의 실제 파일 경로를 검증 후 반환
+
+    size 프리셋이 주어지면 {image_base_path}/{table_name}/{size}/{filename} 을
+    먼저 찾고, 없으면 원본 경로로 대체합니다.
+
+    Raises:
+        HTTPException: 파일 없음(404), 허용되지 않은 확장자(400), 경로 조작(403)
+    """
+    base_path = Path(settings.image_base_path)
 
     # 서버의 실제 파일 경로 구성
     # 기본 경로: {image_base_path}/{table_name}/{filename}
-    file_path = Path(settings.image_base_path) / table_name / filename
+    file_path = base_path / table_name / filename
+    if size and size != ImageSizePreset.ORIGINAL:
+        sized_path = base_path / table_name / size.value / filename
+        if sized_path.exists():
+            file_path = sized_path
 
     # 파일 존재 여부 확인
     if not file_path.exists():
@@ -42,8 +61,7 @@ async def get_image(table_name: str, filename: str):
         )
 
     # 파일이 실제로 이미지인지 확인 (보안)
-    allowed_extensions = ['.png', '.jpg', '.jpeg', '.gif', '.webp']
-    if file_path.suffix.lower() not in allowed_extensions:
+    if file_path.suffix.lower() not in ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=400,
             detail="Invalid file type. Only image files are allowed."
@@ -52,20 +70,43 @@ async def get_image(table_name: str, filename: str):
     # 경로 조작 방지 (보안)
     try:
         file_path = file_path.resolve()
-        base_path = Path(settings.image_base_path).resolve()
-
-        # 파일이 허용된 기본 경로 내에 있는지 확인
-        if not str(file_path).startswith(str(base_path)):
-            raise HTTPException(
-                status_code=403,
-                detail="Access denied"
-            )
+        resolved_base = base_path.resolve()
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Path resolution error: {str(e)}"
         )
 
+    # 파일이 허용된 기본 경로 내에 있는지 확인
+    if not file_path.is_relative_to(resolved_base):
+        raise HTTPException(
+            status_code=403,
+            detail="Access denied"
+        )
+
+    return file_path
+
+
+@router.get("/{table_name}/{filename}")
+async def get_image(table_name: str, filename: str):
+    """
+    DB에 저장된 이미지 경로로 실제 이미지 파일 반환
+
+    Args:
+        table_name: 테이블 이름 (tb_dress, tb_dress_shop, tb_wedding_hall 등)
+        filename: 파일명 (확장자 포함 또는 미포함)
+
+    Returns:
+        이미지 파일
+
+    Example:
+        GET /images/tb_dress/dress_1.png
+        GET /images/tb_dress_shop/shop_5.png
+    """
+    filename = _normalize_filename(filename)
+    # exists()/resolve()도 파일 시스템 접근이므로 이벤트 루프 밖에서
+    file_path = await run_in_threadpool(_resolve_image_path, table_name, filename)
+
     # 이미지 파일 반환
     return FileResponse(
         path=file_path,
@@ -75,3 +116,88 @@ async def get_image(table_name: str, filename: str):
             "Content-Disposition": f"inline; filename={filename}"
         }
     )
+
+
+def _open_image(
+    table_name: str,
+    filename: str,
+    size: Optional[ImageSizePreset]
+) -> Tuple[Path, BinaryIO, int]:
+    """경로 확인과 열기를 한 번에 수행하고 열린 파일 기준으로 크기 확인 (이후 삭제되어도 끝까지 읽을 수 있음)"""
+    file_path = _resolve_image_path(table_name, filename, size)
+    f = open(file_path, "rb")
+    try:
+        return file_path, f, os.fstat(f.fileno()).st_size
+    except OSError:
+        f.close()
+        raise
+
+
+def _empty_part(boundary: str, location: str, status_code: int) -> bytes:
+    return (
+        f"--{boundary}\r\n"
+        f"Content-Location: {location}\r\n"
+        f"X-Status: {status_code}\r\n"
+        f"Content-Length: 0\r\n\r\n\r\n"
+    ).encode()
+
+
+async def _stream_multipart(request: BulkImageRequest, boundary: str) -> AsyncIterator[bytes]:
+    """요청된 이미지를 순서대로 읽으면서 multipart/mixed 파트로 내보냄"""
+    for item in request.items:
+        filename = _normalize_filename(item.filename)
+        location = f"{item.table_name}/{filename}"
+
+        # 실패한 항목은 빈 파트와 상태 코드로 표시하고 나머지는 계속 전송
+        try:
+            # 경로 확인(exists/resolve)과 열기를 한 번의 스레드풀 호출로 처리하고, 파트 헤더 전에 먼저 연다
+            file_path, f, size = await run_in_threadpool(_open_image, item.table_name, filename, request.size)
+        except HTTPException as e:
+            yield _empty_part(boundary, location, e.status_code)
+            continue
+        except FileNotFoundError:
+            yield _empty_part(boundary, location, 404)
+            continue
+        except OSError:
+            yield _empty_part(boundary, location, 500)
+            continue
+
+        with f:
+            yield (
+                f"--{boundary}\r\n"
+                f"Content-Type: image/{file_path.suffix[1:].lower()}\r\n"
+                f"Content-Location: {location}\r\n"
+                f"X-Status: 200\r\n"
+                f"Content-Length: {size}\r\n\r\n"
+            ).encode()
+
+            # 파일 읽기는 이벤트 루프를 막지 않도록 스레드풀에서 청크 단위로 수행
+            while chunk := await run_in_threadpool(f.read, BULK_CHUNK_SIZE):
+                yield chunk
+        yield b"\r\n"
+
+    yield f"--{boundary}--\r\n".encode()
+
+
+@router.post("/bulk")
+async def get_images_bulk(request: BulkImageRequest):
+    """
+    여러 이미지를 하나의 multipart/mixed 응답으로 반환
+
+    목록 화면에서 이미지마다 별도 요청을 보내는 대신 한 번의 요청으로 가져옵니다.
+    각 파트는 파일을 읽는 즉시 스트리밍되며, 요청 순서를 유지합니다.
+
+    파트 헤더:
+    - Content-Location: {table_name}/{filename}
+    - X-Status: 200 또는 실패 시 404/400/403/500 (이 경우 본문 없음)
+    - Content-Length: 파트 본문 길이
+
+    Example:
+        POST /images/bulk
+        {"items": [{"table_name": "tb_dress", "filename": "dress_1"}], "size": "thumb"}
+    """
+    boundary = uuid.uuid4().hex
+    return StreamingResponse(
+        _stream_multipart(request, boundary),
+        media_type=f"multipart/mixed; boundary={boundary}"
+    )
@@ -0,0 +1,40 @@
+"""Bulk import routes (enabled with ADMIN_ENDPOINTS_ENABLED)"""
+import io
+import tempfile
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
+
+from src.database import UnitOfWork, get_unit_of_work
+from src.services.bulk_import import ImportFormat, ImportTarget, import_records
+
+router = APIRouter(prefix="/import", tags=["import"])
+
+# 업로드 본문은 이 크기까지 메모리, 초과분은 임시 파일에 보관
+SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+
+
+@router.post("/{target}")
+async def bulk_import(
+    target: ImportTarget,
+    request: Request,
+    format: ImportFormat = ImportFormat.CSV,
+    chunk_size: int = Query(default=1000, ge=1, le=10000),
+    uow: UnitOfWork = Depends(get_unit_of_work)
+):
+    """
+    Bulk import wedding dresses or surveys from a raw CSV / NDJSON body
+
+    Rows are validated like the single-row create endpoints; invalid rows are
+    skipped and reported. Each chunk is written with one multi-row upsert.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY) as spool:
+        async for body_chunk in request.stream():
+            await run_in_threadpool(spool.write, body_chunk)
+        spool.seek(0)
+
+        stream = io.TextIOWrapper(spool, encoding="utf-8-sig", newline="")
+        try:
+            return await import_records(uow.session, target, stream, format, chunk_size)
+        finally:
+            stream.detach()
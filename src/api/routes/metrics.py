@@ -0,0 +1,26 @@
+"""Prometheus metrics route"""
+import asyncio
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from src.services.metrics import PROMETHEUS_CONTENT_TYPE, render_prometheus
+from src.services.metrics_multiprocess import multiprocess_metrics
+
+router = APIRouter(prefix="", tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Every metric in the Prometheus text format
+
+    Under the multi-worker server, counters and histograms are summed over all
+    workers and gauges carry a pid label; otherwise this process only.
+    """
+    if multiprocess_metrics.enabled:
+        # 다른 워커 파일을 읽고 합치는 파일 I/O는 이벤트 루프 밖에서
+        body = await asyncio.to_thread(multiprocess_metrics.render)
+    else:
+        body = render_prometheus()
+    return Response(body, media_type=PROMETHEUS_CONTENT_TYPE)
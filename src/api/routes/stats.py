@@ -1,18 +1,26 @@
 """Statistics routes"""
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
-from src.database import AsyncSessionLocal
+from src.database import UnitOfWork, get_unit_of_work
 from src.database.repositories.dress import recommendation_repo
+from src.database.repositories.survey import survey_repo
 
 router = APIRouter(prefix="", tags=["statistics"])
 
 
 @router.get("/stats")
-async def get_statistics():
+async def get_statistics(uow: UnitOfWork = Depends(get_unit_of_work)):
     """Get recommendation statistics"""
     try:
-        async with AsyncSessionLocal() as db:
-            stats = await recommendation_repo.get_stats(db)
-            return stats
+        return await recommendation_repo.get_stats(uow.session)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/stats/surveys")
+async def get_survey_statistics(uow: UnitOfWork = Depends(get_unit_of_work)):
+    """Get survey statistics"""
+    try:
+        return await survey_repo.get_stats(uow.session)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
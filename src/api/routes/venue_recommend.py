@@ -1,18 +1,31 @@
 """Venue recommendation routes"""
-from fastapi import APIRouter, HTTPException
+import time
 
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+
+from src.api.compression import cached_response
+from src.api.http_cache import canonical_redirect, etag_matches, not_modified, recommendation_etag, with_validators
 from src.services.schemas import VenueRecommendationRequest, VenueRecommendationResponse, VenueRecommendation
 from src.services.venue_recommender import venue_recommender, VenueRecommender
-from src.database import AsyncSessionLocal
+from src.database import UnitOfWork, get_unit_of_work
+from src.services.events import record_recommendation, served_from_cache
+from src.services.recommendation_cache import venue_cache
+from src.services.cache_coordination import cache_coordinator
+from src.services.admission import AdmissionRejected, admission, overloaded
+from src.services.rate_limit import RateLimited, rate_limiter, too_many_requests
 from src.database.repositories.venue import venue_repo
-# Redis disabled
-# from src.config import redis_client
+from src.config.redis import redis_client
 
 router = APIRouter(prefix="", tags=["venue-recommendations"])
 
 
 @router.post("/recommend/venue", response_model=VenueRecommendationResponse)
-async def recommend_venue(request: VenueRecommendationRequest):
+async def recommend_venue(
+    request: VenueRecommendationRequest,
+    uow: UnitOfWork = Depends(get_unit_of_work)
+):
     """
     Get wedding venue recommendations
 
@@ -26,7 +39,10 @@ async def recommend_venue(request: VenueRecommendationRequest):
 
     Returns wedding venue recommendations with details
     """
+    started_at = time.perf_counter()
     try:
+        # 클라이언트별 요청 예산 (캐시 적중 포함 모든 요청)
+        await rate_limiter.check("cache")
         guest_count = request.guest_count.value
         budget = request.budget.value
         region = request.region.value
@@ -34,32 +50,53 @@ async def recommend_venue(request: VenueRecommendationRequest):
         season = request.season.value
         num_recommendations = request.num_recommendations
 
-        # Generate query hash
-        query_hash = VenueRecommender.generate_hash(
+        # Get dense query key
+        query_key = VenueRecommender.generate_key(
             guest_count, budget, region, style_preference, season, num_recommendations
         )
 
-        # 1. Check Redis cache (temporarily disabled for testing)
-        # cached_result = await redis_client.get(f"venue:{query_hash}")
-        # if cached_result:
-        #     return VenueRecommendationResponse(
-        #         request_params=request,
-        #         recommendations=[
-        #             VenueRecommendation(**rec)
-        #             for rec in cached_result["recommendations"]
-        #         ],
-        #         overall_advice=cached_result["overall_advice"],
-        #         cached=True,
-        #         source="redis_cache"
-        #     )
-
-        # 2. Check MySQL database
-        async with AsyncSessionLocal() as db:
-            db_record = await venue_repo.get_by_hash(db, query_hash)
+        # 1. Check in-process cache
+        cached_result = venue_cache.get(query_key)
+        if cached_result:
+            record_recommendation("venue", query_key, "memory_cache", started_at)
+            # 응답 본문이 query_key로 결정되므로 항목별로 압축해 둔 본문을 재사용
+            return cached_response(venue_cache, query_key, lambda: VenueRecommendationResponse(
+                request_params=request,
+                recommendations=[
+                    VenueRecommendation(**rec)
+                    for rec in cached_result["recommendations"]
+                ],
+                overall_advice=cached_result["overall_advice"],
+                cached=True,
+                source="memory_cache"
+            ))
+
+        # 2-3. 공유 캐시 조회는 cache 풀에서 (DB 커넥션 점유 수 제한)
+        async with admission.slot("cache"):
+            # 2. Check Redis cache (shared across replicas)
+            cached_result = await redis_client.get(venue_cache.redis_key(query_key))
+            if cached_result:
+                venue_cache.put(query_key, cached_result)
+                venue_cache.record_hit(query_key)
+                record_recommendation("venue", query_key, "redis_cache", started_at)
+                return VenueRecommendationResponse(
+                    request_params=request,
+                    recommendations=[
+                        VenueRecommendation(**rec)
+                        for rec in cached_result["recommendations"]
+                    ],
+                    overall_advice=cached_result["overall_advice"],
+                    cached=True,
+                    source="redis_cache"
+                )
+
+            # 3. Check MySQL database
+            db_record = await venue_repo.get_by_key(uow.session, query_key)
             if db_record:
                 result = db_record.recommendation
-                # Save to Redis cache (temporarily disabled for testing)
-                # await redis_client.set(f"venue:{query_hash}", result)
+                venue_cache.put(query_key, result)
+                record_recommendation("venue", query_key, "mysql_db", started_at)
+                await redis_client.set(venue_cache.redis_key(query_key), result)
 
                 return VenueRecommendationResponse(
                     request_params=request,
@@ -72,18 +109,38 @@ async def recommend_venue(request: VenueRecommendationRequest):
                     source="mysql_db"
                 )
 
-            # 3. Generate new recommendation
-            recommendation = await venue_recommender.generate(
-                guest_count, budget, region, style_preference, season, num_recommendations
-            )
+            # 생성 풀 대기 동안 커넥션을 점유하지 않도록 반환
+            await uow.release()
+
+        # 캐시 미스 - 클라이언트의 생성 예산 차감 (결과 대기로 끝나도 차감)
+        await rate_limiter.check("generation")
+
+        # 4. Generate new recommendation (키마다 한 요청/레플리카만 생성, 나머지는 결과 대기)
+        async def generate():
+            async with admission.slot("venue_generation"):
+                recommendation = await venue_recommender.generate(
+                    uow.session, guest_count, budget, region, style_preference, season, num_recommendations
+                )
 
-            # Save to database
-            await venue_repo.create(
-                db, query_hash, guest_count, budget, region, style_preference, season, recommendation
+            # Save to database (다른 워커가 먼저 저장했으면 저장된 결과로 응답)
+            stored = await venue_repo.create(
+                uow.session, query_key, guest_count, budget, region, style_preference, season, recommendation
             )
+            await redis_client.set(venue_cache.redis_key(query_key), stored.recommendation)
+            return stored.recommendation
+
+        async def reload():
+            db_record = await venue_repo.get_by_key(uow.session, query_key)
+            return db_record.recommendation if db_record else None
 
-        # Save to cache (temporarily disabled for testing)
-        # await redis_client.set(f"venue:{query_hash}", recommendation)
+        # 생성 풀 포화 시 DB 조회 없이 내장 카탈로그 기반 추천 (캐시에 저장하지 않음)
+        recommendation, source = await cache_coordinator.serve_generated(
+            venue_cache, query_key, generate, reload,
+            lambda: venue_recommender.fallback(
+                guest_count, budget, region, style_preference, season, num_recommendations
+            )
+        )
+        record_recommendation("venue", query_key, source, started_at)
 
         return VenueRecommendationResponse(
             request_params=request,
@@ -92,9 +149,36 @@ async def recommend_venue(request: VenueRecommendationRequest):
                 for rec in recommendation["recommendations"]
             ],
             overall_advice=recommendation["overall_advice"],
-            cached=False,
-            source="ai_generated"
+            cached=served_from_cache(source),
+            source=source
         )
 
+    except RateLimited as e:
+        raise too_many_requests(e)
+    except AdmissionRejected as e:
+        raise overloaded(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/recommend/venue", response_model=VenueRecommendationResponse)
+async def recommend_venue_get(
+    http_request: Request,
+    response: Response,
+    params: Annotated[VenueRecommendationRequest, Query()],
+    uow: UnitOfWork = Depends(get_unit_of_work)
+):
+    """Cacheable GET variant of POST /recommend/venue (canonical query string, ETag, 304; see GET /recommend)"""
+    redirect = canonical_redirect(http_request, params)
+    if redirect is not None:
+        return redirect
+
+    query_key = VenueRecommender.generate_key(
+        params.guest_count.value, params.budget.value, params.region.value,
+        params.style_preference.value, params.season.value, params.num_recommendations
+    )
+    etag = recommendation_etag("venue", query_key)
+    if etag_matches(http_request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+
+    return with_validators(await recommend_venue(params, uow), response, etag)
@@ -0,0 +1,169 @@
+"""
+Production server: gunicorn master + N uvicorn workers
+
+The app (and with it the dress/venue catalogs and derived prompt strings) is
+imported once in the master before fork, and gc.freeze() keeps those objects
+out of later collections, so workers share the pages copy-on-write instead of
+each building its own copy. Workers exit gracefully after
+SERVER_MAX_REQUESTS (+ jitter) requests and the master replaces them.
+
+Background components (pools, Redis, flush loops) start in each worker's
+lifespan, after fork. The default worker count follows the CPUs this process
+may actually use (affinity and cgroup quota, so a container limit counts,
+not the host), capped at SERVER_MAX_DEFAULT_WORKERS, and DB_CONNECTION_BUDGET
+is split across workers so the pools cannot exceed it. With more than one worker, /metrics merges every
+worker's series through a shared snapshot directory (see
+src.services.metrics_multiprocess).
+
+Single-flight generation across workers needs the Redis lease
+(REDIS_BACKEND=redis); without it each worker generates on its own and a
+startup warning says so. Duplicate inserts of a key are still safe, since the
+repositories return the row stored first.
+
+Usage:
+    python -m src.api.server
+    python -m src.api.server --workers 4 --port 8000
+"""
+import argparse
+import gc
+import math
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from gunicorn.app.base import BaseApplication
+
+from src.config import settings
+
+
+def _cgroup_cpu_limit() -> Optional[float]:
+    """CPU quota of this container (cgroup v2, then v1); None when unlimited"""
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        quota = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us").read_text())
+        period = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us").read_text())
+        return None if quota <= 0 else quota / period
+    except (OSError, ValueError):
+        return None
+
+
+def available_cpus() -> int:
+    """CPUs this process can use: scheduler affinity, limited by the cgroup quota"""
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    limit = _cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, max(1, math.ceil(limit)))
+    return cpus
+
+
+def default_workers() -> int:
+    return settings.server_workers or min(available_cpus(), settings.server_max_default_workers)
+
+
+def size_pools(workers: int) -> None:
+    """Shrink per-worker DB pools so that workers x (pool + overflow) fits DB_CONNECTION_BUDGET"""
+    budget = settings.db_connection_budget
+    if budget <= 0 or workers * (settings.db_pool_size + settings.db_max_overflow) <= budget:
+        return
+    per_worker = max(1, budget // workers)
+    if budget < workers:
+        print(f"⚠️ DB_CONNECTION_BUDGET={budget} is below {workers} workers, each worker still gets 1 connection")
+    # 앱 import(엔진/admission 생성) 전에 바꿔야 워커들이 줄어든 값을 사용
+    settings.db_pool_size = min(settings.db_pool_size, per_worker)
+    settings.db_max_overflow = min(settings.db_max_overflow, per_worker - settings.db_pool_size)
+    settings.admission_cache_concurrency = min(
+        settings.admission_cache_concurrency, settings.db_pool_size + settings.db_max_overflow
+    )
+
+
+def warn_uncoordinated_generation(workers: int) -> None:
+    """Warn when workers cannot share single-flight generation (no Redis lease backend)"""
+    if workers <= 1 or settings.redis_backend == "redis" or not settings.roles & {"dress", "venue"}:
+        return
+    # fake 백엔드도 프로세스 내 대체라 워커 간 리스를 공유하지 못함
+    print(
+        f"⚠️ {workers} workers with REDIS_BACKEND={settings.redis_backend}: cache misses on the same key "
+        "are generated once per worker (set REDIS_BACKEND=redis to coordinate)"
+    )
+
+
+def prepare_metrics_dir(workers: int) -> None:
+    """Point every worker at one (emptied) metrics snapshot directory"""
+    if workers <= 1 or not settings.metrics_enabled:
+        return
+    if not settings.metrics_multiprocess_dir:
+        settings.metrics_multiprocess_dir = os.path.join(tempfile.gettempdir(), f"api-metrics-{os.getpid()}")
+    # 앱(및 수집기)을 import하기 전에 설정해야 워커들이 같은 디렉터리를 사용
+    from src.services.metrics_multiprocess import reset_directory
+    reset_directory(settings.metrics_multiprocess_dir)
+
+
+def _when_ready(server) -> None:
+    # 포크 전에 카탈로그 파생 문자열을 만들어 두고 GC 대상에서 제외 (copy-on-write 공유 유지)
+    from src.services.dress_data import get_styles_with_suitability
+    from src.services.venues_data import get_venues_with_suitability
+    get_styles_with_suitability()
+    get_venues_with_suitability()
+    if "dress" in settings.roles:
+        # 워커마다 openai를 import하지 않도록 마스터에서 미리 로드 (클라이언트는 워커에서 생성)
+        import openai  # noqa: F401
+    gc.collect()
+    gc.freeze()
+    print(
+        f"✅ App preloaded, starting {server.num_workers} workers "
+        f"(DB pool {settings.db_pool_size}+{settings.db_max_overflow} per worker)"
+    )
+
+
+class Server(BaseApplication):
+    """gunicorn application configured from Settings"""
+
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        from src.api.main import app
+        return app
+
+
+def build_options(workers: int, host: str, port: int) -> dict:
+    return {
+        "bind": f"{host}:{port}",
+        "workers": workers,
+        "worker_class": "uvicorn_worker.UvicornWorker",
+        "preload_app": True,
+        "max_requests": settings.server_max_requests,
+        "max_requests_jitter": settings.server_max_requests_jitter,
+        "graceful_timeout": settings.server_graceful_timeout,
+        "timeout": settings.server_worker_timeout,
+        "keepalive": settings.server_keepalive,
+        "when_ready": _when_ready,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the API with multiple preloaded workers")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: SERVER_WORKERS or usable CPUs)")
+    parser.add_argument("--host", default=settings.app_host)
+    parser.add_argument("--port", type=int, default=settings.app_port)
+    args = parser.parse_args()
+
+    workers = args.workers or default_workers()
+    size_pools(workers)
+    warn_uncoordinated_generation(workers)
+    prepare_metrics_dir(workers)
+    Server(build_options(workers, args.host, args.port)).run()
+
+
+if __name__ == "__main__":
+    main()
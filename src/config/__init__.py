@@ -1,5 +1,4 @@
 from .settings import settings
-# Redis disabled
-# from .redis import redis_client
+# redis_client는 src.config.redis에서 import (codec → src.database 순환 import 방지)
 
 __all__ = ["settings"]
@@ -1,40 +1,349 @@
-# Redis disabled - not used in deployment
-# import redis.asyncio as redis
-# from typing import Optional
-# import json
-# from src.config.settings import settings
+"""
+Redis cache client (shared L2 between the in-process cache and MySQL)
+
+REDIS_BACKEND selects the implementation:
+- none:  disabled, every lookup is a miss (default)
+- redis: redis.asyncio with a connection pool
+- fake:  in-process InMemoryRedis (local runs and tests, no server needed)
+
+Values are stored with the recommendation payload codec (compact JSON or
+compressed + header, see src/database/codec.py). Any Redis error marks the
+client unavailable for redis_retry_interval seconds; during that time calls
+return immediately as misses so requests fall through to MySQL.
+"""
+import asyncio
+import fnmatch
+import time
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from src.config.settings import settings
+from src.database.codec import payload_codec
+from src.services.metrics import Counter
+
+# 소유자 토큰이 같을 때만 리스 삭제 (다른 레플리카가 만료 후 다시 잡은 리스를 지우지 않도록)
+RELEASE_LEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# 토큰 버킷 차감을 원자적으로 처리 (레플리카 간 같은 버킷 공유), 시각은 Redis 서버 시계 기준
+# 반환: {허용 여부, 남은 토큰} - Lua 숫자는 정수로 잘리므로 토큰은 문자열로 반환
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", tostring(now))
+redis.call("PEXPIRE", KEYS[1], math.ceil((burst - tokens) / rate * 1000) + 1000)
+return {allowed, tostring(tokens)}
+"""
+
+REDIS_REQUESTS = Counter(
+    "redis_requests_total",
+    "Redis cache operations by result",
+    labelnames=("op", "result")
+)
+
+
+class InMemoryRedis:
+    """Minimal in-process stand-in for the redis.asyncio commands used here"""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+        self._subscribers: Set["_InMemoryPubSub"] = set()
+
+    def _live(self, key: str) -> Optional[bytes]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    async def ping(self) -> bool:
+        return True
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._live(key)
+
+    async def mget(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        return [self._live(key) for key in keys]
+
+    async def set(
+        self,
+        key: str,
+        value,
+        ex: Optional[int] = None,
+        px: Optional[int] = None,
+        nx: bool = False
+    ) -> Optional[bool]:
+        if nx and self._live(key) is not None:
+            return None
+        if isinstance(value, str):
+            value = value.encode()
+        ttl = ex if ex else (px / 1000 if px else None)
+        self._data[key] = (value, time.monotonic() + ttl if ttl else None)
+        return True
+
+    async def eval(self, script: str, numkeys: int, *args):
+        if script == RELEASE_LEASE_SCRIPT:
+            key, token = args[0], args[1]
+            if self._live(key) == (token.encode() if isinstance(token, str) else token):
+                return await self.delete(key)
+            return 0
+        if script == TOKEN_BUCKET_SCRIPT:
+            return self._take_tokens(args[0], float(args[1]), float(args[2]), float(args[3]))
+        raise NotImplementedError("InMemoryRedis only supports RELEASE_LEASE_SCRIPT and TOKEN_BUCKET_SCRIPT")
+
+    def _take_tokens(self, key: str, rate: float, burst: float, cost: float) -> list:
+        now = time.monotonic()
+        state = self._live(key)
+        tokens, ts = map(float, state.split(b":")) if state is not None else (burst, now)
+        tokens = min(burst, tokens + max(0.0, now - ts) * rate)
+        allowed = 0
+        if tokens >= cost:
+            tokens -= cost
+            allowed = 1
+        self._data[key] = (f"{tokens}:{now}".encode(), now + (burst - tokens) / rate + 1)
+        return [allowed, str(tokens).encode()]
+
+    async def publish(self, channel: str, message) -> int:
+        if isinstance(message, str):
+            message = message.encode()
+        receivers = [pubsub for pubsub in self._subscribers if channel in pubsub.channels]
+        for pubsub in receivers:
+            pubsub.queue.put_nowait({"type": "message", "channel": channel.encode(), "data": message})
+        return len(receivers)
+
+    def pubsub(self) -> "_InMemoryPubSub":
+        return _InMemoryPubSub(self)
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self._data.pop(key, None) is not None for key in keys)
+
+    async def exists(self, *keys: str) -> int:
+        return sum(self._live(key) is not None for key in keys)
+
+    async def keys(self, pattern: str = "*") -> List[str]:
+        return [key for key in list(self._data) if self._live(key) is not None and fnmatch.fnmatch(key, pattern)]
+
+    def pipeline(self, transaction: bool = False) -> "_InMemoryPipeline":
+        return _InMemoryPipeline(self)
+
+    async def aclose(self) -> None:
+        self._data.clear()
+
+
+class _InMemoryPipeline:
+    def __init__(self, client: InMemoryRedis):
+        self._client = client
+        self._commands = []
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self) -> list:
+        commands, self._commands = self._commands, []
+        return [await getattr(self._client, name)(*args, **kwargs) for name, args, kwargs in commands]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._commands = []
+
+
+class _InMemoryPubSub:
+    def __init__(self, client: InMemoryRedis):
+        self._client = client
+        self.channels: Set[str] = set()
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, *channels: str) -> None:
+        self.channels.update(channels)
+        self._client._subscribers.add(self)
+
+    async def get_message(self, ignore_subscribe_messages: bool = False, timeout: float = 0.0):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self) -> None:
+        self._client._subscribers.discard(self)
+        self.channels.clear()
 
 
 class RedisClient:
-    """Redis cache client (disabled)"""
+    """Redis cache client with graceful degradation"""
 
     def __init__(self):
         self.client = None
+        self.backend = settings.redis_backend
+        self._unavailable_until = 0.0
+        self.last_error: Optional[str] = None
+        # redis 패키지는 REDIS_BACKEND=redis일 때만 import (시작 시간 단축)
+        self._errors: Tuple[type, ...] = (OSError, asyncio.TimeoutError)
+
+    @property
+    def enabled(self) -> bool:
+        return self.client is not None
+
+    @property
+    def available(self) -> bool:
+        return self.client is not None and time.monotonic() >= self._unavailable_until
 
     async def connect(self):
-        """Connect to Redis (disabled)"""
-        pass
+        """Create the client (and check connectivity once)"""
+        if self.backend == "none":
+            return
+        if self.backend == "fake":
+            self.client = InMemoryRedis()
+        elif self.backend == "redis":
+            try:
+                import redis.asyncio as redis
+                from redis.exceptions import RedisError
+            except ImportError:
+                raise RuntimeError("REDIS_BACKEND=redis requires the redis package")
+            self._errors = (RedisError, OSError, asyncio.TimeoutError)
+            pool = redis.ConnectionPool.from_url(
+                settings.redis_url,
+                max_connections=settings.redis_max_connections,
+                socket_timeout=settings.redis_socket_timeout,
+                socket_connect_timeout=settings.redis_socket_timeout,
+                health_check_interval=30
+            )
+            self.client = redis.Redis(connection_pool=pool)
+        else:
+            raise ValueError(f"Unknown REDIS_BACKEND: {self.backend}")
+
+        try:
+            await self.client.ping()
+            print(f"✅ Redis connected ({self.backend})")
+        except self._errors as e:
+            self._mark_unavailable(e)
+            print(f"⚠️ Redis unavailable, continuing without it: {e}")
 
     async def disconnect(self):
-        """Disconnect from Redis (disabled)"""
-        pass
+        """Close the connection pool"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    def _mark_unavailable(self, error: Exception) -> None:
+        self._unavailable_until = time.monotonic() + settings.redis_retry_interval
+        self.last_error = str(error)
 
-    async def get(self, key: str):
-        """Get value from cache (disabled)"""
-        return None
+    async def _call(self, op: str, coro_factory, default=None):
+        if not self.available:
+            REDIS_REQUESTS.inc(op=op, result="skipped")
+            return default
+        try:
+            result = await coro_factory()
+        except self._errors as e:
+            REDIS_REQUESTS.inc(op=op, result="error")
+            self._mark_unavailable(e)
+            print(f"⚠️ Redis {op} failed, bypassing for {settings.redis_retry_interval}s: {e}")
+            return default
+        REDIS_REQUESTS.inc(op=op, result="ok")
+        return result
+
+    async def get(self, key: str) -> Optional[dict]:
+        """Get value from cache"""
+        data = await self._call("get", lambda: self.client.get(key))
+        return payload_codec.decode(data) if data is not None else None
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[dict]]:
+        """Get many values in one round trip (MGET)"""
+        if not keys:
+            return []
+        values = await self._call("mget", lambda: self.client.mget(list(keys)), [None] * len(keys))
+        return [payload_codec.decode(data) if data is not None else None for data in values]
 
     async def set(self, key: str, value: dict, ttl: int = None):
-        """Set value in cache (disabled)"""
-        pass
+        """Set value in cache (TTL defaults to cache_ttl)"""
+        data = payload_codec.encode(value)
+        await self._call("set", lambda: self.client.set(key, data, ex=ttl or settings.cache_ttl))
+
+    async def set_many(self, items: Dict[str, dict], ttl: int = None):
+        """Set many values in one pipelined round trip"""
+        if not items:
+            return
+
+        async def _pipeline():
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.set(key, payload_codec.encode(value), ex=ttl or settings.cache_ttl)
+            return await pipe.execute()
+
+        await self._call("set_many", _pipeline)
 
     async def delete(self, key: str):
-        """Delete key from cache (disabled)"""
-        pass
+        """Delete key from cache"""
+        await self._call("delete", lambda: self.client.delete(key))
+
+    async def delete_many(self, keys: Sequence[str], batch_size: int = 500):
+        """Delete many keys (DEL in batches)"""
+        for start in range(0, len(keys), batch_size):
+            batch = list(keys[start:start + batch_size])
+            await self._call("delete_many", lambda: self.client.delete(*batch))
+
+    async def acquire_lease(self, key: str, token: str, ttl: float) -> Optional[bool]:
+        """SET NX PX lease; None when Redis is unavailable"""
+        acquired = await self._call("lease", lambda: self.client.set(key, token, px=int(ttl * 1000), nx=True))
+        if acquired is None and not self.available:
+            return None
+        return bool(acquired)
+
+    async def release_lease(self, key: str, token: str):
+        """Delete the lease only if this token still owns it"""
+        await self._call("release", lambda: self.client.eval(RELEASE_LEASE_SCRIPT, 1, key, token))
+
+    async def take_tokens(self, key: str, rate: float, burst: float, cost: float = 1.0) -> Optional[Tuple[bool, float]]:
+        """Token bucket take shared by every replica; (allowed, tokens left) or None when unavailable"""
+        result = await self._call("take_tokens", lambda: self.client.eval(TOKEN_BUCKET_SCRIPT, 1, key, rate, burst, cost))
+        if result is None:
+            return None
+        allowed, tokens = result
+        return bool(allowed), float(tokens)
+
+    async def publish(self, channel: str, message: str) -> int:
+        """Publish a message; returns the number of receivers (0 when unavailable)"""
+        return await self._call("publish", lambda: self.client.publish(channel, message), 0)
+
+    async def ping(self) -> bool:
+        """Round trip to the server (False when unavailable or failing)"""
+        return bool(await self._call("ping", lambda: self.client.ping(), False))
 
     async def exists(self, key: str) -> bool:
-        """Check if key exists (disabled)"""
-        return False
+        """Check if key exists"""
+        return bool(await self._call("exists", lambda: self.client.exists(key), 0))
+
+    def status(self) -> dict:
+        return {
+            "backend": self.backend,
+            "enabled": self.enabled,
+            "available": self.available,
+            "last_error": self.last_error
+        }
 
 
-# Global Redis client instance (no-op)
+# Global Redis client instance
 redis_client = RedisClient()
@@ -1,12 +1,14 @@
 from pydantic_settings import BaseSettings
 from typing import Optional
 
+APP_ROLES = {"dress", "venue", "images"}
+
 
 class Settings(BaseSettings):
     """Application configuration settings"""
 
-    # OpenAI
-    openai_api_key: str
+    # OpenAI (dress 역할에서만 필요)
+    openai_api_key: Optional[str] = None
 
     # MySQL (환경변수: DB_HOST, DB_PORT, DB_USERNAME, DB_PASSWORD, DB_NAME)
     db_host: str = "localhost"
@@ -14,25 +16,171 @@ class Settings(BaseSettings):
     db_username: str = "root"
     db_password: str
     db_name: str = "wedding_dress_db"
+    db_url: Optional[str] = None  # 전체 SQLAlchemy URL 직접 지정 (로컬 SQLite 대체 등)
+    db_echo: bool = False  # SQLAlchemy SQL 로그 출력 (디버깅용)
+    slow_query_threshold_ms: float = 200.0  # 이 시간 이상 걸린 쿼리는 느린 쿼리로 기록
+    # 시작 시 create_all 실행 (로컬 개발용, 운영은 python -m src.database.migrate)
+    db_create_tables_on_startup: bool = False
+
+    # Connection pool (워커 1개당 값)
+    # 전체 커넥션 수 = 서버 워커 수 x (db_pool_size + db_max_overflow) < MySQL max_connections
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    # 인스턴스(모든 워커 합계)가 primary에 여는 최대 커넥션 수, 멀티 워커 서버가 워커 수로 나눠 풀 크기를 줄임 (0이면 비활성)
+    db_connection_budget: int = 100
+    db_pool_timeout: float = 30.0  # 커넥션 대기 최대 시간(초)
+    db_pool_recycle: int = 1800  # MySQL wait_timeout보다 짧게 유지(초)
+    db_pool_pre_ping: bool = True
+    db_pool_warmup: int = 2  # 시작 시 미리 열어둘 커넥션 수 (0이면 비활성)
+
+    # Read replicas (쉼표로 구분된 SQLAlchemy URL, 비어 있으면 primary만 사용)
+    db_replica_urls: str = ""
+    db_replica_max_lag: float = 5.0  # 이보다 지연된 replica는 제외(초)
+    db_replica_check_interval: float = 5.0  # 복제 지연 확인 주기(초)
+    db_replica_read_your_writes_window: float = 5.0  # 새 캐시 행 생성 후 그 키를 primary에서 읽는 시간(초)
 
     # Redis
+    redis_backend: str = "none"  # none(비활성) / redis / fake(프로세스 내 대체, 로컬 테스트용)
     redis_host: str = "localhost"
     redis_port: int = 16379
     redis_password: Optional[str] = None
     redis_db: int = 0
+    redis_max_connections: int = 50  # 워커당 커넥션 풀 크기
+    redis_socket_timeout: float = 0.2  # 초과 시 캐시 미스로 처리(초)
+    redis_retry_interval: float = 5.0  # 오류 후 Redis를 건너뛰는 시간(초)
+    redis_warm_memory_cache: bool = True  # 시작 시 Redis 내용으로 프로세스 내 캐시 채우기
+    # 레플리카 간 생성 중복 방지 (Redis 리스 + pub/sub, REDIS_BACKEND=none이면 무시)
+    singleflight_lease_ttl: float = 30.0  # LLM 생성 최대 시간보다 길게(초)
+    singleflight_wait_timeout: float = 25.0  # 다른 레플리카 결과 대기 후 직접 생성(초)
 
     # Application
+    # 이 인스턴스가 제공할 기능 (쉼표로 구분: dress, venue, images) - 필요 없는 클라이언트/백그라운드 작업은 생략
+    app_roles: str = "dress,venue,images"
     app_host: str = "0.0.0.0"
     app_port: int = 8000
     cache_ttl: int = 3600
 
+    # Production server (python -m src.api.server, gunicorn + uvicorn 워커)
+    server_workers: int = 0  # 0이면 사용 가능한 CPU 수 (컨테이너 CPU 제한 반영, server_max_default_workers까지)
+    server_max_default_workers: int = 8  # server_workers=0일 때 워커 수 상한
+    server_max_requests: int = 10000  # 워커가 이만큼 처리하면 재시작 (0이면 비활성)
+    server_max_requests_jitter: int = 1000  # 워커들이 한꺼번에 재시작하지 않도록 분산
+    server_graceful_timeout: int = 30  # 재시작/종료 시 진행 중 요청 대기 시간(초)
+    server_worker_timeout: int = 120  # 응답 없는 워커를 강제 재시작(초) - LLM 호출보다 길게
+    server_keepalive: int = 5  # keep-alive 연결 유지 시간(초)
+
+    # Admission control (워커당 값, 동시 처리 수 0이면 제한 없음)
+    # 캐시 조회(Redis/MySQL)와 생성(LLM/venue SQL)을 별도 풀로 제한해 콜드 키 폭주가 캐시 경로까지 막지 않게 함
+    admission_cache_concurrency: int = 25  # DB 풀 크기(db_pool_size + db_max_overflow) 이하로
+    admission_cache_queue: int = 200  # 대기열이 이보다 길면 즉시 503
+    admission_generation_concurrency: int = 8  # 종류(dress/venue)별 동시 생성 수
+    admission_generation_queue: int = 16
+    admission_queue_timeout: float = 2.0  # 대기열에서 이 시간 안에 슬롯을 못 받으면 503(초)
+    # 생성 풀 포화 시 503 대신 로컬 카탈로그 기반 추천 반환 (dress·venue, 저장하지 않음)
+    admission_degraded_responses: bool = True
+
+    # Per-client rate limit (토큰 버킷, 클라이언트 = 등록된 X-API-Key 또는 IP)
+    # 기본 꺼짐: Spring 백엔드만 호출하는 배포에서는 모든 사용자가 백엔드 IP 하나의 버킷을 공유함
+    # (켤 때는 RATE_LIMIT_API_KEYS + X-End-User-Id 또는 RATE_LIMIT_TRUST_FORWARDED_FOR 설정)
+    rate_limit_enabled: bool = False
+    rate_limit_backend: str = "memory"  # memory(워커별) / redis(레플리카 간 공유, Redis 장애 시 memory)
+    rate_limit_cache_rate: float = 10.0  # 모든 추천 요청: 초당 충전 토큰
+    rate_limit_cache_burst: float = 60.0  # 버킷 크기 (순간 허용량)
+    rate_limit_generation_rate: float = 0.2  # 캐시 미스(생성) 요청: 초당 충전 토큰 (분당 12개)
+    rate_limit_generation_burst: float = 10.0
+    rate_limit_trust_forwarded_for: bool = False  # 로드밸런서 뒤에서만 X-Forwarded-For 사용
+    rate_limit_max_clients: int = 100_000  # 워커당 메모리 버킷 수 상한
+    rate_limit_api_keys: str = ""  # 쉼표로 구분된 유효 API 키 (목록에 없는 X-API-Key는 무시하고 IP로 제한)
+
+    # Response compression (gzip, brotli 패키지가 있으면 br 우선)
+    compression_enabled: bool = True
+    compression_min_size: int = 512  # 이보다 작은 응답은 압축하지 않음(바이트)
+    compression_gzip_level: int = 6  # 즉석 압축 레벨 (메모리 캐시 적중은 항목별로 최고 레벨 압축 후 재사용)
+    compression_brotli_quality: int = 5
+
+    # HTTP caching (GET /recommend, GET /recommend/venue)
+    http_cache_max_age: int = 3600  # 브라우저/CDN 캐시 유지 시간(초)
+    http_cache_stale_while_revalidate: int = 600  # 만료 후 재검증 동안 이전 응답 사용 허용(초)
+    # ETag에 포함되는 카탈로그 버전 - 웨딩홀 테이블 갱신 등 코드 밖 변경 후 올리면 엣지 캐시가 새 응답을 받음
+    recommendation_catalog_version: str = ""
+
+    # In-process recommendation cache (query_key 배열 인덱스)
+    memory_cache_enabled: bool = True
+    memory_cache_flush_interval: float = 10.0  # 메모리 적중 횟수를 DB에 반영하는 주기(초)
+
+    # Recommendation payload compression (none / zlib / zstd)
+    recommendation_codec: str = "none"
+    recommendation_codec_level: int = 3
+    # 쉼표로 구분된 사전 파일 경로 - 첫 번째로 압축, 나머지는 이전 사전으로 쓴 행 읽기용
+    recommendation_codec_dicts: str = ""
+
+    # Cache retention (recommendation_queries / venue_queries)
+    cache_retention_enabled: bool = False  # 백그라운드 만료 작업 실행 여부
+    cache_retention_ttl: int = 30 * 24 * 3600  # 마지막 접근 후 이 시간이 지나면 삭제(초)
+    cache_retention_keep_access_count: Optional[int] = None  # 접근 횟수가 이 이상이면 보존
+    cache_retention_batch_size: int = 500  # 트랜잭션당 삭제 행 수
+    cache_retention_interval: int = 3600  # 실행 주기(초)
+    cache_retention_optimize_every: int = 24  # N회 실행마다 OPTIMIZE TABLE (0이면 비활성)
+    # /stats 집계 재계산 주기(초) - 다른 워커의 변경분 반영용 (0이면 비활성)
+    stats_reconcile_interval: int = 300
+
+    # Analytics events (event_logs)
+    events_enabled: bool = True
+    events_buffer_size: int = 10000  # 초과 시 이벤트를 버림
+    events_batch_size: int = 500  # INSERT 한 번에 쓰는 이벤트 수
+    events_flush_interval: float = 2.0  # 기록 주기(초)
+
+    # Background health checks (/health/* 는 마지막 결과만 반환, 요청 경로에서 DB 풀을 쓰지 않음)
+    health_probe_interval: float = 10.0  # 검사 주기(초)
+    health_probe_timeout: float = 2.0  # 검사당 제한 시간(초)
+    health_probe_stale_after: float = 60.0  # 이 시간 동안 검사가 돌지 않으면 /health/live 실패(초)
+
+    # On-demand request profiling (pyinstrument, 비활성 시 미들웨어 자체를 설치하지 않음)
+    profiling_enabled: bool = False
+    profiling_secret: Optional[str] = None  # X-Profile-Token 서명 키 (없으면 서명 트리거 비활성)
+    profiling_sample_rate: float = 0.0  # 무작위로 프로파일링할 요청 비율 (0.001 = 0.1%)
+    profiling_interval: float = 0.001  # 샘플링 간격(초)
+    profiling_max_concurrent: int = 1  # 워커당 동시에 프로파일링할 요청 수
+    profiling_dir: str = "/tmp/api-profiles"  # speedscope 파일 저장 위치 (워커 간 공유)
+    profiling_max_files: int = 100  # 초과 시 오래된 프로파일부터 삭제
+    profiling_max_mb: int = 200  # 저장 디렉터리 최대 크기(MB)
+
+    metrics_enabled: bool = True  # /metrics (Prometheus) 및 HTTP 요청 지표 기록
+    # 워커별 지표 스냅샷 공유 디렉터리 (비어 있으면 프로세스 하나만 집계, 멀티 워커 서버는 자동 지정)
+    metrics_multiprocess_dir: str = ""
+    metrics_multiprocess_interval: float = 5.0  # 워커 스냅샷 기록 주기(초)
+    debug_endpoints_enabled: bool = False  # /debug/* 진단 엔드포인트 노출 여부
+    admin_endpoints_enabled: bool = False  # /import/*, /cache/* 관리 엔드포인트 노출 여부
+
     # Image Storage
     image_base_path: str = "/data/images"  # 이미지가 저장된 서버 경로
 
     @property
     def mysql_url(self) -> str:
+        if self.db_url:
+            return self.db_url
         return f"mysql+aiomysql://{self.db_username}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
+    @property
+    def roles(self) -> set[str]:
+        roles = {role.strip() for role in self.app_roles.split(",") if role.strip()}
+        unknown = roles - APP_ROLES
+        if unknown:
+            raise ValueError(f"Unknown APP_ROLES: {', '.join(sorted(unknown))}")
+        return roles
+
+    @property
+    def rate_limit_api_key_set(self) -> frozenset[str]:
+        return frozenset(key.strip() for key in self.rate_limit_api_keys.split(",") if key.strip())
+
+    @property
+    def replica_urls(self) -> list[str]:
+        return [url.strip() for url in self.db_replica_urls.split(",") if url.strip()]
+
+    @property
+    def recommendation_codec_dict_paths(self) -> list[str]:
+        return [path.strip() for path in self.recommendation_codec_dicts.split(",") if path.strip()]
+
     @property
     def redis_url(self) -> str:
         if self.redis_password:
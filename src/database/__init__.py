@@ -1,10 +1,15 @@
-from .session import engine, AsyncSessionLocal, init_db, get_db
+from .session import engine, replica_engines, replica_router, AsyncSessionLocal, init_db, get_db
+from .unit_of_work import UnitOfWork, get_unit_of_work
 from .models import RecommendationQuery
 
 __all__ = [
     "engine",
+    "replica_engines",
+    "replica_router",
     "AsyncSessionLocal",
     "init_db",
     "get_db",
+    "UnitOfWork",
+    "get_unit_of_work",
     "RecommendationQuery"
 ]
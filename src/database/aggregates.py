@@ -0,0 +1,249 @@
+"""
+Incrementally maintained statistics for /stats
+
+Repositories update these in-process aggregates as rows are created, hit or
+deleted, so reading stats no longer scans recommendation_queries / surveys.
+A full recompute (the original GROUP BY queries) runs on first use and
+periodically to reconcile with writes made by other workers.
+"""
+import asyncio
+import heapq
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.database.session import AsyncSessionLocal
+from src.database.models import RecommendationQuery, Survey, WeddingDress
+
+BODY_FIELDS = ("arm_length", "leg_length", "neck_length", "face_shape", "body_type")
+POPULAR_LIMIT = 5
+
+
+def _value(value):
+    """Enum member → plain value"""
+    return getattr(value, "value", value)
+
+
+def _body_key(record) -> Tuple[str, ...]:
+    return tuple(_value(getattr(record, field)) for field in BODY_FIELDS)
+
+
+class RecommendationAggregates:
+    """Totals and per-combination access counts for recommendation_queries"""
+
+    def __init__(self):
+        self.loaded = False
+        self.total_queries = 0
+        self.total_accesses = 0
+        self.combinations: Dict[Tuple[str, ...], int] = {}
+
+    def record_created(self, record: RecommendationQuery) -> None:
+        if not self.loaded:
+            return
+        key = _body_key(record)
+        access_count = record.access_count or 0
+        self.total_queries += 1
+        self.total_accesses += access_count
+        self.combinations[key] = self.combinations.get(key, 0) + access_count
+
+    def record_hit(self, record: RecommendationQuery) -> None:
+        self.record_hits(_body_key(record), 1)
+
+    def record_hits(self, key: Tuple[str, ...], hits: int) -> None:
+        """Count hits for one (arm, leg, neck, face, body) combination"""
+        if not self.loaded:
+            return
+        self.total_accesses += hits
+        self.combinations[key] = self.combinations.get(key, 0) + hits
+
+    def invalidate(self) -> None:
+        """Force a full recompute on next read (after bulk deletes)"""
+        self.loaded = False
+
+    async def recompute(self, db: AsyncSession) -> None:
+        """Full recompute from the table (reconciliation)"""
+        total_result = await db.execute(
+            select(func.count(RecommendationQuery.id), func.sum(RecommendationQuery.access_count))
+        )
+        total_queries, total_accesses = total_result.one()
+
+        columns = [getattr(RecommendationQuery, field) for field in BODY_FIELDS]
+        combo_result = await db.execute(
+            select(*columns, func.sum(RecommendationQuery.access_count)).group_by(*columns)
+        )
+
+        self.total_queries = total_queries or 0
+        self.total_accesses = int(total_accesses or 0)
+        self.combinations = {
+            tuple(_value(value) for value in row[:5]): int(row[5] or 0)
+            for row in combo_result
+        }
+        self.loaded = True
+
+    def snapshot(self) -> dict:
+        popular = heapq.nlargest(POPULAR_LIMIT, self.combinations.items(), key=lambda item: item[1])
+        return {
+            "total_unique_queries": self.total_queries,
+            "total_accesses": self.total_accesses,
+            "cache_hit_rate": (
+                (self.total_accesses - self.total_queries) / self.total_accesses
+                if self.total_accesses > 0 else 0
+            ),
+            "popular_combinations": [
+                {**dict(zip(BODY_FIELDS, key)), "access_count": count}
+                for key, count in popular
+            ]
+        }
+
+
+class SurveyAggregates:
+    """Totals, popular body types/dresses and per-field distributions for surveys"""
+
+    def __init__(self):
+        self.loaded = False
+        self.total_surveys = 0
+        self.body_types: Dict[Tuple[str, ...], int] = {}
+        self.dress_counts: Dict[int, int] = {}
+        self.dress_info: Dict[int, Tuple[str, Optional[str]]] = {}
+        self.distribution: Dict[str, Dict[str, int]] = {field: {} for field in BODY_FIELDS}
+
+    def _apply(self, survey: Survey, delta: int) -> None:
+        self.total_surveys += delta
+        key = _body_key(survey)
+        self.body_types[key] = self.body_types.get(key, 0) + delta
+        for field, value in zip(BODY_FIELDS, key):
+            counts = self.distribution[field]
+            counts[value] = counts.get(value, 0) + delta
+        self._apply_dress(survey.dress_id, delta)
+
+    def _apply_dress(self, dress_id: Optional[int], delta: int) -> None:
+        if dress_id is None:
+            return
+        self.dress_counts[dress_id] = self.dress_counts.get(dress_id, 0) + delta
+
+    def record_created(self, survey: Survey) -> None:
+        if not self.loaded:
+            return
+        if survey.dress is not None:
+            self.dress_info[survey.dress.id] = (survey.dress.name, survey.dress.style)
+        self._apply(survey, 1)
+
+    def record_deleted(self, survey: Survey) -> None:
+        if self.loaded:
+            self._apply(survey, -1)
+
+    def record_dress_changed(self, old_dress_id: Optional[int], survey: Survey) -> None:
+        if not self.loaded or old_dress_id == survey.dress_id:
+            return
+        self._apply_dress(old_dress_id, -1)
+        self._apply_dress(survey.dress_id, 1)
+        if survey.dress is not None:
+            self.dress_info[survey.dress.id] = (survey.dress.name, survey.dress.style)
+
+    def invalidate(self) -> None:
+        self.loaded = False
+
+    async def recompute(self, db: AsyncSession) -> None:
+        """Full recompute from the table (reconciliation)"""
+        total_surveys = (await db.execute(select(func.count(Survey.id)))).scalar() or 0
+
+        columns = [getattr(Survey, field) for field in BODY_FIELDS]
+        body_result = await db.execute(
+            select(*columns, func.count(Survey.id)).group_by(*columns)
+        )
+        dress_result = await db.execute(
+            select(Survey.dress_id, WeddingDress.name, WeddingDress.style, func.count(Survey.id))
+            .join(WeddingDress, Survey.dress_id == WeddingDress.id)
+            .where(Survey.dress_id.isnot(None))
+            .group_by(Survey.dress_id, WeddingDress.name, WeddingDress.style)
+        )
+
+        self.total_surveys = total_surveys
+        self.body_types = {
+            tuple(_value(value) for value in row[:5]): row[5]
+            for row in body_result
+        }
+        self.dress_counts = {}
+        self.dress_info = {}
+        for dress_id, name, style, count in dress_result:
+            self.dress_counts[dress_id] = count
+            self.dress_info[dress_id] = (name, style)
+
+        # 분포는 조합별 집계에서 계산 (추가 쿼리 없음)
+        self.distribution = {field: {} for field in BODY_FIELDS}
+        for key, count in self.body_types.items():
+            for field, value in zip(BODY_FIELDS, key):
+                counts = self.distribution[field]
+                counts[value] = counts.get(value, 0) + count
+        self.loaded = True
+
+    def snapshot(self) -> dict:
+        popular_body_types = heapq.nlargest(POPULAR_LIMIT, self.body_types.items(), key=lambda item: item[1])
+        popular_dresses = heapq.nlargest(
+            POPULAR_LIMIT,
+            ((dress_id, count) for dress_id, count in self.dress_counts.items() if count > 0),
+            key=lambda item: item[1]
+        )
+        return {
+            "total_surveys": self.total_surveys,
+            "popular_body_types": [
+                {**dict(zip(BODY_FIELDS, key)), "count": count}
+                for key, count in popular_body_types
+                if count > 0
+            ],
+            "popular_dresses": [
+                {
+                    "dress_id": dress_id,
+                    "dress_name": self.dress_info.get(dress_id, (None, None))[0],
+                    "style": self.dress_info.get(dress_id, (None, None))[1],
+                    "recommendation_count": count
+                }
+                for dress_id, count in popular_dresses
+            ],
+            "distribution": {
+                field: {value: count for value, count in counts.items() if count > 0}
+                for field, counts in self.distribution.items()
+            }
+        }
+
+
+class AggregateReconciler:
+    """Periodically recompute aggregates to pick up writes from other workers"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def reconcile(self) -> None:
+        async with AsyncSessionLocal() as db:
+            await recommendation_aggregates.recompute(db)
+            await survey_aggregates.recompute(db)
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.reconcile()
+            except Exception as e:
+                print(f"⚠️ Stats reconciliation failed: {e}")
+
+    def start(self) -> None:
+        if self.interval > 0:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Global aggregate instances
+recommendation_aggregates = RecommendationAggregates()
+survey_aggregates = SurveyAggregates()
+aggregate_reconciler = AggregateReconciler(settings.stats_reconcile_interval)
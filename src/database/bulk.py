@@ -0,0 +1,43 @@
+"""Multi-row upsert helper"""
+from typing import List
+
+from sqlalchemy import insert
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def upsert_rows(db: AsyncSession, model, rows: List[dict]) -> int:
+    """
+    Insert rows with one multi-row INSERT per key shape
+
+    Rows that carry a primary key id update the existing row
+    (INSERT ... ON DUPLICATE KEY UPDATE on MySQL, ON CONFLICT on SQLite).
+    Does not commit.
+    """
+    if not rows:
+        return 0
+
+    # VALUES 절은 모든 행의 컬럼 구성이 같아야 하므로 id 유무로 나눔
+    with_id = [row for row in rows if row.get("id") is not None]
+    without_id = [{k: v for k, v in row.items() if k != "id"} for row in rows if row.get("id") is None]
+
+    if without_id:
+        await db.execute(insert(model).values(without_id))
+
+    if with_id:
+        dialect = db.get_bind().dialect.name
+        update_columns = [column for column in with_id[0] if column != "id"]
+        if dialect == "mysql":
+            stmt = mysql.insert(model).values(with_id)
+            stmt = stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in update_columns})
+        elif dialect == "sqlite":
+            stmt = sqlite.insert(model).values(with_id)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["id"],
+                set_={column: stmt.excluded[column] for column in update_columns}
+            )
+        else:
+            raise NotImplementedError(f"Upsert is not supported for dialect: {dialect}")
+        await db.execute(stmt)
+
+    return len(rows)
@@ -0,0 +1,151 @@
+"""
+Compressed JSON payload codec for recommendation rows
+
+Stored format: 8-byte header + body
+    b"RC" | version (1) | codec (1) | dictionary id (uint32, 0 = none)
+Rows without the header are plain JSON (uncompressed or written before the
+codec was enabled), so reads are transparent whatever the setting was.
+
+Dictionary training and re-compression: python -m src.database.codec_tools
+"""
+import json
+import struct
+import zlib
+from typing import Dict, List, Optional
+
+from sqlalchemy import LargeBinary
+from sqlalchemy.dialects import mysql
+from sqlalchemy.types import TypeDecorator
+
+from src.config import settings
+
+try:
+    import zstandard
+except ImportError:  # zstd는 선택 의존성 (requirements.txt 참고)
+    zstandard = None
+
+MAGIC = b"RC"
+VERSION = 1
+HEADER = struct.Struct(">2sBBI")
+
+CODEC_NONE = 0
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+CODEC_IDS = {"none": CODEC_NONE, "zlib": CODEC_ZLIB, "zstd": CODEC_ZSTD}
+
+# zlib 사전은 마지막 32KB만 사용됨
+ZLIB_MAX_DICT_SIZE = 32 * 1024
+
+
+def dictionary_id(data: bytes) -> int:
+    # zstandard 설치 여부와 관계없이 같은 값이 나오도록 내용 해시로 식별 (0은 사전 없음)
+    return zlib.crc32(data) or 1
+
+
+class PayloadCodec:
+    """Encode/decode recommendation dicts with an optional shared dictionary"""
+
+    def __init__(self, codec: str = "none", level: int = 3, dictionaries: Optional[List[bytes]] = None):
+        if codec not in CODEC_IDS:
+            raise ValueError(f"Unknown codec: {codec}")
+        if codec == "zstd" and zstandard is None:
+            raise RuntimeError("RECOMMENDATION_CODEC=zstd requires the zstandard package")
+        self.codec = CODEC_IDS[codec]
+        self.level = level
+        # 첫 번째 사전으로 압축, 나머지는 이전에 기록된 행을 읽기 위한 용도
+        self.dictionaries: Dict[int, bytes] = {}
+        for data in dictionaries or []:
+            self.dictionaries[dictionary_id(data)] = data
+        self.dict_id = dictionary_id(dictionaries[0]) if dictionaries else 0
+
+        self._zstd_compressor = None
+        self._zstd_decompressors: Dict[int, object] = {}
+        if self.codec == CODEC_ZSTD:
+            zstd_dict = zstandard.ZstdCompressionDict(dictionaries[0]) if dictionaries else None
+            self._zstd_compressor = zstandard.ZstdCompressor(level=level, dict_data=zstd_dict)
+
+    def encode(self, payload: dict) -> bytes:
+        raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+        if self.codec == CODEC_NONE:
+            return raw
+        if self.codec == CODEC_ZLIB:
+            if self.dict_id:
+                compressor = zlib.compressobj(self.level, zdict=self.dictionaries[self.dict_id][-ZLIB_MAX_DICT_SIZE:])
+            else:
+                compressor = zlib.compressobj(self.level)
+            body = compressor.compress(raw) + compressor.flush()
+        else:
+            body = self._zstd_compressor.compress(raw)
+        return HEADER.pack(MAGIC, VERSION, self.codec, self.dict_id) + body
+
+    def decode(self, data: bytes) -> dict:
+        if data[:2] != MAGIC:
+            return json.loads(data)
+
+        _, version, codec, dict_id = HEADER.unpack_from(data)
+        if version != VERSION:
+            raise ValueError(f"Unsupported payload format version: {version}")
+        body = memoryview(data)[HEADER.size:]
+        dictionary = None
+        if dict_id:
+            dictionary = self.dictionaries.get(dict_id)
+            if dictionary is None:
+                raise ValueError(f"Payload compressed with unknown dictionary id {dict_id}")
+
+        if codec == CODEC_ZLIB:
+            decompressor = (
+                zlib.decompressobj(zdict=dictionary[-ZLIB_MAX_DICT_SIZE:]) if dictionary else zlib.decompressobj()
+            )
+            raw = decompressor.decompress(body) + decompressor.flush()
+        elif codec == CODEC_ZSTD:
+            if zstandard is None:
+                raise RuntimeError("zstd-compressed payload found but zstandard is not installed")
+            decompressor = self._zstd_decompressors.get(dict_id)
+            if decompressor is None:
+                zstd_dict = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+                decompressor = zstandard.ZstdDecompressor(dict_data=zstd_dict)
+                self._zstd_decompressors[dict_id] = decompressor
+            raw = decompressor.decompress(body)
+        else:
+            raw = bytes(body)
+        return json.loads(raw)
+
+
+def load_codec() -> PayloadCodec:
+    """Build the codec from settings (RECOMMENDATION_CODEC*)"""
+    dictionaries = []
+    for path in settings.recommendation_codec_dict_paths:
+        with open(path, "rb") as f:
+            dictionaries.append(f.read())
+    return PayloadCodec(settings.recommendation_codec, settings.recommendation_codec_level, dictionaries)
+
+
+payload_codec = load_codec()
+
+
+class CompressedJSON(TypeDecorator):
+    """JSON payload column stored through payload_codec (MEDIUMBLOB on MySQL)"""
+    impl = LargeBinary
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "mysql":
+            return dialect.type_descriptor(mysql.MEDIUMBLOB())
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value, dialect):
+        return payload_codec.encode(value) if value is not None else None
+
+    def process_result_value(self, value, dialect):
+        return payload_codec.decode(value) if value is not None else None
+
+
+def train_dictionary(samples: List[bytes], size: int, codec: str = "zstd") -> bytes:
+    """Train a shared zstd dictionary, or build a raw dictionary for zlib"""
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("Training a zstd dictionary requires the zstandard package")
+        return zstandard.train_dictionary(size, samples).as_bytes()
+    # zlib: 샘플을 이어 붙인 원시 사전 (끝 32KB만 사용됨)
+    data = b"".join(samples)
+    return data[-min(size, ZLIB_MAX_DICT_SIZE):]
@@ -0,0 +1,94 @@
+"""
+Payload codec tools
+
+Train a shared dictionary from existing rows, then rewrite them:
+    python -m src.database.codec_tools train --output /data/codec/recommendations.dict
+    RECOMMENDATION_CODEC=zstd RECOMMENDATION_CODEC_DICTS=/data/codec/recommendations.dict \
+        python -m src.database.codec_tools recompress
+"""
+import argparse
+import asyncio
+import json
+from typing import List
+
+from sqlalchemy import bindparam, select, update
+
+from src.database.session import AsyncSessionLocal, engine
+from src.database.models import RecommendationQuery, VenueQuery
+from src.database.codec import train_dictionary, zstandard, dictionary_id
+
+
+async def load_samples(limit: int) -> List[bytes]:
+    """Most recent payloads of each cache table as compact JSON bytes"""
+    samples = []
+    async with AsyncSessionLocal() as db:
+        for model in (RecommendationQuery, VenueQuery):
+            result = await db.execute(select(model.recommendation).order_by(model.id.desc()).limit(limit))
+            samples.extend(
+                json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+                for payload in result.scalars()
+            )
+    return samples
+
+
+async def recompress(batch_size: int = 500) -> dict:
+    """Rewrite stored payloads with the current codec/dictionary in batches"""
+    report = {}
+    for model in (RecommendationQuery, VenueQuery):
+        last_id, rewritten = 0, 0
+        while True:
+            async with engine.begin() as conn:
+                rows = (await conn.execute(
+                    select(model.id, model.recommendation)
+                    .where(model.id > last_id)
+                    .order_by(model.id)
+                    .limit(batch_size)
+                )).all()
+                if not rows:
+                    break
+                # 읽을 때 복호화, 쓸 때 현재 설정으로 다시 압축됨
+                await conn.execute(
+                    update(model).where(model.id == bindparam("b_id")).values(recommendation=bindparam("b_payload")),
+                    [{"b_id": row.id, "b_payload": row.recommendation} for row in rows]
+                )
+            last_id = rows[-1].id
+            rewritten += len(rows)
+        report[model.__tablename__] = rewritten
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recommendation payload codec tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    train = subparsers.add_parser("train", help="Train a shared dictionary from stored recommendations")
+    train.add_argument("--output", required=True)
+    train.add_argument("--size", type=int, default=16 * 1024, help="Dictionary size in bytes")
+    train.add_argument("--samples", type=int, default=2000, help="Rows to sample per table")
+    train.add_argument("--codec", choices=["zstd", "zlib"], default="zstd" if zstandard is not None else "zlib")
+    rewrite = subparsers.add_parser("recompress", help="Rewrite stored payloads with the current codec")
+    rewrite.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    async def _run(coro):
+        try:
+            return await coro
+        finally:
+            await engine.dispose()
+
+    if args.command == "recompress":
+        report = asyncio.run(_run(recompress(args.batch_size)))
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    samples = asyncio.run(_run(load_samples(args.samples)))
+    if not samples:
+        parser.error("No stored recommendations to train on")
+    dictionary = train_dictionary(samples, args.size, args.codec)
+    with open(args.output, "wb") as f:
+        f.write(dictionary)
+    print(f"✅ Dictionary written: {args.output} ({len(dictionary)} bytes, id={dictionary_id(dictionary)}, "
+          f"{len(samples)} samples)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""SQL statement timing instrumentation (SQLAlchemy event hooks)"""
+import logging
+import re
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.config import settings
+from src.services.metrics import Histogram, current_route
+
+logger = logging.getLogger(__name__)
+
+SQL_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "SQL statement execution time",
+    labelnames=("route", "operation")
+)
+SQL_QUERY_ROWS = Histogram(
+    "db_query_rows",
+    "Rows returned or affected per SQL statement",
+    labelnames=("route", "operation"),
+    buckets=(0, 1, 5, 10, 50, 100, 500, 1000, 5000)
+)
+
+# 느린 쿼리 최근 기록 (메모리 상한 고정)
+SLOW_QUERY_LOG_SIZE = 100
+# 느린 쿼리 스택 트레이스에 남길 최대 프레임 수
+SLOW_QUERY_STACK_LIMIT = 15
+# 집계할 최대 문장 수, 초과분은 OTHER_STATEMENTS 하나로 합산
+MAX_TRACKED_STATEMENTS = 1000
+OTHER_STATEMENTS = "<other statements>"
+
+# 바인드 자리표시자 목록 "(?, ?, ?)" / "(%s, %s)" / "(:a, :b)" 및 반복되는 VALUES 행
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|:\w+)"
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+_REPEATED_ROWS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+
+
+class StatementStats:
+    """Aggregated timings for one SQL statement text"""
+    __slots__ = ("calls", "total_time", "max_time", "rows", "routes")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.rows = 0
+        self.routes: Dict[str, int] = {}
+
+    def to_dict(self, statement: str) -> dict:
+        return {
+            "statement": statement,
+            "calls": self.calls,
+            "total_ms": round(self.total_time * 1000, 3),
+            "mean_ms": round(self.total_time * 1000 / self.calls, 3) if self.calls else 0,
+            "max_ms": round(self.max_time * 1000, 3),
+            "rows": self.rows,
+            "routes": dict(self.routes)
+        }
+
+
+_statement_stats: Dict[str, StatementStats] = {}
+_slow_queries: deque = deque(maxlen=SLOW_QUERY_LOG_SIZE)
+
+
+def _collapse_lists(statement: str) -> str:
+    return _REPEATED_ROWS.sub("(...)", _PLACEHOLDER_LIST.sub("(...)", statement))
+
+
+_collapse_lists_cached = lru_cache(maxsize=1024)(_collapse_lists)
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Collapse variable-length placeholder lists so one logical statement maps to one key
+
+    IN lists of any length and multi-row VALUES (bulk import, delete_by_keys,
+    retention) become "(...)"; otherwise every list length would be a new key.
+    """
+    # 반복되는 짧은 문장만 캐시 (대량 VALUES 문장을 캐시에 붙잡아 두지 않도록)
+    if len(statement) > 1000:
+        return _collapse_lists(statement)
+    return _collapse_lists_cached(statement)
+
+
+def _operation(statement: str) -> str:
+    """Get the SQL verb (SELECT/INSERT/UPDATE/...) of a statement"""
+    head = statement.lstrip().split(None, 1)
+    return head[0].upper() if head else "UNKNOWN"
+
+
+def _param_shape(parameters: Any, executemany: bool) -> Any:
+    """Describe bind parameters by type only, never by value"""
+    if executemany and isinstance(parameters, (list, tuple)):
+        return {
+            "executemany": len(parameters),
+            "first": _param_shape(parameters[0], False) if parameters else None
+        }
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def _app_stack() -> List[str]:
+    """Get the call stack, preferring frames from application code"""
+    frames = traceback.extract_stack()[:-3]
+    app_frames = [frame for frame in frames if "/src/" in frame.filename]
+    return traceback.format_list((app_frames or frames)[-SLOW_QUERY_STACK_LIMIT:])
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    route = current_route()
+    operation = _operation(statement)
+    rows = max(cursor.rowcount, 0) if cursor.rowcount is not None else 0
+
+    SQL_QUERY_DURATION.observe(elapsed, route=route, operation=operation)
+    SQL_QUERY_ROWS.observe(rows, route=route, operation=operation)
+
+    normalized = normalize_statement(statement)
+    stats = _statement_stats.get(normalized)
+    if stats is None:
+        if len(_statement_stats) >= MAX_TRACKED_STATEMENTS:
+            normalized = OTHER_STATEMENTS
+            stats = _statement_stats.get(normalized)
+        if stats is None:
+            stats = _statement_stats[normalized] = StatementStats()
+    stats.calls += 1
+    stats.total_time += elapsed
+    stats.rows += rows
+    stats.routes[route] = stats.routes.get(route, 0) + 1
+    if elapsed > stats.max_time:
+        stats.max_time = elapsed
+
+    if elapsed * 1000 >= settings.slow_query_threshold_ms:
+        entry = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "duration_ms": round(elapsed * 1000, 3),
+            "route": route,
+            "statement": normalized,
+            "parameters": _param_shape(parameters, executemany),
+            "stack": _app_stack()
+        }
+        _slow_queries.append(entry)
+        logger.warning(
+            "Slow query (%.1f ms, route=%s): %s",
+            entry["duration_ms"], route, " ".join(normalized.split())
+        )
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Attach timing hooks to an async engine"""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
+
+
+def top_statements(limit: int = 20, order_by: str = "total_ms") -> List[dict]:
+    """Get the top-N statements by total_ms, mean_ms, max_ms or calls"""
+    rows = [stats.to_dict(statement) for statement, stats in _statement_stats.items()]
+    rows.sort(key=lambda row: row[order_by], reverse=True)
+    return rows[:limit]
+
+
+def slow_queries() -> List[dict]:
+    """Get recent slow queries (newest first)"""
+    return list(reversed(_slow_queries))
+
+
+def reset_statement_stats() -> None:
+    """Clear aggregated statement stats and the slow query log"""
+    _statement_stats.clear()
+    _slow_queries.clear()
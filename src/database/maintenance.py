@@ -0,0 +1,244 @@
+"""
+Cache table retention (TTL expiry, batched deletes, index rebuilds)
+
+Deleted rows are also removed from Redis and, through the invalidation
+channel, from every running replica's memory cache. The CLI therefore needs
+Redis; it refuses to delete when Redis is unreachable unless
+--skip-invalidation is given (replicas then serve purged rows until restart).
+
+Usage:
+    python -m src.database.maintenance --dry-run
+    python -m src.database.maintenance --optimize
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional, Type
+
+from sqlalchemy import select, delete, func, text, or_
+
+from src.config import settings
+from src.config.redis import redis_client
+from src.database.session import engine
+from src.database.models import RecommendationQuery, VenueQuery
+from src.database.aggregates import recommendation_aggregates
+from src.services.recommendation_cache import dress_cache, venue_cache
+from src.services.cache_coordination import cache_coordinator
+
+CACHE_MODELS: List[Type] = [RecommendationQuery, VenueQuery]
+# 삭제된 행은 Redis와 모든 레플리카의 프로세스 내 캐시에서도 제거
+MEMORY_CACHES = {RecommendationQuery: dress_cache, VenueQuery: venue_cache}
+
+# 배치 사이 대기 시간(초) - 다른 트래픽과 복제가 따라올 틈을 줌
+BATCH_PAUSE = 0.05
+
+# 여러 워커/컨테이너 중 하나만 실행하도록 잡는 MySQL 네임드 락
+RETENTION_LOCK_NAME = "cache_retention"
+
+
+def _expired_condition(model, cutoff: datetime, keep_access_count: Optional[int]):
+    """Rows not accessed since cutoff (and not popular enough to keep)"""
+    condition = or_(model.last_accessed < cutoff, model.last_accessed.is_(None) & (model.created_at < cutoff))
+    if keep_access_count is not None:
+        condition = condition & (func.coalesce(model.access_count, 0) < keep_access_count)
+    return condition
+
+
+async def _estimate_bytes(conn, model, row_count: int) -> Optional[int]:
+    """Estimate on-disk bytes for row_count rows (MySQL only)"""
+    if conn.dialect.name != "mysql" or row_count == 0:
+        return 0 if row_count == 0 else None
+    result = await conn.execute(
+        text(
+            "SELECT AVG_ROW_LENGTH FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name"
+        ),
+        {"table_name": model.__tablename__}
+    )
+    avg_row_length = result.scalar()
+    return int(avg_row_length * row_count) if avg_row_length else None
+
+
+async def expire_table(
+    model,
+    ttl: int,
+    keep_access_count: Optional[int] = None,
+    batch_size: int = 500,
+    dry_run: bool = False
+) -> dict:
+    """
+    Delete cache rows whose last access is older than ttl seconds
+
+    Deletes run in short transactions of at most batch_size rows so InnoDB
+    row locks are held only briefly.
+    """
+    cutoff = datetime.utcnow() - timedelta(seconds=ttl)
+    condition = _expired_condition(model, cutoff, keep_access_count)
+
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            select(
+                func.count(model.id),
+                func.coalesce(func.sum(func.length(model.recommendation)), 0)
+            ).where(condition)
+        )
+        row_count, payload_bytes = result.one()
+        estimated_bytes = await _estimate_bytes(conn, model, row_count)
+
+    report = {
+        "table": model.__tablename__,
+        "cutoff": cutoff.isoformat(),
+        "rows": row_count,
+        "payload_bytes": int(payload_bytes),
+        "estimated_bytes": estimated_bytes,
+        "deleted": 0,
+        "batches": 0,
+        "dry_run": dry_run
+    }
+    if dry_run or row_count == 0:
+        return report
+
+    start = time.perf_counter()
+    while True:
+        async with engine.begin() as conn:
+            rows = (await conn.execute(
+                select(model.id, model.query_key).where(condition).order_by(model.id).limit(batch_size)
+            )).all()
+            if not rows:
+                break
+            ids = [row.id for row in rows]
+            await conn.execute(delete(model).where(model.id.in_(ids)))
+        await cache_coordinator.invalidate(MEMORY_CACHES[model], [row.query_key for row in rows])
+        report["deleted"] += len(ids)
+        report["batches"] += 1
+        if len(ids) < batch_size:
+            break
+        await asyncio.sleep(BATCH_PAUSE)
+
+    report["elapsed_seconds"] = round(time.perf_counter() - start, 3)
+    if model is RecommendationQuery and report["deleted"]:
+        recommendation_aggregates.invalidate()
+    return report
+
+
+async def optimize_tables() -> List[dict]:
+    """Rebuild cache table indexes and reclaim space (OPTIMIZE TABLE on MySQL)"""
+    results = []
+    async with engine.connect() as conn:
+        for model in CACHE_MODELS:
+            if conn.dialect.name == "mysql":
+                result = await conn.execute(text(f"OPTIMIZE TABLE {model.__tablename__}"))
+                status = [dict(row) for row in result.mappings()]
+            else:
+                status = "skipped (not MySQL)"
+            results.append({"table": model.__tablename__, "status": status})
+    return results
+
+
+async def run_retention(dry_run: bool = False, optimize: bool = False) -> dict:
+    """Expire every cache table once (and optionally rebuild indexes)"""
+    async with engine.connect() as lock_conn:
+        if lock_conn.dialect.name == "mysql" and not dry_run:
+            acquired = (await lock_conn.execute(
+                text("SELECT GET_LOCK(:name, 0)"), {"name": RETENTION_LOCK_NAME}
+            )).scalar()
+            if not acquired:
+                return {"skipped": "another process is running retention"}
+
+        try:
+            tables = [
+                await expire_table(
+                    model,
+                    settings.cache_retention_ttl,
+                    settings.cache_retention_keep_access_count,
+                    settings.cache_retention_batch_size,
+                    dry_run
+                )
+                for model in CACHE_MODELS
+            ]
+            report = {
+                "tables": tables,
+                "rows": sum(table["rows"] for table in tables),
+                "payload_bytes": sum(table["payload_bytes"] for table in tables)
+            }
+            if optimize and not dry_run:
+                report["optimize"] = await optimize_tables()
+            return report
+        finally:
+            if lock_conn.dialect.name == "mysql" and not dry_run:
+                await lock_conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": RETENTION_LOCK_NAME})
+
+
+class RetentionScheduler:
+    """Run cache retention periodically in the background"""
+
+    def __init__(self, interval: float, optimize_every: int):
+        self.interval = interval
+        self.optimize_every = optimize_every
+        self.runs = 0
+        self.last_report: Optional[dict] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self.runs += 1
+            optimize = self.optimize_every > 0 and self.runs % self.optimize_every == 0
+            try:
+                self.last_report = await run_retention(optimize=optimize)
+            except Exception as e:
+                self.last_report = {"error": str(e)}
+                print(f"⚠️ Cache retention failed: {e}")
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+retention_scheduler = RetentionScheduler(
+    settings.cache_retention_interval,
+    settings.cache_retention_optimize_every
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Expire old rows from recommendation cache tables")
+    parser.add_argument("--dry-run", action="store_true", help="Report rows/bytes that would be reclaimed")
+    parser.add_argument("--optimize", action="store_true", help="Rebuild indexes after deleting")
+    parser.add_argument(
+        "--skip-invalidation", action="store_true",
+        help="Delete even when Redis is unreachable (replicas keep serving purged rows from memory)"
+    )
+    args = parser.parse_args()
+
+    async def _run():
+        # 삭제한 키를 Redis에서 지우고 다른 레플리카에 무효화를 알리려면 연결 필요
+        await redis_client.connect()
+        try:
+            if not args.dry_run and not redis_client.available and not args.skip_invalidation:
+                sys.exit(
+                    f"⚠️ Redis unavailable (REDIS_BACKEND={redis_client.backend}): deleted rows could not be "
+                    "invalidated on running replicas. Fix Redis or pass --skip-invalidation."
+                )
+            return await run_retention(dry_run=args.dry_run, optimize=args.optimize)
+        finally:
+            await redis_client.disconnect()
+            await engine.dispose()
+
+    report = asyncio.run(_run())
+    print(json.dumps(report, ensure_ascii=False, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Schema creation command (replaces create_all on every startup)
+
+Creates the tables defined in src/database/models.py that do not exist yet;
+existing tables are left untouched. Column changes on existing MySQL
+databases are applied with scripts/db/migrations/*.sql.
+
+Usage:
+    python -m src.database.migrate
+    python -m src.database.migrate --dry-run
+"""
+import argparse
+import asyncio
+
+from sqlalchemy import inspect
+
+from src.database.session import Base, engine
+from src.database import models  # noqa: F401  (모델을 Base.metadata에 등록)
+
+
+async def create_missing_tables(dry_run: bool = False) -> list[str]:
+    """Create missing tables; returns their names"""
+    async with engine.begin() as conn:
+        existing = await conn.run_sync(lambda sync_conn: set(inspect(sync_conn).get_table_names()))
+        missing = [table.name for table in Base.metadata.sorted_tables if table.name not in existing]
+        if missing and not dry_run:
+            await conn.run_sync(Base.metadata.create_all)
+    return missing
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Create missing database tables")
+    parser.add_argument("--dry-run", action="store_true", help="Only list tables that would be created")
+    args = parser.parse_args()
+
+    async def _run():
+        try:
+            return await create_missing_tables(args.dry_run)
+        finally:
+            await engine.dispose()
+
+    missing = asyncio.run(_run())
+    if not missing:
+        print("✅ Schema up to date")
+    elif args.dry_run:
+        print(f"Would create: {', '.join(missing)}")
+    else:
+        print(f"✅ Created: {', '.join(missing)}")
+
+
+if __name__ == "__main__":
+    main()
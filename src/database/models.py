@@ -1,7 +1,20 @@
 """SQLAlchemy database models"""
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Index
+from sqlalchemy import (
+    Column, Integer, SmallInteger, BigInteger, String, Text, Numeric, Boolean, Date, DateTime, JSON, Index,
+    Enum, ForeignKey
+)
+from sqlalchemy.orm import relationship
 from datetime import datetime
 from src.database.session import Base
+from src.database.codec import CompressedJSON
+from src.services.schemas import (
+    ArmLength, LegLength, NeckLength, FaceShape, BodyType, GuestCount, Budget, Region, VenueStyle, Season
+)
+
+
+def _enum_column(enum_class):
+    """MySQL ENUM column storing the enum values (not member names)"""
+    return Enum(enum_class, values_callable=lambda members: [member.value for member in members])
 
 
 class RecommendationQuery(Base):
@@ -9,17 +22,18 @@ class RecommendationQuery(Base):
     __tablename__ = "recommendation_queries"
 
     id = Column(Integer, primary_key=True, index=True)
-    query_hash = Column(String(64), unique=True, index=True, nullable=False)
+    # DRESS_KEYS로 인코딩한 (arm, leg, neck, face, body, num) 조합 번호 (src/services/query_keys.py)
+    query_key = Column(SmallInteger, unique=True, nullable=False)
 
-    # Input parameters
-    arm_length = Column(String(20), nullable=False)
-    leg_length = Column(String(20), nullable=False)
-    neck_length = Column(String(20), nullable=False)
-    face_shape = Column(String(20), nullable=False)
-    body_type = Column(String(20), nullable=False)
+    # Input parameters (ENUM - 1바이트 코드로 저장, 조회 시 Enum 멤버)
+    arm_length = Column(_enum_column(ArmLength), nullable=False)
+    leg_length = Column(_enum_column(LegLength), nullable=False)
+    neck_length = Column(_enum_column(NeckLength), nullable=False)
+    face_shape = Column(_enum_column(FaceShape), nullable=False)
+    body_type = Column(_enum_column(BodyType), nullable=False)
 
-    # Result
-    recommendation = Column(JSON, nullable=False)
+    # Result (RECOMMENDATION_CODEC 설정에 따라 압축 저장)
+    recommendation = Column(CompressedJSON, nullable=False)
 
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -36,17 +50,18 @@ class VenueQuery(Base):
     __tablename__ = "venue_queries"
 
     id = Column(Integer, primary_key=True, index=True)
-    query_hash = Column(String(64), unique=True, index=True, nullable=False)
+    # VENUE_KEYS로 인코딩한 (guest_count, budget, region, style, season, num) 조합 번호
+    query_key = Column(SmallInteger, unique=True, nullable=False)
 
-    # Input parameters
-    guest_count = Column(String(20), nullable=False)
-    budget = Column(String(20), nullable=False)
-    region = Column(String(20), nullable=False)
-    style_preference = Column(String(20), nullable=False)
-    season = Column(String(20), nullable=False)
+    # Input parameters (ENUM - 한글 값도 1바이트 코드로 저장)
+    guest_count = Column(_enum_column(GuestCount), nullable=False)
+    budget = Column(_enum_column(Budget), nullable=False)
+    region = Column(_enum_column(Region), nullable=False)
+    style_preference = Column(_enum_column(VenueStyle), nullable=False)
+    season = Column(_enum_column(Season), nullable=False)
 
-    # Result
-    recommendation = Column(JSON, nullable=False)
+    # Result (RECOMMENDATION_CODEC 설정에 따라 압축 저장)
+    recommendation = Column(CompressedJSON, nullable=False)
 
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -56,3 +71,71 @@ class VenueQuery(Base):
     __table_args__ = (
         Index('idx_venue_params', 'guest_count', 'budget', 'region', 'style_preference', 'season'),
     )
+
+
+class EventLog(Base):
+    """Analytics events (written in batches by the event pipeline)"""
+    __tablename__ = "event_logs"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    event_type = Column(String(50), nullable=False, index=True)
+    # 드레스 추천(recommendation_queries)의 query_key만 저장, 웨딩홀 키는 metadata에 저장
+    query_key = Column(SmallInteger, index=True)
+    user_id = Column(String(100))
+    event_metadata = Column("metadata", JSON, key="event_metadata")
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+
+class WeddingDress(Base):
+    """Wedding dress catalog (scripts/db/init.sql: wedding_dresses)"""
+    __tablename__ = "wedding_dresses"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(255), nullable=False)
+    description = Column(Text)
+    price = Column(Numeric(10, 2))
+    style = Column(String(100), index=True)
+    size = Column(String(50))
+    color = Column(String(50))
+    fabric = Column(String(100))
+    availability = Column(Boolean, default=True, index=True)
+    image_url = Column(String(500))
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        # available_only 키셋 페이지네이션용
+        Index('idx_availability_id', 'availability', 'id'),
+    )
+
+
+class Survey(Base):
+    """Anonymous body measurement surveys (scripts/db/init.sql: surveys)"""
+    __tablename__ = "surveys"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Body measurements
+    arm_length = Column(_enum_column(ArmLength), nullable=False)
+    leg_length = Column(_enum_column(LegLength), nullable=False)
+    neck_length = Column(_enum_column(NeckLength), nullable=False)
+    face_shape = Column(_enum_column(FaceShape), nullable=False)
+    body_type = Column(_enum_column(BodyType), nullable=False)
+
+    # Recommended dress
+    dress_id = Column(Integer, ForeignKey("wedding_dresses.id", ondelete="SET NULL"), index=True)
+    dress = relationship(WeddingDress)
+
+    # Event information
+    event_date = Column(Date)
+    notes = Column(Text)
+
+    # Metadata
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_body_type', 'arm_length', 'leg_length', 'neck_length', 'face_shape', 'body_type'),
+        # 최신순 키셋 페이지네이션용
+        Index('idx_created_at_id', 'created_at', 'id'),
+    )
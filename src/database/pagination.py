@@ -0,0 +1,52 @@
+"""Opaque cursor tokens for keyset pagination"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Tuple, Type
+
+CURSOR_VERSION = 1
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row into an opaque token"""
+    payload = [CURSOR_VERSION] + [
+        {"dt": value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _decode_value(value: Any, expected: Type) -> Any:
+    if expected is datetime:
+        if not isinstance(value, dict) or not isinstance(value.get("dt"), str):
+            raise ValueError("Expected a datetime")
+        return datetime.fromisoformat(value["dt"])
+    # bool은 int의 하위 클래스이므로 따로 거부
+    if not isinstance(value, expected) or isinstance(value, bool):
+        raise ValueError(f"Expected {expected.__name__}")
+    return value
+
+
+def decode_cursor(token: Optional[str], types: Tuple[Type, ...]) -> Optional[Tuple[Any, ...]]:
+    """
+    Decode a cursor token back into its sort key values
+
+    Args:
+        token: Cursor from a previous page (None / empty for the first page)
+        types: Expected type of each sort key value (datetime, int, ...)
+
+    Raises:
+        ValueError: malformed token, wrong number of values or a value of the wrong type
+    """
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or payload[:1] != [CURSOR_VERSION] or len(payload) != len(types) + 1:
+            raise ValueError("Unexpected cursor layout")
+        # 값 변환까지 try 안에서 해야 형식이 맞지 않는 값도 500이 아닌 잘못된 커서로 처리됨
+        return tuple(_decode_value(value, expected) for value, expected in zip(payload[1:], types))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
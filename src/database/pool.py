@@ -0,0 +1,91 @@
+"""Instrumented connection pool"""
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.services.metrics import Counter, Gauge, Histogram
+
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection (includes pre-ping and overflow connect)",
+    labelnames=("pool",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0)
+)
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that failed because the pool and overflow were exhausted",
+    labelnames=("pool",)
+)
+POOL_CHECKED_OUT = Gauge("db_pool_checked_out", "Connections currently checked out", labelnames=("pool",))
+POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Overflow connections currently open beyond pool_size",
+    labelnames=("pool",)
+)
+POOL_CHECKED_IN = Gauge("db_pool_checked_in", "Idle connections in the pool", labelnames=("pool",))
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout waits and occupancy"""
+    # 메트릭 라벨 (primary, replica0, ...)
+    metrics_label = "primary"
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.inc(pool=self.metrics_label)
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start, pool=self.metrics_label)
+            self._update_gauges()
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self._update_gauges()
+
+    def recreate(self):
+        # engine.dispose() 이후에도 라벨 유지
+        new_pool = super().recreate()
+        new_pool.metrics_label = self.metrics_label
+        return new_pool
+
+    def _update_gauges(self) -> None:
+        POOL_CHECKED_OUT.set(self.checkedout(), pool=self.metrics_label)
+        POOL_OVERFLOW.set(max(self.overflow(), 0), pool=self.metrics_label)
+        POOL_CHECKED_IN.set(self.checkedin(), pool=self.metrics_label)
+
+
+def pool_status(engine: AsyncEngine) -> dict:
+    """Get current pool occupancy"""
+    pool = engine.pool
+    label = getattr(pool, "metrics_label", "primary")
+    return {
+        "pool": label,
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "checkout_timeouts": POOL_CHECKOUT_TIMEOUTS.value(pool=label),
+        "checkout_wait": [
+            series for series in POOL_CHECKOUT_WAIT.snapshot()
+            if series["labels"]["pool"] == label
+        ]
+    }
+
+
+async def warm_up_pool(engine: AsyncEngine, num_connections: int) -> int:
+    """Open connections up front so the first requests don't pay connect cost"""
+    num_connections = min(num_connections, engine.pool.size())
+    connections = []
+    try:
+        # 모두 연 상태로 유지해야 서로 다른 커넥션이 생성됨
+        for _ in range(num_connections):
+            connections.append(await engine.connect())
+    finally:
+        for connection in connections:
+            await connection.close()
+    return len(connections)
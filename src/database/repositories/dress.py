@@ -1,21 +1,23 @@
 """Repository for recommendation queries"""
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, delete
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from src.database.models import RecommendationQuery
+from src.database.aggregates import recommendation_aggregates
 
 
 class RecommendationRepository:
     """Handle database operations for recommendations"""
 
     @staticmethod
-    async def get_by_hash(db: AsyncSession, query_hash: str) -> Optional[RecommendationQuery]:
-        """Get recommendation by hash"""
+    async def get_by_key(db: AsyncSession, query_key: int) -> Optional[RecommendationQuery]:
+        """Get recommendation by query key"""
         result = await db.execute(
             select(RecommendationQuery).where(
-                RecommendationQuery.query_hash == query_hash
+                RecommendationQuery.query_key == query_key
             )
         )
         query_record = result.scalar_one_or_none()
@@ -31,13 +33,14 @@ class RecommendationRepository:
                 )
             )
             await db.commit()
+            recommendation_aggregates.record_hit(query_record)
 
         return query_record
 
     @staticmethod
     async def create(
         db: AsyncSession,
-        query_hash: str,
+        query_key: int,
         arm_length: str,
         leg_length: str,
         neck_length: str,
@@ -45,9 +48,14 @@ class RecommendationRepository:
         recommendation: dict,
         body_type: str
     ) -> RecommendationQuery:
-        """Create new recommendation record"""
+        """
+        Create new recommendation record
+
+        If another worker stored the same query_key first (no Redis lease to
+        coordinate them), the existing row is returned instead.
+        """
         query_record = RecommendationQuery(
-            query_hash=query_hash,
+            query_key=query_key,
             arm_length=arm_length,
             leg_length=leg_length,
             neck_length=neck_length,
@@ -57,63 +65,35 @@ class RecommendationRepository:
             access_count=1
         )
         db.add(query_record)
-        await db.commit()
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            existing = await RecommendationRepository.get_by_key(db, query_key)
+            if existing is None:
+                raise
+            return existing
         await db.refresh(query_record)
+        recommendation_aggregates.record_created(query_record)
         return query_record
 
     @staticmethod
-    async def get_stats(db: AsyncSession) -> dict:
-        """Get recommendation statistics"""
-        # Total queries
-        total_result = await db.execute(
-            select(func.count(RecommendationQuery.id))
-        )
-        total_queries = total_result.scalar()
-
-        # Total accesses
-        access_result = await db.execute(
-            select(func.sum(RecommendationQuery.access_count))
-        )
-        total_accesses = access_result.scalar() or 0
-
-        # Most popular combinations
-        popular_result = await db.execute(
-            select(
-                RecommendationQuery.arm_length,
-                RecommendationQuery.leg_length,
-                RecommendationQuery.neck_length,
-                RecommendationQuery.face_shape,
-                RecommendationQuery.body_type,
-                func.sum(RecommendationQuery.access_count).label('total_access')
-            )
-            .group_by(
-                RecommendationQuery.arm_length,
-                RecommendationQuery.leg_length,
-                RecommendationQuery.neck_length,
-                RecommendationQuery.face_shape,
-                RecommendationQuery.body_type
-            )
-            .order_by(func.sum(RecommendationQuery.access_count).desc())
-            .limit(5)
-        )
-        popular_combinations = [
-            {
-                "arm_length": row[0],
-                "leg_length": row[1],
-                "neck_length": row[2],
-                "face_shape": row[3],
-                "body_type": row[4],
-                "access_count": row[5]
-            }
-            for row in popular_result
-        ]
+    async def delete_by_keys(db: AsyncSession, query_keys: Optional[List[int]] = None) -> int:
+        """Delete stored recommendations (all rows when query_keys is None)"""
+        stmt = delete(RecommendationQuery)
+        if query_keys is not None:
+            stmt = stmt.where(RecommendationQuery.query_key.in_(query_keys))
+        result = await db.execute(stmt)
+        await db.commit()
+        recommendation_aggregates.invalidate()
+        return result.rowcount
 
-        return {
-            "total_unique_queries": total_queries,
-            "total_accesses": total_accesses,
-            "cache_hit_rate": (total_accesses - total_queries) / total_accesses if total_accesses > 0 else 0,
-            "popular_combinations": popular_combinations
-        }
+    @staticmethod
+    async def get_stats(db: AsyncSession) -> dict:
+        """Get recommendation statistics (from incrementally maintained aggregates)"""
+        if not recommendation_aggregates.loaded:
+            await recommendation_aggregates.recompute(db)
+        return recommendation_aggregates.snapshot()
 
 
 # Global repository instance
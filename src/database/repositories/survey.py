@@ -1,10 +1,14 @@
 """Repository for survey operations"""
-from sqlalchemy import select, update, func
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
+from datetime import datetime
 
-from src.database.models import Survey, WeddingDress
+from src.database.models import Survey
+from src.database.aggregates import survey_aggregates
+from src.database.pagination import encode_cursor, decode_cursor
+from src.database.bulk import upsert_rows
 from src.services.schemas import SurveyCreate, SurveyUpdate
 
 
@@ -38,6 +42,46 @@ class SurveyRepository:
         result = await db.execute(query)
         return list(result.scalars().all())
 
+    @staticmethod
+    async def get_page(
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        load_dress: bool = False
+    ) -> Tuple[List[Survey], Optional[str]]:
+        """
+        Get surveys newest first with keyset pagination on (created_at, id)
+
+        Unlike get_all, deep pages cost the same as the first page because
+        the index idx_created_at_id seeks straight to the cursor.
+
+        Returns:
+            (surveys, next_cursor) - next_cursor is None on the last page
+
+        Raises:
+            ValueError: invalid cursor
+        """
+        query = select(Survey)
+
+        if load_dress:
+            query = query.options(selectinload(Survey.dress))
+
+        after = decode_cursor(cursor, (datetime, int))
+        if after:
+            created_at, survey_id = after
+            # 행 생성자 비교라야 (created_at, id) 인덱스 범위 스캔을 사용
+            query = query.where(tuple_(Survey.created_at, Survey.id) < tuple_(created_at, survey_id))
+
+        query = query.order_by(Survey.created_at.desc(), Survey.id.desc()).limit(limit + 1)
+        result = await db.execute(query)
+        surveys = list(result.scalars().all())
+
+        next_cursor = None
+        if len(surveys) > limit:
+            surveys = surveys[:limit]
+            next_cursor = encode_cursor(surveys[-1].created_at, surveys[-1].id)
+        return surveys, next_cursor
+
     @staticmethod
     async def get_by_body_type(
         db: AsyncSession,
@@ -76,7 +120,18 @@ class SurveyRepository:
             .options(selectinload(Survey.dress))
             .where(Survey.id == db_survey.id)
         )
-        return result.scalar_one()
+        created = result.scalar_one()
+        survey_aggregates.record_created(created)
+        return created
+
+    @staticmethod
+    async def bulk_upsert(db: AsyncSession, rows: List[dict]) -> int:
+        """Insert validated survey rows in one statement (rows with id update in place)"""
+        count = await upsert_rows(db, Survey, rows)
+        await db.commit()
+        # 일괄 입력은 건별 집계를 거치지 않으므로 다음 조회 시 재계산
+        survey_aggregates.invalidate()
+        return count
 
     @staticmethod
     async def update(
@@ -93,6 +148,8 @@ class SurveyRepository:
         if not db_survey:
             return None
 
+        old_dress_id = db_survey.dress_id
+
         # Update only provided fields
         update_data = survey_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
@@ -107,7 +164,9 @@ class SurveyRepository:
             .options(selectinload(Survey.dress))
             .where(Survey.id == db_survey.id)
         )
-        return result.scalar_one()
+        updated = result.scalar_one()
+        survey_aggregates.record_dress_changed(old_dress_id, updated)
+        return updated
 
     @staticmethod
     async def delete(db: AsyncSession, survey_id: int) -> bool:
@@ -122,107 +181,15 @@ class SurveyRepository:
 
         await db.delete(db_survey)
         await db.commit()
+        survey_aggregates.record_deleted(db_survey)
         return True
 
     @staticmethod
     async def get_stats(db: AsyncSession) -> Dict:
-        """Get survey statistics"""
-        # Total surveys
-        total_result = await db.execute(
-            select(func.count(Survey.id))
-        )
-        total_surveys = total_result.scalar()
-
-        # Most popular body type
-        body_type_result = await db.execute(
-            select(
-                Survey.arm_length,
-                Survey.leg_length,
-                Survey.neck_length,
-                Survey.face_shape,
-                Survey.body_type,
-                func.count(Survey.id).label('count')
-            )
-            .group_by(
-                Survey.arm_length,
-                Survey.leg_length,
-                Survey.neck_length,
-                Survey.face_shape,
-                Survey.body_type
-            )
-            .order_by(func.count(Survey.id).desc())
-            .limit(5)
-        )
-        popular_body_types = [
-            {
-                "arm_length": row[0],
-                "leg_length": row[1],
-                "neck_length": row[2],
-                "face_shape": row[3],
-                "body_type": row[4],
-                "count": row[5]
-            }
-            for row in body_type_result
-        ]
-
-        # Most recommended dresses
-        dress_result = await db.execute(
-            select(
-                Survey.dress_id,
-                WeddingDress.name,
-                WeddingDress.style,
-                func.count(Survey.id).label('recommendation_count')
-            )
-            .join(WeddingDress, Survey.dress_id == WeddingDress.id)
-            .where(Survey.dress_id.isnot(None))
-            .group_by(Survey.dress_id, WeddingDress.name, WeddingDress.style)
-            .order_by(func.count(Survey.id).desc())
-            .limit(5)
-        )
-        popular_dresses = [
-            {
-                "dress_id": row[0],
-                "dress_name": row[1],
-                "style": row[2],
-                "recommendation_count": row[3]
-            }
-            for row in dress_result
-        ]
-
-        # Body measurement distribution
-        arm_dist = await db.execute(
-            select(Survey.arm_length, func.count(Survey.id))
-            .group_by(Survey.arm_length)
-        )
-        leg_dist = await db.execute(
-            select(Survey.leg_length, func.count(Survey.id))
-            .group_by(Survey.leg_length)
-        )
-        neck_dist = await db.execute(
-            select(Survey.neck_length, func.count(Survey.id))
-            .group_by(Survey.neck_length)
-        )
-        face_dist = await db.execute(
-            select(Survey.face_shape, func.count(Survey.id))
-            .group_by(Survey.face_shape)
-        )
-        body_dist = await db.execute(
-            select(Survey.body_type, func.count(Survey.id))
-            .group_by(Survey.body_type)
-        )
-
-        return {
-            "total_surveys": total_surveys,
-            "popular_body_types": popular_body_types,
-            "popular_dresses": popular_dresses,
-            "distribution": {
-                "arm_length": {row[0]: row[1] for row in arm_dist},
-                "leg_length": {row[0]: row[1] for row in leg_dist},
-                "neck_length": {row[0]: row[1] for row in neck_dist},
-                "face_shape": {row[0]: row[1] for row in face_dist},
-                "body_type": {row[0]: row[1] for row in body_dist}
-            }
-        }
+        """Get survey statistics (from incrementally maintained aggregates)"""
+        if not survey_aggregates.loaded:
+            await survey_aggregates.recompute(db)
+        return survey_aggregates.snapshot()
 
 
 # Global repository instance
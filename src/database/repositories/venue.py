@@ -1,8 +1,9 @@
 """Venue recommendation repository"""
-from sqlalchemy import select, update
+from sqlalchemy import select, update, delete
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from src.database.models import VenueQuery
 
@@ -10,10 +11,10 @@ from src.database.models import VenueQuery
 class VenueRepository:
     """Repository for venue recommendation queries"""
 
-    async def get_by_hash(self, db: AsyncSession, query_hash: str) -> Optional[VenueQuery]:
-        """Get recommendation by hash"""
+    async def get_by_key(self, db: AsyncSession, query_key: int) -> Optional[VenueQuery]:
+        """Get recommendation by query key"""
         result = await db.execute(
-            select(VenueQuery).where(VenueQuery.query_hash == query_hash)
+            select(VenueQuery).where(VenueQuery.query_key == query_key)
         )
         record = result.scalar_one_or_none()
 
@@ -21,7 +22,7 @@ class VenueRepository:
             # Update access count and last accessed time
             await db.execute(
                 update(VenueQuery)
-                .where(VenueQuery.query_hash == query_hash)
+                .where(VenueQuery.query_key == query_key)
                 .values(
                     access_count=VenueQuery.access_count + 1,
                     last_accessed=datetime.utcnow()
@@ -34,7 +35,7 @@ class VenueRepository:
     async def create(
         self,
         db: AsyncSession,
-        query_hash: str,
+        query_key: int,
         guest_count: str,
         budget: str,
         region: str,
@@ -42,9 +43,9 @@ class VenueRepository:
         season: str,
         recommendation: dict
     ) -> VenueQuery:
-        """Create new recommendation record"""
+        """Create new recommendation record (or the row another worker stored first for the key)"""
         db_record = VenueQuery(
-            query_hash=query_hash,
+            query_key=query_key,
             guest_count=guest_count,
             budget=budget,
             region=region,
@@ -53,10 +54,27 @@ class VenueRepository:
             recommendation=recommendation
         )
         db.add(db_record)
-        await db.commit()
+        try:
+            await db.commit()
+        except IntegrityError:
+            # 같은 키를 동시에 생성한 다른 워커가 먼저 저장함 - 저장된 결과를 사용
+            await db.rollback()
+            existing = await self.get_by_key(db, query_key)
+            if existing is None:
+                raise
+            return existing
         await db.refresh(db_record)
         return db_record
 
+    async def delete_by_keys(self, db: AsyncSession, query_keys: Optional[List[int]] = None) -> int:
+        """Delete stored recommendations (all rows when query_keys is None)"""
+        stmt = delete(VenueQuery)
+        if query_keys is not None:
+            stmt = stmt.where(VenueQuery.query_key.in_(query_keys))
+        result = await db.execute(stmt)
+        await db.commit()
+        return result.rowcount
+
 
 # Global repository instance
 venue_repo = VenueRepository()
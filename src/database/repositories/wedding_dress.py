@@ -1,9 +1,11 @@
 """Repository for wedding dress operations"""
 from sqlalchemy import select, update, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from src.database.models import WeddingDress
+from src.database.pagination import encode_cursor, decode_cursor
+from src.database.bulk import upsert_rows
 from src.services.schemas import WeddingDressCreate, WeddingDressUpdate
 
 
@@ -35,6 +37,41 @@ class WeddingDressRepository:
         result = await db.execute(query)
         return list(result.scalars().all())
 
+    @staticmethod
+    async def get_page(
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        available_only: bool = False
+    ) -> Tuple[List[WeddingDress], Optional[str]]:
+        """
+        Get wedding dresses by id with keyset pagination
+
+        Returns:
+            (dresses, next_cursor) - next_cursor is None on the last page
+
+        Raises:
+            ValueError: invalid cursor
+        """
+        query = select(WeddingDress)
+
+        if available_only:
+            query = query.where(WeddingDress.availability == True)
+
+        after = decode_cursor(cursor, (int,))
+        if after:
+            query = query.where(WeddingDress.id > after[0])
+
+        query = query.order_by(WeddingDress.id).limit(limit + 1)
+        result = await db.execute(query)
+        dresses = list(result.scalars().all())
+
+        next_cursor = None
+        if len(dresses) > limit:
+            dresses = dresses[:limit]
+            next_cursor = encode_cursor(dresses[-1].id)
+        return dresses, next_cursor
+
     @staticmethod
     async def get_by_style(
         db: AsyncSession,
@@ -59,6 +96,13 @@ class WeddingDressRepository:
         await db.refresh(db_dress)
         return db_dress
 
+    @staticmethod
+    async def bulk_upsert(db: AsyncSession, rows: List[dict]) -> int:
+        """Insert validated dress rows in one statement (rows with id update in place)"""
+        count = await upsert_rows(db, WeddingDress, rows)
+        await db.commit()
+        return count
+
     @staticmethod
     async def update(
         db: AsyncSession,
@@ -0,0 +1,226 @@
+"""
+Read replica routing (primary for writes, healthy replicas for reads)
+
+Read-your-writes is tracked per row key, not per process: after a session
+flushes a new cache row, reads of that (table, query_key) go to the primary
+for DB_REPLICA_READ_YOUR_WRITES_WINDOW seconds so a lagging replica cannot
+hide it. Every other read keeps going to the replicas.
+"""
+import asyncio
+import itertools
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event, text, Select, TextClause
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import BinaryExpression, BindParameter, ColumnClause
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from src.services.metrics import Counter, Gauge
+
+REPLICA_READS = Counter(
+    "db_replica_reads_total",
+    "Read statements by routing target",
+    labelnames=("target",)
+)
+REPLICA_LAG = Gauge(
+    "db_replica_lag_seconds",
+    "Last measured replication lag (-1 when the replica is unreachable)",
+    labelnames=("replica",)
+)
+
+
+class ReplicaState:
+    """Health and lag of one replica engine"""
+
+    def __init__(self, name: str, engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        self.healthy = False
+        self.lag: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self.error: Optional[str] = None
+
+
+class ReplicaRouter:
+    """Pick an engine per statement: writes → primary, reads → a healthy replica"""
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: List[AsyncEngine],
+        max_lag: float = 5.0,
+        read_your_writes_window: float = 5.0
+    ):
+        self.primary = primary
+        self.replicas = [ReplicaState(f"replica{i}", engine) for i, engine in enumerate(replicas)]
+        self.max_lag = max_lag
+        self.read_your_writes_window = read_your_writes_window
+        self._round_robin = itertools.cycle(self.replicas) if self.replicas else None
+        # (테이블, query_key) -> 생성 시각, 삽입 순서 = 시간 순서라 앞에서부터 만료
+        self._recent_inserts: "OrderedDict[Tuple[str, int], float]" = OrderedDict()
+        self._monitor_task: Optional[asyncio.Task] = None
+
+    def mark_insert(self, table: str, query_key: int) -> None:
+        """Record a new keyed row on the primary (opens its read-your-writes window)"""
+        self._recent_inserts[(table, query_key)] = time.monotonic()
+        self._recent_inserts.move_to_end((table, query_key))
+
+    def _recently_inserted(self, clause) -> bool:
+        """The statement reads a key inserted within the window"""
+        recent = self._recent_inserts
+        expire_before = time.monotonic() - self.read_your_writes_window
+        while recent:
+            key, inserted_at = next(iter(recent.items()))
+            if inserted_at >= expire_before:
+                break
+            recent.popitem(last=False)
+        if not recent or not isinstance(clause, Select):
+            return False
+        return any(key in recent for key in _key_lookups(clause))
+
+    def _pick_replica(self) -> Optional[ReplicaState]:
+        for _ in range(len(self.replicas)):
+            replica = next(self._round_robin)
+            if replica.healthy:
+                return replica
+        return None
+
+    def get_bind(self, session: "RoutingSession", clause) -> Engine:
+        """Resolve the sync engine for one statement"""
+        if not self.replicas:
+            return self.primary.sync_engine
+
+        # 쓰기 또는 같은 세션 안에서 이미 쓴 뒤의 읽기는 primary
+        if session._flushing or session.wrote or not _is_read(clause):
+            session.wrote = True
+            return self.primary.sync_engine
+
+        # 방금 생성된 키는 복제 지연으로 replica에 아직 없을 수 있으므로 primary에서 읽음
+        if self._recently_inserted(clause):
+            REPLICA_READS.inc(target="primary_recent_write")
+            return self.primary.sync_engine
+
+        replica = self._pick_replica()
+        if replica is None:
+            REPLICA_READS.inc(target="primary_fallback")
+            return self.primary.sync_engine
+
+        REPLICA_READS.inc(target=replica.name)
+        return replica.engine.sync_engine
+
+    async def check_replicas(self) -> None:
+        """Measure lag on every replica and update its health"""
+        for replica in self.replicas:
+            try:
+                async with replica.engine.connect() as conn:
+                    replica.lag = await _replication_lag(conn)
+                replica.healthy = replica.lag is not None and replica.lag <= self.max_lag
+                replica.error = None if replica.lag is not None else "replication stopped"
+            except Exception as e:
+                replica.healthy = False
+                replica.lag = None
+                replica.error = str(e)
+            replica.checked_at = time.time()
+            REPLICA_LAG.set(replica.lag if replica.lag is not None else -1, replica=replica.name)
+
+    async def _monitor(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self.check_replicas()
+
+    async def start(self, interval: float) -> None:
+        """Run the first lag check and start the background monitor"""
+        if not self.replicas:
+            return
+        await self.check_replicas()
+        self._monitor_task = asyncio.create_task(self._monitor(interval))
+
+    async def stop(self) -> None:
+        if self._monitor_task:
+            self._monitor_task.cancel()
+            try:
+                await self._monitor_task
+            except asyncio.CancelledError:
+                pass
+            self._monitor_task = None
+
+    def status(self) -> List[dict]:
+        return [
+            {
+                "name": replica.name,
+                "healthy": replica.healthy,
+                "lag_seconds": replica.lag,
+                "checked_at": replica.checked_at,
+                "error": replica.error
+            }
+            for replica in self.replicas
+        ]
+
+
+class RoutingSession(Session):
+    """Session that asks a ReplicaRouter which engine runs each statement"""
+    router: ReplicaRouter
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wrote = False
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        return self.router.get_bind(self, clause)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _after_flush(session: RoutingSession, flush_context) -> None:
+    for instance in session.new:
+        query_key = getattr(instance, "query_key", None)
+        if query_key is not None:
+            session.router.mark_insert(instance.__tablename__, query_key)
+
+
+def _key_lookups(clause: Select) -> List[Tuple[str, int]]:
+    """(table, query_key) pairs a SELECT filters on with `query_key == value`"""
+    if clause.whereclause is None:
+        return []
+    lookups = []
+    # get_by_key 형태(WHERE query_key = :값, AND로 묶인 조건 포함)만 인식
+    criteria = getattr(clause.whereclause, "clauses", None) or [clause.whereclause]
+    for criterion in criteria:
+        if (
+            isinstance(criterion, BinaryExpression)
+            and criterion.operator is operators.eq
+            and isinstance(criterion.left, ColumnClause)
+            and criterion.left.name == "query_key"
+            and isinstance(criterion.right, BindParameter)
+            and criterion.left.table is not None
+        ):
+            lookups.append((criterion.left.table.name, criterion.right.effective_value))
+    return lookups
+
+
+def _is_read(clause) -> bool:
+    """SELECT without FOR UPDATE (ORM or plain text)"""
+    if isinstance(clause, Select):
+        return clause._for_update_arg is None
+    if isinstance(clause, TextClause):
+        return clause.text.lstrip()[:6].upper() == "SELECT"
+    return False
+
+
+async def _replication_lag(conn) -> Optional[float]:
+    """Get replication lag in seconds (None when replication is not running)"""
+    if conn.dialect.name != "mysql":
+        # SQLite 등 로컬 대체 DB는 연결 가능 여부만 확인
+        await conn.execute(text("SELECT 1"))
+        return 0.0
+
+    result = await conn.execute(text("SHOW REPLICA STATUS"))
+    row = result.mappings().fetchone()
+    if row is None:
+        # 복제 설정이 없는 인스턴스 (수동 구성된 읽기 전용 복사본)
+        return 0.0
+    lag = row.get("Seconds_Behind_Source")
+    return float(lag) if lag is not None else None
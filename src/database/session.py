@@ -2,18 +2,49 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from src.config import settings
+from src.database.instrumentation import instrument_engine
+from src.database.pool import InstrumentedQueuePool
+from src.database.routing import ReplicaRouter, RoutingSession
+
+
+def _create_engine(url: str, pool_label: str):
+    """Create an instrumented async engine with pool settings"""
+    new_engine = create_async_engine(
+        url,
+        echo=settings.db_echo,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping
+    )
+    new_engine.pool.metrics_label = pool_label
+    instrument_engine(new_engine)
+    return new_engine
+
 
 # SQLAlchemy setup with aiomysql
-engine = create_async_engine(
-    settings.mysql_url,
-    echo=True,
-    pool_size=10,
-    max_overflow=20
+engine = _create_engine(settings.mysql_url, "primary")
+
+# Read replicas (optional)
+replica_engines = [
+    _create_engine(url, f"replica{i}")
+    for i, url in enumerate(settings.replica_urls)
+]
+
+replica_router = ReplicaRouter(
+    engine,
+    replica_engines,
+    max_lag=settings.db_replica_max_lag,
+    read_your_writes_window=settings.db_replica_read_your_writes_window
 )
+RoutingSession.router = replica_router
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
     expire_on_commit=False
 )
 
@@ -30,7 +61,7 @@ async def get_db():
 
 
 async def init_db():
-    """Initialize database tables"""
+    """Create all tables (local development / benchmarks; see src.database.migrate)"""
     from src.database.models import RecommendationQuery  # Import here to avoid circular
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -0,0 +1,50 @@
+"""Request-scoped unit of work"""
+from typing import AsyncIterator, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database.session import AsyncSessionLocal
+
+
+class UnitOfWork:
+    """
+    One database session per request
+
+    The session is created on first use and only checks out a pool connection
+    when its first statement runs. Call release() before long awaits (LLM calls)
+    so the connection goes back to the pool; the next statement acquires a new one.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker = AsyncSessionLocal):
+        self._session_factory = session_factory
+        self._session: Optional[AsyncSession] = None
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    async def release(self) -> None:
+        """End the open transaction (committing pending changes) and return its connection"""
+        if self._session is not None and self._session.in_transaction():
+            await self._session.commit()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None and self._session is not None and self._session.in_transaction():
+            await self._session.rollback()
+        await self.close()
+
+
+async def get_unit_of_work() -> AsyncIterator[UnitOfWork]:
+    """FastAPI dependency: request-scoped unit of work"""
+    async with UnitOfWork() as uow:
+        yield uow
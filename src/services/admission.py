@@ -0,0 +1,181 @@
+"""
+Admission control for the recommendation paths
+
+Each stage gets its own bounded pool: cache lookups (Redis + MySQL, holding a
+pool connection) and generation (LLM / venue SQL). When a pool is full,
+requests wait in a short FIFO queue; past the queue-depth limit or the queue
+timeout they are rejected immediately with AdmissionRejected, which the
+routes turn into 503 + Retry-After (or a degraded local answer). A burst of
+cold keys therefore fails fast instead of piling up coroutines and pool
+connections, and cached traffic keeps its own capacity.
+"""
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict
+
+from fastapi import HTTPException
+
+from src.config import settings
+from src.services.metrics import Counter, Gauge, Histogram, metrics_registry
+
+ADMISSION_REQUESTS = Counter(
+    "admission_requests_total",
+    "Admission decisions by pool (admitted, queued, rejected_queue_full, rejected_timeout)",
+    labelnames=("pool", "result")
+)
+ADMISSION_IN_FLIGHT = Gauge("admission_in_flight", "Requests holding a slot", labelnames=("pool",))
+ADMISSION_QUEUE_DEPTH = Gauge("admission_queue_depth", "Requests waiting for a slot", labelnames=("pool",))
+ADMISSION_WAIT = Histogram(
+    "admission_wait_seconds",
+    "Time spent queued before admission",
+    labelnames=("pool",),
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+
+# Retry-After 상한(초)
+MAX_RETRY_AFTER = 60
+
+
+class AdmissionRejected(Exception):
+    """Raised when a pool is saturated and the request should be shed"""
+
+    def __init__(self, pool: str, reason: str, retry_after: int):
+        super().__init__(f"{pool} pool saturated ({reason})")
+        self.pool = pool
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionPool:
+    """Concurrency limit + bounded FIFO wait queue (concurrency 0 disables the limit)"""
+
+    def __init__(self, name: str, concurrency: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        # 슬롯 점유 시간 지수이동평균 - Retry-After 추정용
+        self._hold_seconds = 0.0
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """Seconds until the current queue is expected to drain"""
+        if not self.concurrency:
+            return 1
+        estimate = self._hold_seconds * (self.queued + 1) / self.concurrency
+        return min(MAX_RETRY_AFTER, max(1, math.ceil(estimate)))
+
+    def _reject(self, reason: str) -> AdmissionRejected:
+        ADMISSION_REQUESTS.inc(pool=self.name, result=f"rejected_{reason}")
+        return AdmissionRejected(self.name, reason, self.retry_after())
+
+    async def acquire(self) -> None:
+        if not self.concurrency:
+            return
+        if self.active < self.concurrency and not self._waiters:
+            self.active += 1
+            ADMISSION_REQUESTS.inc(pool=self.name, result="admitted")
+            return
+        if len(self._waiters) >= self.max_queue:
+            raise self._reject("queue_full")
+
+        ADMISSION_REQUESTS.inc(pool=self.name, result="queued")
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        started_at = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                await waiter
+        except (TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # 포기하는 순간 슬롯을 넘겨받음 - 다음 대기자에게 전달
+                self._release_slot()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            raise self._reject("timeout") from None
+        finally:
+            ADMISSION_WAIT.observe(time.perf_counter() - started_at, pool=self.name)
+
+    def _release_slot(self) -> None:
+        # 슬롯을 대기자에게 직접 넘겨 새로 들어온 요청이 새치기하지 못하게 함
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def release(self, held_seconds: float) -> None:
+        if not self.concurrency:
+            return
+        self._hold_seconds += 0.2 * (held_seconds - self._hold_seconds)
+        self._release_slot()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self.acquire()
+        started_at = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(time.monotonic() - started_at)
+
+
+class AdmissionController:
+    """Named admission pools ("cache", "<kind>_generation")"""
+
+    def __init__(self, pools: Dict[str, AdmissionPool]):
+        self.pools = pools
+        metrics_registry.add_collector(self._update_gauges)
+
+    def slot(self, pool: str):
+        return self.pools[pool].slot()
+
+    def _update_gauges(self) -> None:
+        for name, pool in self.pools.items():
+            ADMISSION_IN_FLIGHT.set(pool.active, pool=name)
+            ADMISSION_QUEUE_DEPTH.set(pool.queued, pool=name)
+
+    def status(self) -> dict:
+        return {
+            name: {"active": pool.active, "queued": pool.queued, "concurrency": pool.concurrency}
+            for name, pool in self.pools.items()
+        }
+
+
+def overloaded(rejection: AdmissionRejected) -> HTTPException:
+    """503 with Retry-After for a shed request"""
+    return HTTPException(
+        status_code=503,
+        detail=f"Service overloaded: {rejection}",
+        headers={"Retry-After": str(rejection.retry_after)}
+    )
+
+
+def _pool(name: str, concurrency: int, max_queue: int) -> AdmissionPool:
+    return AdmissionPool(name, concurrency, max_queue, settings.admission_queue_timeout)
+
+
+# Global admission controller
+admission = AdmissionController({
+    "cache": _pool("cache", settings.admission_cache_concurrency, settings.admission_cache_queue),
+    "dress_generation": _pool(
+        "dress_generation", settings.admission_generation_concurrency, settings.admission_generation_queue
+    ),
+    "venue_generation": _pool(
+        "venue_generation", settings.admission_generation_concurrency, settings.admission_generation_queue
+    ),
+})
@@ -0,0 +1,180 @@
+"""
+Bulk import for the wedding dress catalog and survey dumps
+
+Reads CSV or NDJSON in chunks, validates each row with the existing create
+schemas and writes every chunk with one multi-row upsert + commit. Rows that
+fail validation are skipped; a chunk the database rejects (foreign key,
+constraint) is rolled back and its rows reported as failed, and the import
+continues with the next chunk.
+
+Usage:
+    python -m src.services.bulk_import dresses catalog.csv
+    python -m src.services.bulk_import surveys surveys.ndjson --chunk-size 2000
+"""
+import argparse
+import asyncio
+import csv
+import json
+import time
+from enum import Enum
+from typing import Iterator, List, Optional, TextIO
+
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.repositories.survey import survey_repo
+from src.database.repositories.wedding_dress import wedding_dress_repo
+from src.services.schemas import SurveyCreate, WeddingDressCreate
+
+# 보고서에 남길 최대 오류 수 (검증 오류, 실패한 청크 각각)
+MAX_REPORTED_ERRORS = 50
+
+
+class ImportTarget(str, Enum):
+    DRESSES = "dresses"
+    SURVEYS = "surveys"
+
+
+class ImportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+IMPORT_TARGETS = {
+    ImportTarget.DRESSES: (WeddingDressCreate, wedding_dress_repo),
+    ImportTarget.SURVEYS: (SurveyCreate, survey_repo),
+}
+
+
+def _iter_rows(stream: TextIO, fmt: ImportFormat) -> Iterator[tuple]:
+    """Yield (line_number, raw dict) from a CSV or NDJSON text stream"""
+    if fmt == ImportFormat.CSV:
+        reader = csv.DictReader(stream)
+        for row in reader:
+            # 빈 칸은 생략해 스키마 기본값이 적용되도록 함
+            yield reader.line_num, {key: value for key, value in row.items() if value not in ("", None)}
+    else:
+        for line_number, line in enumerate(stream, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, e
+
+
+def _iter_chunks(stream: TextIO, fmt: ImportFormat, chunk_size: int) -> Iterator[list]:
+    chunk = []
+    for item in _iter_rows(stream, fmt):
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _validate(schema: type[BaseModel], raw) -> dict:
+    """Validate one raw row; an optional id is kept for upserts"""
+    if isinstance(raw, Exception):
+        raise ValueError(f"Invalid JSON: {raw}")
+    if not isinstance(raw, dict):
+        raise ValueError("Row must be an object")
+    row = schema.model_validate(raw).model_dump()
+    if raw.get("id") is not None:
+        row["id"] = int(raw["id"])
+    return row
+
+
+async def import_records(
+    db: AsyncSession,
+    target: ImportTarget,
+    stream: TextIO,
+    fmt: ImportFormat,
+    chunk_size: int = 1000
+) -> dict:
+    """Import every row from stream; invalid rows are skipped and reported"""
+    schema, repo = IMPORT_TARGETS[target]
+    chunks = _iter_chunks(stream, fmt, chunk_size)
+
+    report = {
+        "target": target.value, "rows_read": 0, "imported": 0, "rejected": 0, "failed": 0, "chunks": 0,
+        "errors": [], "failed_chunks": []
+    }
+    start = time.perf_counter()
+
+    while True:
+        # 파일 읽기/파싱은 이벤트 루프를 막지 않도록 스레드풀에서
+        chunk = await run_in_threadpool(next, chunks, None)
+        if chunk is None:
+            break
+
+        rows: List[dict] = []
+        lines: List[int] = []
+        for line_number, raw in chunk:
+            try:
+                rows.append(_validate(schema, raw))
+                lines.append(line_number)
+            except (ValidationError, ValueError) as e:
+                report["rejected"] += 1
+                if len(report["errors"]) < MAX_REPORTED_ERRORS:
+                    detail = e.errors(include_url=False) if isinstance(e, ValidationError) else str(e)
+                    report["errors"].append({"line": line_number, "error": detail})
+
+        report["rows_read"] += len(chunk)
+        report["chunks"] += 1
+        try:
+            report["imported"] += await repo.bulk_upsert(db, rows)
+        except SQLAlchemyError as e:
+            # 이전 청크는 이미 커밋됨 - 이 청크만 되돌리고 계속
+            await db.rollback()
+            report["failed"] += len(rows)
+            if len(report["failed_chunks"]) < MAX_REPORTED_ERRORS:
+                error = e.orig if isinstance(e, DBAPIError) else e
+                report["failed_chunks"].append({"lines": lines, "error": str(error)[:500]})
+
+    elapsed = time.perf_counter() - start
+    report["elapsed_seconds"] = round(elapsed, 3)
+    report["rows_per_second"] = round(report["imported"] / elapsed, 1) if elapsed > 0 else None
+    return report
+
+
+def detect_format(filename: str) -> Optional[ImportFormat]:
+    if filename.endswith(".csv"):
+        return ImportFormat.CSV
+    if filename.endswith((".ndjson", ".jsonl")):
+        return ImportFormat.NDJSON
+    return None
+
+
+def main() -> None:
+    from src.database import AsyncSessionLocal, engine  # Import here to keep the module light for the API
+
+    parser = argparse.ArgumentParser(description="Bulk import wedding dresses or surveys")
+    parser.add_argument("target", choices=[target.value for target in ImportTarget])
+    parser.add_argument("path", help="CSV or NDJSON file")
+    parser.add_argument("--format", choices=[fmt.value for fmt in ImportFormat], default=None)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    fmt = ImportFormat(args.format) if args.format else detect_format(args.path)
+    if fmt is None:
+        parser.error("Cannot detect format from file name; pass --format")
+
+    async def _run():
+        try:
+            with open(args.path, encoding="utf-8-sig", newline="") as stream:
+                async with AsyncSessionLocal() as db:
+                    return await import_records(db, ImportTarget(args.target), stream, fmt, args.chunk_size)
+        finally:
+            await engine.dispose()
+
+    report = asyncio.run(_run())
+    print(json.dumps(report, ensure_ascii=False, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""
+Cross-replica single-flight generation and cache invalidation (Redis)
+
+Single-flight: before calling the LLM for a query_key, a replica takes a
+Redis lease (SET NX PX). The lease holder generates, writes MySQL + Redis and
+publishes the Redis key on READY_CHANNEL; every other replica waits for that
+notification and serves the stored result instead of generating it again.
+Concurrent requests inside one process share a single attempt.
+
+Invalidation: "<cache name>:<key>,<key>,..." (or "<cache name>:*") published on
+INVALIDATE_CHANNEL drops the entries from every replica's in-process cache.
+
+Pub/sub is at-most-once, so waiters also poll Redis and give up on the lease
+once it expires; without Redis everything degrades to local generation.
+"""
+import asyncio
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.config import settings
+from src.config.redis import redis_client
+from src.services.admission import AdmissionRejected
+from src.services.metrics import Counter
+from src.services.recommendation_cache import RecommendationCache, dress_cache, venue_cache
+
+READY_CHANNEL = "recommendation:ready"
+INVALIDATE_CHANNEL = "recommendation:invalidate"
+
+SINGLEFLIGHT_REQUESTS = Counter(
+    "singleflight_requests_total",
+    "Generation attempts by single-flight outcome",
+    labelnames=("cache", "result")
+)
+CACHE_INVALIDATIONS = Counter(
+    "cache_invalidations_total",
+    "Cache invalidations published or received",
+    labelnames=("cache", "origin")
+)
+
+Loader = Callable[[], Awaitable[Optional[dict]]]
+
+# 리더 요청이 취소되어 결과 없이 끝난 시도 (대기자는 예외 대신 이 값을 받고 다시 시도)
+_ABANDONED = object()
+
+
+class CacheCoordinator:
+    """Redis lease + pub/sub coordination for the recommendation caches"""
+
+    def __init__(
+        self,
+        caches: Iterable[RecommendationCache],
+        lease_ttl: float = 30.0,
+        wait_timeout: float = 25.0,
+        poll_interval: float = 1.0
+    ):
+        self.caches: Dict[str, RecommendationCache] = {cache.name: cache for cache in caches}
+        self.lease_ttl = lease_ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._inflight: Dict[Tuple[str, int], asyncio.Future] = {}
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def lease_key(cache: RecommendationCache, key: int) -> str:
+        return f"lease:{cache.redis_key(key)}"
+
+    async def single_flight(
+        self,
+        cache: RecommendationCache,
+        key: int,
+        generate: Loader,
+        reload: Loader
+    ) -> Tuple[dict, bool]:
+        """
+        Run generate() at most once per key across replicas
+
+        generate() must persist its result (MySQL + Redis) before returning;
+        reload() reads the stored result from MySQL. Returns (result, generated)
+        where generated is False when another request produced the result.
+
+        generate() / reload() use the calling request's session, so when the
+        leading request is cancelled (client disconnect) its attempt is
+        abandoned rather than failed: waiters are not cancelled with it, and
+        the first one to resume retries with its own loaders.
+        """
+        flight_key = (cache.name, key)
+        while (inflight := self._inflight.get(flight_key)) is not None:
+            SINGLEFLIGHT_REQUESTS.inc(cache=cache.name, result="coalesced_local")
+            result = await asyncio.shield(inflight)
+            if result is not _ABANDONED:
+                return result, False
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[flight_key] = future
+        try:
+            result, generated = await self._run_distributed(cache, key, generate, reload)
+        except asyncio.CancelledError:
+            SINGLEFLIGHT_REQUESTS.inc(cache=cache.name, result="abandoned")
+            future.set_result(_ABANDONED)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 대기자가 없으면 "exception was never retrieved" 경고가 나지 않도록 소비
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, generated
+        finally:
+            del self._inflight[flight_key]
+
+    async def serve_generated(
+        self,
+        cache: RecommendationCache,
+        key: int,
+        generate: Loader,
+        reload: Loader,
+        fallback: Callable[[], dict]
+    ) -> Tuple[dict, str]:
+        """
+        single_flight() for a cache miss, returning (result, source)
+
+        source is "ai_generated" or "coalesced"; when the generation pool is
+        saturated and ADMISSION_DEGRADED_RESPONSES is on, fallback() is served
+        as "degraded" instead of a 503 and is not cached.
+        """
+        try:
+            result, generated = await self.single_flight(cache, key, generate, reload)
+        except AdmissionRejected:
+            if not settings.admission_degraded_responses:
+                raise
+            return fallback(), "degraded"
+        cache.put(key, result)
+        return result, "ai_generated" if generated else "coalesced"
+
+    async def _run_distributed(
+        self,
+        cache: RecommendationCache,
+        key: int,
+        generate: Loader,
+        reload: Loader
+    ) -> Tuple[dict, bool]:
+        lease_key = self.lease_key(cache, key)
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.wait_timeout
+
+        while True:
+            acquired = await redis_client.acquire_lease(lease_key, token, self.lease_ttl)
+            if acquired is None:
+                # Redis 없음 - 레플리카/워커 간 조율 없이 생성 (시작 시 경고, 중복 저장은 저장소에서 처리)
+                SINGLEFLIGHT_REQUESTS.inc(cache=cache.name, result="unavailable")
+                return await generate(), True
+
+            if acquired:
+                try:
+                    # 리스를 기다리는 사이 다른 레플리카가 이미 저장했을 수 있음
+                    result = await redis_client.get(cache.redis_key(key)) or await reload()
+                    if result is not None:
+                        SINGLEFLIGHT_REQUESTS.inc(cache=cache.name, result="coalesced_remote")
+                        return result, False
+                    SINGLEFLIGHT_REQUESTS.inc(cache=cache.name, result="leader")
+                    result = await generate()
+                    await redis_client.publish(READY_CHANNEL, cache.redis_key(key))
+                    return result, True
+                finally:
+                    await redis_client.release_lease(lease_key, token)
+
+            result = await self._wait_for_ready(cache, key, deadline)
+            if result is not None:
+                SINGLEFLIGHT_REQUESTS.inc(cache=cache.name, result="coalesced_remote")
+                return result, False
+            if time.monotonic() >= deadline:
+                break
+            # 리스가 결과 없이 풀림 (생성 실패 또는 만료) - 다시 리스 시도
+
+        # 대기 시간 초과 - 중복 생성을 감수하고 직접 처리
+        SINGLEFLIGHT_REQUESTS.inc(cache=cache.name, result="timeout")
+        result = await reload()
+        if result is not None:
+            return result, False
+        return await generate(), True
+
+    async def _wait_for_ready(self, cache: RecommendationCache, key: int, deadline: float) -> Optional[dict]:
+        """Wait for the lease holder's result; None when the lease ends without one"""
+        redis_key = cache.redis_key(key)
+        lease_key = self.lease_key(cache, key)
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(redis_key, []).append(waiter)
+        try:
+            while True:
+                # 구독 등록 전에 끝났을 수 있으므로 먼저 확인
+                result = await redis_client.get(redis_key)
+                if result is not None:
+                    return result
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not await redis_client.exists(lease_key):
+                    return None
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter), min(self.poll_interval, remaining))
+                except asyncio.TimeoutError:
+                    continue
+                return await redis_client.get(redis_key)
+        finally:
+            waiters = self._waiters.get(redis_key)
+            if waiters is not None:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._waiters[redis_key]
+
+    async def invalidate(self, cache: RecommendationCache, keys: Optional[Iterable[int]] = None) -> int:
+        """Drop keys (all keys when None) from Redis and every replica's memory cache"""
+        keys = list(range(cache.key_space.size)) if keys is None else list(keys)
+        cache.discard(keys)
+        await redis_client.delete_many([cache.redis_key(key) for key in keys])
+        if len(keys) == cache.key_space.size:
+            await redis_client.publish(INVALIDATE_CHANNEL, f"{cache.name}:*")
+        elif keys:
+            await redis_client.publish(INVALIDATE_CHANNEL, f"{cache.name}:{','.join(map(str, keys))}")
+        CACHE_INVALIDATIONS.inc(len(keys), cache=cache.name, origin="local")
+        return len(keys)
+
+    def _handle_invalidation(self, message: str) -> None:
+        name, _, body = message.partition(":")
+        cache = self.caches.get(name)
+        if cache is None:
+            return
+        keys = range(cache.key_space.size) if body == "*" else [int(key) for key in body.split(",")]
+        cache.discard(keys)
+        CACHE_INVALIDATIONS.inc(len(keys), cache=name, origin="remote")
+
+    def _handle_ready(self, redis_key: str) -> None:
+        for waiter in self._waiters.get(redis_key, []):
+            if not waiter.done():
+                waiter.set_result(True)
+
+    async def _listen(self) -> None:
+        """Subscribe once per process and dispatch notifications until stopped"""
+        while True:
+            if not redis_client.available:
+                await asyncio.sleep(settings.redis_retry_interval)
+                continue
+            pubsub = redis_client.client.pubsub()
+            try:
+                await pubsub.subscribe(READY_CHANNEL, INVALIDATE_CHANNEL)
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is None or message["type"] != "message":
+                        continue
+                    channel = message["channel"].decode()
+                    data = message["data"].decode()
+                    if channel == READY_CHANNEL:
+                        self._handle_ready(data)
+                    else:
+                        self._handle_invalidation(data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 재구독 전 놓친 무효화가 있을 수 있음 - TTL과 다음 무효화로 수렴
+                print(f"⚠️ Cache pub/sub listener failed, resubscribing: {e}")
+                await asyncio.sleep(settings.redis_retry_interval)
+            finally:
+                await pubsub.aclose()
+
+    def start(self) -> None:
+        if redis_client.enabled:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Global coordinator instance
+cache_coordinator = CacheCoordinator(
+    [dress_cache, venue_cache],
+    settings.singleflight_lease_ttl,
+    settings.singleflight_wait_timeout
+)
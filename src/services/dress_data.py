@@ -1,4 +1,5 @@
 """Wedding dress styles database"""
+from functools import lru_cache
 
 WEDDING_DRESS_STYLES = {
     "A라인": {
@@ -248,13 +249,23 @@ def get_style_details(style_names: list[str]) -> list[dict]:
     return results
 
 
+def rank_styles_by_suitability(traits: list[str], limit: int) -> list[str]:
+    """Style names that suit the most of the given traits (catalog order breaks ties)"""
+    ranked = sorted(
+        WEDDING_DRESS_STYLES,
+        key=lambda name: -sum(trait in WEDDING_DRESS_STYLES[name]["suitable_for"] for trait in traits)
+    )
+    return ranked[:limit]
+
+
 def get_all_style_names() -> list[str]:
     """Get list of all available style names"""
     return list(WEDDING_DRESS_STYLES.keys())
 
 
+@lru_cache(maxsize=None)
 def get_styles_with_suitability() -> str:
-    """Get formatted list of styles with their suitability information"""
+    """Get formatted list of styles with their suitability information (built once per process)"""
     lines = []
     for style_name, style_info in WEDDING_DRESS_STYLES.items():
         suitable = ", ".join(style_info["suitable_for"])
@@ -1,22 +1,49 @@
 """Wedding dress recommendation engine"""
-import hashlib
 import json
-from openai import AsyncOpenAI
+import time
+from typing import Optional
 from src.config import settings
-from src.services.dress_data import get_style_details, get_styles_with_suitability
+from src.services.metrics import Counter, Histogram
+from src.services.query_keys import DRESS_KEYS
+from src.services.dress_data import get_style_details, get_styles_with_suitability, rank_styles_by_suitability
+
+OPENAI_MODEL = "gpt-5-nano"
+
+OPENAI_REQUEST_DURATION = Histogram(
+    "openai_request_duration_seconds",
+    "OpenAI chat completion latency",
+    labelnames=("model", "outcome"),
+    buckets=(0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0)
+)
+OPENAI_TOKENS = Counter("openai_tokens_total", "OpenAI tokens used", labelnames=("model", "type"))
 
 
 class DressRecommender:
     """AI-powered dress recommendation engine"""
 
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self._client = None
+        self.last_outcome: Optional[str] = None  # 마지막 OpenAI 호출 결과 (ok / error, 헬스 체크용)
+
+    @property
+    def initialized(self) -> bool:
+        return self._client is not None
+
+    @property
+    def client(self):
+        """OpenAI client, created on first use"""
+        if self._client is None:
+            if not settings.openai_api_key:
+                raise RuntimeError("OPENAI_API_KEY is required for dress recommendations")
+            # openai import가 무거워 dress 역할에서만, 처음 필요할 때 로드
+            from openai import AsyncOpenAI
+            self._client = AsyncOpenAI(api_key=settings.openai_api_key)
+        return self._client
 
     @staticmethod
-    def generate_hash(arm: str, leg: str, neck: str, face: str, body: str, num: int = 3) -> str:
-        """Generate unique hash for request parameters"""
-        params = f"{arm}_{leg}_{neck}_{face}_{body}_{num}"
-        return hashlib.sha256(params.encode()).hexdigest()
+    def generate_key(arm: str, leg: str, neck: str, face: str, body: str, num: int = 3) -> int:
+        """Get the dense integer key for request parameters"""
+        return DRESS_KEYS.encode(arm, leg, neck, face, body, num)
 
     @staticmethod
     def _translate_to_korean(value: str, category: str) -> str:
@@ -75,26 +102,73 @@ JSON 형식 ({num_recommendations}개 추천):
   "overall_advice": "이 신부님께 드리는 한 줄 조언"
 }}"""
 
-        response = await self.client.chat.completions.create(
-            model="gpt-5-nano",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "웨딩 드레스 스타일리스트. 체형에 맞는 스타일 이름만 간결하게 추천."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            response_format={"type": "json_object"}
-        )
+        started_at = time.perf_counter()
+        outcome = "error"
+        try:
+            response = await self.client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "웨딩 드레스 스타일리스트. 체형에 맞는 스타일 이름만 간결하게 추천."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                response_format={"type": "json_object"}
+            )
+            outcome = "ok"
+        finally:
+            self.last_outcome = outcome
+            OPENAI_REQUEST_DURATION.observe(time.perf_counter() - started_at, model=OPENAI_MODEL, outcome=outcome)
+        if response.usage is not None:
+            OPENAI_TOKENS.inc(response.usage.prompt_tokens, model=OPENAI_MODEL, type="prompt")
+            OPENAI_TOKENS.inc(response.usage.completion_tokens, model=OPENAI_MODEL, type="completion")
 
         # Parse GPT-4 response
         ai_result = json.loads(response.choices[0].message.content)
         style_names = ai_result.get("style_names", [])
         overall_advice = ai_result.get("overall_advice", "")
 
+        return self._build_result(
+            style_names, overall_advice, arm_length, leg_length, neck_length, face_shape, body_type
+        )
+
+    def fallback(
+        self,
+        arm_length: str,
+        leg_length: str,
+        neck_length: str,
+        face_shape: str,
+        body_type: str,
+        num_recommendations: int = 3
+    ) -> dict:
+        """Rule-based recommendation from the local catalog (no OpenAI call), served under overload"""
+        traits = [
+            self._translate_to_korean(arm_length, "arm"),
+            self._translate_to_korean(leg_length, "leg"),
+            self._translate_to_korean(neck_length, "neck"),
+            face_shape,
+            body_type
+        ]
+        return self._build_result(
+            rank_styles_by_suitability(traits, num_recommendations),
+            "요청이 많아 체형 적합도 기준으로 빠르게 추천드렸어요. 잠시 후 다시 요청하시면 맞춤 조언을 받아보실 수 있습니다.",
+            arm_length, leg_length, neck_length, face_shape, body_type
+        )
+
+    @staticmethod
+    def _build_result(
+        style_names: list,
+        overall_advice: str,
+        arm_length: str,
+        leg_length: str,
+        neck_length: str,
+        face_shape: str,
+        body_type: str
+    ) -> dict:
         # Get detailed information from local database
         detailed_styles = get_style_details(style_names)
 
@@ -0,0 +1,152 @@
+"""Batched analytics event pipeline (event_logs)"""
+import asyncio
+import time
+from collections import deque
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import insert
+
+from src.config import settings
+from src.database.session import engine
+from src.database.models import EventLog
+from src.services.metrics import Counter, Gauge, annotate_request, metrics_registry
+
+EVENTS_RECORDED = Counter("events_recorded_total", "Events accepted into the buffer", labelnames=("event_type",))
+EVENTS_DROPPED = Counter("events_dropped_total", "Events dropped", labelnames=("reason",))
+EVENTS_WRITTEN = Counter("events_written_total", "Events inserted into event_logs")
+EVENTS_BUFFERED = Gauge("events_buffered", "Events waiting to be written")
+RECOMMENDATIONS_SERVED = Counter(
+    "recommendations_served_total",
+    "Recommendations served by kind and source (memory_cache/redis_cache/mysql_db/coalesced/ai_generated/degraded)",
+    labelnames=("kind", "source")
+)
+# 캐시에서 나오지 않은 응답 (degraded: 과부하 시 LLM 없이 만든 대체 추천)
+UNCACHED_SOURCES = frozenset({"ai_generated", "degraded"})
+
+
+def served_from_cache(source: str) -> bool:
+    """Value of the "cached" response field for a recommendation source"""
+    return source not in UNCACHED_SOURCES
+
+
+RECOMMENDATION_CACHE_HIT_RATIO = Gauge(
+    "recommendation_cache_hit_ratio",
+    "Share of recommendations served without generating (any cache tier)",
+    labelnames=("kind",)
+)
+
+
+def _update_cache_hit_ratio() -> None:
+    totals, hits = {}, {}
+    for (kind, source), count in list(RECOMMENDATIONS_SERVED.series().items()):
+        totals[kind] = totals.get(kind, 0) + count
+        if source not in UNCACHED_SOURCES:
+            hits[kind] = hits.get(kind, 0) + count
+    for kind, total in totals.items():
+        RECOMMENDATION_CACHE_HIT_RATIO.set(hits.get(kind, 0) / total, kind=kind)
+
+
+metrics_registry.add_collector(_update_cache_hit_ratio)
+
+
+class EventPipeline:
+    """
+    In-process event buffer flushed to event_logs on a timer
+
+    record() only appends to a bounded deque and never awaits, so the request
+    path never waits on analytics writes. When the buffer is full the event is
+    dropped and counted instead of blocking.
+    """
+
+    def __init__(self, max_buffer: int, batch_size: int, flush_interval: float):
+        self.max_buffer = max_buffer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer: deque = deque()
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, event_type: str, query_key: Optional[int] = None, metadata: Optional[dict] = None) -> None:
+        """Queue one event (non-blocking)"""
+        if len(self._buffer) >= self.max_buffer:
+            EVENTS_DROPPED.inc(reason="buffer_full")
+            return
+        self._buffer.append({
+            "event_type": event_type,
+            "query_key": query_key,
+            "event_metadata": metadata,
+            "created_at": datetime.utcnow()
+        })
+        EVENTS_RECORDED.inc(event_type=event_type)
+
+    async def flush(self) -> int:
+        """Write buffered events in batches; returns the number written"""
+        written = 0
+        while self._buffer:
+            batch = [
+                self._buffer.popleft()
+                for _ in range(min(self.batch_size, len(self._buffer)))
+            ]
+            try:
+                async with engine.begin() as conn:
+                    await conn.execute(insert(EventLog), batch)
+            except Exception as e:
+                # 재시도하지 않고 버림 (분석 데이터가 서비스에 영향을 주지 않도록)
+                EVENTS_DROPPED.inc(len(batch), reason="write_error")
+                print(f"⚠️ Failed to write {len(batch)} events: {e}")
+                break
+            written += len(batch)
+            EVENTS_WRITTEN.inc(len(batch))
+        EVENTS_BUFFERED.set(len(self._buffer))
+        return written
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            EVENTS_BUFFERED.set(len(self._buffer))
+            await self.flush()
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop the timer and write whatever is left"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+def record_recommendation(kind: str, query_key: int, source: str, started_at: float) -> None:
+    """Record cache hit/miss and served-latency events for one recommendation request"""
+    RECOMMENDATIONS_SERVED.inc(kind=kind, source=source)
+    annotate_request(source=source)
+    if not settings.events_enabled:
+        return
+    latency_ms = round((time.perf_counter() - started_at) * 1000, 3)
+    cached = served_from_cache(source)
+
+    # event_logs.query_key 컬럼은 recommendation_queries 키 전용, 웨딩홀 키는 metadata에 기록
+    dress_key = query_key if kind == "dress" else None
+    event_pipeline.record(
+        "cache_hit" if cached else "cache_miss",
+        dress_key,
+        {"kind": kind, "query_key": query_key}
+    )
+    event_pipeline.record(
+        "recommendation_served",
+        dress_key,
+        {"kind": kind, "query_key": query_key, "source": source, "latency_ms": latency_ms}
+    )
+
+
+# Global event pipeline instance
+event_pipeline = EventPipeline(
+    settings.events_buffer_size,
+    settings.events_batch_size,
+    settings.events_flush_interval
+)
@@ -0,0 +1,216 @@
+"""In-process metrics registry (counters, gauges, histograms) and Prometheus text rendering"""
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 요청 지연 시간(초) 기본 버킷
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 현재 처리 중인 요청의 ASGI scope (라우트 귀속용, RequestContextMiddleware에서 설정)
+current_request_scope: ContextVar[Optional[dict]] = ContextVar("current_request_scope", default=None)
+
+
+def current_route() -> str:
+    """Return the matched route template of the current request ('-' outside requests)"""
+    scope = current_request_scope.get()
+    if scope is None:
+        return "-"
+    route = scope.get("route")
+    if route is not None:
+        return getattr(route, "path", scope.get("path", "-"))
+    return scope.get("path", "-")
+
+
+def annotate_request(**labels: str) -> None:
+    """Attach extra labels (e.g. response source) to the current request's HTTP metrics"""
+    scope = current_request_scope.get()
+    if scope is not None:
+        scope.setdefault("metrics_labels", {}).update(labels)
+
+
+class MetricsRegistry:
+    """Holds every metric created in this process"""
+
+    def __init__(self):
+        self._metrics: Dict[str, "Metric"] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: "Metric") -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callback that refreshes derived gauges before each collection"""
+        self._collectors.append(collector)
+
+    def collect(self) -> List["Metric"]:
+        for collector in self._collectors:
+            collector()
+        return list(self._metrics.values())
+
+    def get(self, name: str) -> Optional["Metric"]:
+        return self._metrics.get(name)
+
+    def snapshot(self) -> dict:
+        """Get all metric values as a JSON-serializable dict"""
+        return {metric.name: metric.snapshot() for metric in self._metrics.values()}
+
+
+class Metric:
+    """Base class for labeled metrics"""
+    type = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labelnames: Sequence[str] = (),
+        registry: Optional[MetricsRegistry] = None
+    ):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self._series: dict = {}
+        (registry or metrics_registry).register(self)
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        # 요청마다 호출되는 경로라 제너레이터 대신 리스트 컴프리헨션 사용
+        if not labels:
+            return ("",) * len(self.labelnames)
+        return tuple([str(labels.get(label, "")) for label in self.labelnames])
+
+    def series(self) -> dict:
+        return self._series
+
+    def clear(self) -> None:
+        self._series.clear()
+
+    def snapshot(self) -> list:
+        return [
+            {"labels": dict(zip(self.labelnames, key)), "value": value}
+            for key, value in self._series.items()
+        ]
+
+
+class Counter(Metric):
+    """Monotonically increasing counter"""
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        self._series[key] = self._series.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._series.get(self._key(labels), 0)
+
+
+class Gauge(Metric):
+    """Value that can go up and down"""
+    type = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        self._series[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        self._series[key] = self._series.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        return self._series.get(self._key(labels), 0)
+
+
+class HistogramSeries:
+    """Bucket counts, sum and count for one label combination"""
+    __slots__ = ("bucket_counts", "sum", "count")
+
+    def __init__(self, num_buckets: int):
+        # 마지막 칸은 +Inf 버킷
+        self.bucket_counts = [0] * (num_buckets + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(Metric):
+    """Fixed-bucket histogram"""
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        registry: Optional[MetricsRegistry] = None
+    ):
+        super().__init__(name, description, labelnames, registry)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = HistogramSeries(len(self.buckets))
+        series.bucket_counts[bisect_left(self.buckets, value)] += 1
+        series.sum += value
+        series.count += 1
+
+    def snapshot(self) -> list:
+        return [
+            {
+                "labels": dict(zip(self.labelnames, key)),
+                "count": series.count,
+                "sum": series.sum,
+                "buckets": dict(zip([*map(str, self.buckets), "+Inf"], series.bucket_counts))
+            }
+            for key, series in self._series.items()
+        ]
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus(registry: Optional[MetricsRegistry] = None) -> str:
+    """Render every metric in the Prometheus text exposition format (cumulative buckets)"""
+    lines = []
+    for metric in (registry or metrics_registry).collect():
+        lines.append(f"# HELP {metric.name} {metric.description}")
+        lines.append(f"# TYPE {metric.name} {metric.type}")
+        # 수집 중에도 요청이 기록할 수 있으므로 복사본으로 순회
+        for key, value in list(metric.series().items()):
+            if metric.type != "histogram":
+                lines.append(f"{metric.name}{_format_labels(metric.labelnames, key)} {_format_value(value)}")
+                continue
+            cumulative = 0
+            for bound, count in zip([*metric.buckets, float("inf")], value.bucket_counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{metric.name}_bucket{_format_labels(metric.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(metric.labelnames, key)
+            lines.append(f"{metric.name}_sum{labels} {_format_value(value.sum)}")
+            lines.append(f"{metric.name}_count{labels} {value.count}")
+    return "\n".join(lines) + "\n"
+
+
+# Global metrics registry
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,235 @@
+"""
+Multi-worker metrics aggregation for /metrics
+
+Every gunicorn worker keeps its own registry, so a scrape answered by one
+worker only saw that worker's counters and successive scrapes jumped between
+workers. With METRICS_MULTIPROCESS_DIR set (python -m src.api.server does
+this automatically for more than one worker), each worker writes a snapshot
+of its series to <dir>/worker-<pid>.json every METRICS_MULTIPROCESS_INTERVAL
+seconds and when it serves a scrape. The scraping worker merges all files:
+
+- counters and histograms are summed across workers
+- gauges are reported per worker with an extra pid label (aggregate in PromQL)
+
+Counters and histograms of a worker that exits (max_requests restart,
+shutdown, crash) are folded into archive.json, so totals never go backwards.
+Snapshots of other workers can be up to one interval old.
+"""
+import asyncio
+import fcntl
+import json
+import os
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.config import settings
+from src.services.metrics import (
+    Counter, Gauge, Histogram, HistogramSeries, MetricsRegistry, metrics_registry, render_prometheus
+)
+
+ARCHIVE_FILE = "archive.json"
+LOCK_FILE = ".lock"
+
+
+def _snapshot(registry: MetricsRegistry) -> dict:
+    """This process's series in a JSON-friendly form (label tuples as lists)"""
+    metrics = {}
+    for metric in registry.collect():
+        if metric.type == "histogram":
+            series = [
+                [list(key), [value.bucket_counts, value.sum, value.count]]
+                for key, value in list(metric.series().items())
+            ]
+        else:
+            series = [[list(key), value] for key, value in list(metric.series().items())]
+        metrics[metric.name] = {
+            "type": metric.type,
+            "help": metric.description,
+            "labelnames": list(metric.labelnames),
+            "buckets": list(getattr(metric, "buckets", ())),
+            "series": series
+        }
+    return metrics
+
+
+def _fold(into: Dict[str, dict], metrics: Dict[str, dict]) -> None:
+    """Add the counter / histogram series of one snapshot into an accumulated snapshot"""
+    for name, data in metrics.items():
+        if data["type"] == "gauge":
+            continue
+        target = into.setdefault(name, {**data, "series": []})
+        totals = {tuple(key): value for key, value in target["series"]}
+        for key, value in data["series"]:
+            key = tuple(key)
+            current = totals.get(key)
+            if current is None:
+                totals[key] = value
+            elif data["type"] == "histogram":
+                totals[key] = [
+                    [a + b for a, b in zip(current[0], value[0])], current[1] + value[1], current[2] + value[2]
+                ]
+            else:
+                totals[key] = current + value
+        target["series"] = [[list(key), value] for key, value in totals.items()]
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MultiprocessCollector:
+    """Writes this worker's snapshot to a shared directory and merges all workers on scrape"""
+
+    def __init__(self, directory: str, interval: float = 5.0, registry: Optional[MetricsRegistry] = None):
+        self.directory = Path(directory) if directory else None
+        self.interval = interval
+        self.registry = registry or metrics_registry
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    def _worker_path(self, pid: int) -> Path:
+        return self.directory / f"worker-{pid}.json"
+
+    @contextmanager
+    def _locked(self):
+        with open(self.directory / LOCK_FILE, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _read(path: Path) -> Optional[dict]:
+        try:
+            return json.loads(path.read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    @staticmethod
+    def _write(path: Path, payload: dict) -> None:
+        # 다른 워커가 쓰다 만 파일을 읽지 않도록 임시 파일 후 rename
+        # (주기 쓰기 스레드와 스크레이프 스레드가 겹칠 수 있어 임시 파일 이름은 쓰기마다 고유)
+        tmp = path.with_suffix(f".{os.getpid()}.{uuid.uuid4().hex}.tmp")
+        tmp.write_text(json.dumps(payload))
+        tmp.replace(path)
+
+    def write(self) -> None:
+        """Write this worker's current snapshot"""
+        pid = os.getpid()
+        self._write(self._worker_path(pid), {"pid": pid, "metrics": _snapshot(self.registry)})
+
+    def _archive(self, paths) -> None:
+        """Fold worker files into the archive and delete them (caller holds the lock)"""
+        archive_path = self.directory / ARCHIVE_FILE
+        archive = self._read(archive_path) or {"metrics": {}}
+        for path in paths:
+            payload = self._read(path)
+            if payload is not None:
+                _fold(archive["metrics"], payload["metrics"])
+        self._write(archive_path, archive)
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+    def merged_registry(self) -> MetricsRegistry:
+        """All workers' series merged into a throwaway registry"""
+        try:
+            self.write()
+        except OSError as e:
+            # 이 워커의 값은 마지막 주기 스냅샷으로 대신하고 스크레이프는 계속
+            print(f"⚠️ Failed to write metrics snapshot: {e}")
+        with self._locked():
+            live, dead = [], []
+            for path in self.directory.glob("worker-*.json"):
+                payload = self._read(path)
+                if payload is None:
+                    continue
+                (live if _pid_alive(payload["pid"]) else dead).append((path, payload))
+            if dead:
+                # 강제 종료된 워커 (정상 종료는 stop()에서 직접 보관)
+                self._archive([path for path, _ in dead])
+            archive = self._read(self.directory / ARCHIVE_FILE) or {"metrics": {}}
+
+        totals: Dict[str, dict] = {}
+        _fold(totals, archive["metrics"])
+        for _, payload in live:
+            _fold(totals, payload["metrics"])
+
+        registry = MetricsRegistry()
+        for name, data in totals.items():
+            if data["type"] == "histogram":
+                metric = Histogram(name, data["help"], data["labelnames"], data["buckets"], registry=registry)
+                for key, (bucket_counts, total, count) in data["series"]:
+                    series = metric._series[tuple(key)] = HistogramSeries(len(metric.buckets))
+                    series.bucket_counts, series.sum, series.count = bucket_counts, total, count
+            else:
+                metric = Counter(name, data["help"], data["labelnames"], registry=registry)
+                metric._series.update((tuple(key), value) for key, value in data["series"])
+
+        gauges: Dict[str, Gauge] = {}
+        for _, payload in live:
+            pid = str(payload["pid"])
+            for name, data in payload["metrics"].items():
+                if data["type"] != "gauge":
+                    continue
+                metric = gauges.get(name)
+                if metric is None:
+                    metric = gauges[name] = Gauge(name, data["help"], [*data["labelnames"], "pid"], registry=registry)
+                metric._series.update((tuple([*key, pid]), value) for key, value in data["series"])
+        return registry
+
+    def render(self) -> str:
+        return render_prometheus(self.merged_registry())
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await asyncio.to_thread(self.write)
+            except OSError as e:
+                print(f"⚠️ Failed to write metrics snapshot: {e}")
+
+    def start(self) -> None:
+        if self.enabled:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self.write()
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop writing and move this worker's counters into the archive"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self.write()
+            with self._locked():
+                self._archive([self._worker_path(os.getpid())])
+
+
+def reset_directory(directory: str) -> None:
+    """Remove snapshots of a previous server run (called by the master before forking)"""
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    for stale in path.glob("*.json"):
+        stale.unlink(missing_ok=True)
+
+
+# Global multiprocess collector (METRICS_MULTIPROCESS_DIR가 비어 있으면 비활성 - 단일 프로세스)
+multiprocess_metrics = MultiprocessCollector(
+    settings.metrics_multiprocess_dir,
+    settings.metrics_multiprocess_interval
+)
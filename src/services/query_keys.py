@@ -0,0 +1,60 @@
+"""Dense integer keys for the recommendation parameter space"""
+from itertools import product
+from typing import Dict, List, Sequence, Tuple
+
+from src.services.schemas import (
+    ArmLength, LegLength, NeckLength, FaceShape, BodyType,
+    GuestCount, Budget, Region, VenueStyle, Season
+)
+
+# RecommendationRequest / VenueRecommendationRequest의 num_recommendations 범위 (1-5)
+NUM_RECOMMENDATIONS = tuple(range(1, 6))
+
+
+class KeySpace:
+    """
+    Mixed-radix encoding of a tuple of small enum dimensions
+
+    Every valid parameter tuple maps to a distinct integer in 0..size-1
+    (first dimension most significant), so keys can index a plain list and
+    fit in a SMALLINT column. The space is small enough to precompute both
+    directions, so encode/decode are a single dict/list lookup.
+    """
+
+    def __init__(self, *dimensions: Sequence):
+        self.dimensions = [tuple(values) for values in dimensions]
+        # itertools.product는 마지막 차원이 가장 빨리 바뀌므로 순번 = 혼합 기수 인코딩 값
+        self._tuples: List[Tuple] = list(product(*self.dimensions))
+        self._keys: Dict[Tuple, int] = {values: key for key, values in enumerate(self._tuples)}
+        self.size = len(self._tuples)
+
+    def encode(self, *values) -> int:
+        """Parameter tuple → key"""
+        key = self._keys.get(values)
+        if key is None:
+            raise ValueError(f"Values out of key space: {values!r}")
+        return key
+
+    def decode(self, key: int) -> Tuple:
+        """Key → parameter tuple"""
+        if not 0 <= key < self.size:
+            raise ValueError(f"Key out of range: {key}")
+        return self._tuples[key]
+
+
+def _values(enum_class) -> Tuple[str, ...]:
+    return tuple(member.value for member in enum_class)
+
+
+# Enum 값을 추가/변경하면 저장된 query_key가 모두 달라지므로 재계산 마이그레이션 필요
+# (arm, leg, neck, face, body, num) → 0..1619
+DRESS_KEYS = KeySpace(
+    _values(ArmLength), _values(LegLength), _values(NeckLength), _values(FaceShape), _values(BodyType),
+    NUM_RECOMMENDATIONS
+)
+
+# (guest_count, budget, region, style, season, num) → 0..5039
+VENUE_KEYS = KeySpace(
+    _values(GuestCount), _values(Budget), _values(Region), _values(VenueStyle), _values(Season),
+    NUM_RECOMMENDATIONS
+)
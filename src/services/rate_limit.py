@@ -0,0 +1,191 @@
+"""
+Per-client rate limiting (token buckets)
+
+Each client gets one bucket per budget. The client is the X-API-Key header
+when it is one of RATE_LIMIT_API_KEYS, otherwise the client IP: unverified
+keys are ignored so that rotating random keys cannot mint fresh buckets.
+A caller holding a registered key that fronts many users (the Spring
+backend) passes X-End-User-Id, and each end user then gets their own bucket
+under that key. The header is ignored without a registered key, since anyone
+could send it. The "cache" budget is charged by
+every recommendation request. The "generation" budget is charged only when a
+request misses every cache tier, so randomized profiles that force LLM calls
+run out long before normal traffic does.
+
+RATE_LIMIT_BACKEND=memory keeps buckets per worker process, so the effective
+limit is workers x rate. With redis, buckets live in Redis and are shared by
+every worker and replica (one EVAL round trip per check). If Redis is
+unavailable, the limiter falls back to the local buckets.
+"""
+import hashlib
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from src.config import settings
+from src.config.redis import redis_client
+from src.services.metrics import Counter, current_request_scope
+
+RATE_LIMITED = Counter(
+    "rate_limited_total",
+    "Requests rejected by the per-client rate limiter",
+    labelnames=("budget", "identity")
+)
+
+Budget = Tuple[float, float]
+
+END_USER_HEADER = b"x-end-user-id"
+
+
+class RateLimited(Exception):
+    """Raised when the client has no tokens left in a budget"""
+
+    def __init__(self, budget: str, retry_after: float):
+        super().__init__(f"Rate limit exceeded for {budget} requests")
+        self.budget = budget
+        self.retry_after = retry_after
+
+
+class TokenBucketStore:
+    """In-process token buckets: key -> [tokens, updated_at, full_at]"""
+
+    def __init__(self, max_entries: int = 100_000):
+        self.max_entries = max_entries
+        self._buckets: Dict[str, List[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def take(self, key: str, rate: float, burst: float, cost: float = 1.0) -> float:
+        """Take cost tokens; returns 0 when allowed, otherwise seconds until enough tokens"""
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_entries:
+                self._prune(now)
+            tokens = burst
+        else:
+            tokens = bucket[0] + (now - bucket[1]) * rate
+            if tokens > burst:
+                tokens = burst
+
+        if tokens >= cost:
+            tokens -= cost
+            wait = 0.0
+        else:
+            wait = (cost - tokens) / rate
+        full_at = now + (burst - tokens) / rate
+        if bucket is None:
+            self._buckets[key] = [tokens, now, full_at]
+        else:
+            bucket[0], bucket[1], bucket[2] = tokens, now, full_at
+        return wait
+
+    def _prune(self, now: float) -> None:
+        # 다시 가득 찬 버킷은 새 버킷과 같으므로 삭제
+        self._buckets = {key: bucket for key, bucket in self._buckets.items() if bucket[2] > now}
+        if len(self._buckets) >= self.max_entries:
+            # 클라이언트가 너무 많으면 오래 전에 생긴 절반을 버림 (메모리 상한 우선)
+            keys = list(self._buckets)
+            for key in keys[:len(keys) // 2]:
+                del self._buckets[key]
+
+
+class RateLimiter:
+    """Per-client token bucket budgets for the current request"""
+
+    def __init__(
+        self,
+        budgets: Dict[str, Budget],
+        store: TokenBucketStore,
+        backend: str = "memory",
+        api_keys: Iterable[str] = ()
+    ):
+        if backend not in ("memory", "redis"):
+            raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {backend}")
+        self.budgets = budgets
+        self.store = store
+        self.backend = backend
+        # 키 원문이 Redis 키 이름/메모리에 남지 않도록 다이제스트로 버킷 구분
+        self.api_keys = {
+            key.encode("latin-1"): hashlib.sha256(key.encode()).hexdigest()[:16]
+            for key in api_keys
+        }
+
+    def client_identity(self, scope: dict) -> Tuple[str, str]:
+        """(identity type, value): end user of a configured API key, the key itself, otherwise the client IP"""
+        forwarded = key_digest = end_user = None
+        for name, value in scope["headers"]:
+            if name == b"x-api-key":
+                key_digest = self.api_keys.get(value, key_digest)
+            elif name == END_USER_HEADER:
+                end_user = value
+            elif name == b"x-forwarded-for":
+                forwarded = value
+        if key_digest is not None:
+            if end_user:
+                # 사용자 식별자는 키별로 구분하고 원문은 남기지 않음
+                return "end_user", hashlib.sha256(key_digest.encode() + b":" + end_user).hexdigest()[:16]
+            return "api_key", key_digest
+        if forwarded is not None and settings.rate_limit_trust_forwarded_for:
+            # 로드밸런서가 붙인 가장 앞의 주소가 실제 클라이언트
+            return "ip", forwarded.split(b",", 1)[0].strip().decode("latin-1")
+        client = scope.get("client")
+        return "ip", client[0] if client else "unknown"
+
+    async def check(self, budget: str, cost: float = 1.0) -> None:
+        """Charge the current request's client; raises RateLimited when the bucket is empty"""
+        rate, burst = self.budgets[budget]
+        scope = current_request_scope.get()
+        if not rate or scope is None:
+            return
+        identity, client = self.client_identity(scope)
+        key = f"{budget}:{identity}:{client}"
+
+        wait: Optional[float] = None
+        if self.backend == "redis" and redis_client.available:
+            result = await redis_client.take_tokens(f"ratelimit:{key}", rate, burst, cost)
+            if result is not None:
+                allowed, tokens = result
+                wait = 0.0 if allowed else (cost - tokens) / rate
+        if wait is None:
+            wait = self.store.take(key, rate, burst, cost)
+
+        if wait:
+            RATE_LIMITED.inc(budget=budget, identity=identity)
+            raise RateLimited(budget, wait)
+
+    def status(self) -> dict:
+        return {
+            "backend": self.backend,
+            "local_buckets": len(self.store),
+            "budgets": {name: {"rate": rate, "burst": burst} for name, (rate, burst) in self.budgets.items()}
+        }
+
+
+def too_many_requests(rejection: RateLimited) -> HTTPException:
+    """429 with Retry-After (whole seconds, at least 1)"""
+    return HTTPException(
+        status_code=429,
+        detail=str(rejection),
+        headers={"Retry-After": str(max(1, int(rejection.retry_after + 0.999)))}
+    )
+
+
+if settings.rate_limit_enabled and not settings.rate_limit_api_key_set and not settings.rate_limit_trust_forwarded_for:
+    print(
+        "⚠️ RATE_LIMIT_ENABLED without RATE_LIMIT_API_KEYS or RATE_LIMIT_TRUST_FORWARDED_FOR: "
+        "clients are keyed by connection IP, so all users behind one upstream share a bucket"
+    )
+
+# Global rate limiter instance (RATE_LIMIT_ENABLED=false면 모든 예산이 0 = 제한 없음)
+rate_limiter = RateLimiter(
+    {
+        "cache": (settings.rate_limit_cache_rate, settings.rate_limit_cache_burst),
+        "generation": (settings.rate_limit_generation_rate, settings.rate_limit_generation_burst),
+    } if settings.rate_limit_enabled else {"cache": (0.0, 0.0), "generation": (0.0, 0.0)},
+    TokenBucketStore(settings.rate_limit_max_clients),
+    settings.rate_limit_backend,
+    settings.rate_limit_api_key_set
+)
@@ -0,0 +1,207 @@
+"""In-process recommendation cache indexed by dense query keys"""
+import asyncio
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import update, bindparam
+
+from src.config import settings
+from src.database.session import engine
+from src.database.models import RecommendationQuery, VenueQuery
+from src.database.aggregates import recommendation_aggregates
+from src.services.metrics import Counter, Gauge, metrics_registry
+from src.services.query_keys import KeySpace, DRESS_KEYS, VENUE_KEYS
+
+MEMORY_CACHE_REQUESTS = Counter(
+    "memory_cache_requests_total",
+    "In-process recommendation cache lookups",
+    labelnames=("cache", "result")
+)
+MEMORY_CACHE_HIT_RATIO = Gauge(
+    "memory_cache_hit_ratio",
+    "Share of in-process cache lookups that hit",
+    labelnames=("cache",)
+)
+
+
+def _update_memory_hit_ratio() -> None:
+    lookups = {}
+    for (cache, result), count in list(MEMORY_CACHE_REQUESTS.series().items()):
+        lookups.setdefault(cache, {})[result] = count
+    for cache, results in lookups.items():
+        total = results.get("hit", 0) + results.get("miss", 0)
+        if total:
+            MEMORY_CACHE_HIT_RATIO.set(results.get("hit", 0) / total, cache=cache)
+
+
+metrics_registry.add_collector(_update_memory_hit_ratio)
+
+
+class RecommendationCache:
+    """
+    Array-indexed cache of recommendation results for one key space
+
+    The key space is small and closed (a few thousand keys), so entries live in
+    a plain list indexed by query_key and the cache never needs eviction.
+    Memory and Redis hits are counted per key and flushed to access_count /
+    last_accessed in one batched UPDATE, so retention and /stats still see them.
+    Compressed response bodies (per encoding) are kept next to each entry and
+    dropped whenever the entry changes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        redis_prefix: str,
+        model,
+        key_space: KeySpace,
+        enabled: bool = True,
+        flush_interval: float = 10.0,
+        on_flush: Optional[Callable[[int, int], None]] = None
+    ):
+        self.name = name
+        self.redis_prefix = redis_prefix
+        self.model = model
+        self.key_space = key_space
+        self.enabled = enabled
+        self.flush_interval = flush_interval
+        self.on_flush = on_flush
+        self._entries: List[Optional[dict]] = [None] * key_space.size
+        self._bodies: List[Optional[Dict[str, bytes]]] = [None] * key_space.size
+        self._pending_hits: List[int] = [0] * key_space.size
+        self._dirty = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def get(self, key: int) -> Optional[dict]:
+        if not self.enabled:
+            return None
+        entry = self._entries[key]
+        if entry is None:
+            MEMORY_CACHE_REQUESTS.inc(cache=self.name, result="miss")
+            return None
+        MEMORY_CACHE_REQUESTS.inc(cache=self.name, result="hit")
+        self.record_hit(key)
+        return entry
+
+    def record_hit(self, key: int) -> None:
+        """Count a hit served without touching the table (memory or Redis)"""
+        self._pending_hits[key] += 1
+        self._dirty.add(key)
+
+    def redis_key(self, key: int) -> str:
+        return f"{self.redis_prefix}:{key}"
+
+    def put(self, key: int, recommendation: dict) -> None:
+        if self.enabled:
+            self._entries[key] = recommendation
+            self._bodies[key] = None
+
+    def body(self, key: int, encoding: str) -> Optional[bytes]:
+        """Precompressed response body for a cached entry (None until first stored)"""
+        bodies = self._bodies[key]
+        return bodies.get(encoding) if bodies else None
+
+    def put_body(self, key: int, encoding: str, body: bytes) -> None:
+        if self.enabled and self._entries[key] is not None:
+            if self._bodies[key] is None:
+                self._bodies[key] = {}
+            self._bodies[key][encoding] = body
+
+    def discard(self, keys: Iterable[int]) -> None:
+        """Drop entries whose rows were deleted (retention)"""
+        for key in keys:
+            self._entries[key] = None
+            self._bodies[key] = None
+            self._pending_hits[key] = 0
+            self._dirty.discard(key)
+
+    def __len__(self) -> int:
+        return sum(entry is not None for entry in self._entries)
+
+    async def warm_from_redis(self, redis_client, batch_size: int = 500) -> int:
+        """Fill the array from Redis with batched MGETs; returns entries loaded"""
+        if not self.enabled or not redis_client.available:
+            return 0
+        loaded = 0
+        for start in range(0, self.key_space.size, batch_size):
+            keys = range(start, min(start + batch_size, self.key_space.size))
+            values = await redis_client.get_many([self.redis_key(key) for key in keys])
+            for key, value in zip(keys, values):
+                if value is not None:
+                    self._entries[key] = value
+                    self._bodies[key] = None
+                    loaded += 1
+        return loaded
+
+    async def flush_hits(self) -> int:
+        """Write pending hits to the table; returns the number of keys updated"""
+        if not self._dirty:
+            return 0
+        dirty, self._dirty = self._dirty, set()
+        params = []
+        for key in dirty:
+            params.append({"b_key": key, "b_hits": self._pending_hits[key]})
+            self._pending_hits[key] = 0
+
+        model = self.model
+        stmt = (
+            update(model)
+            .where(model.query_key == bindparam("b_key"))
+            .values(access_count=model.access_count + bindparam("b_hits"), last_accessed=datetime.utcnow())
+        )
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(stmt, params)
+        except Exception as e:
+            # 접근 통계용이므로 재시도하지 않음
+            print(f"⚠️ Failed to flush {self.name} cache hits: {e}")
+            return 0
+
+        if self.on_flush:
+            for param in params:
+                self.on_flush(param["b_key"], param["b_hits"])
+        return len(params)
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush_hits()
+
+    def start(self) -> None:
+        # 메모리 캐시를 꺼도 Redis 적중 횟수는 반영해야 하므로 항상 실행
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush_hits()
+
+
+def _record_dress_hits(key: int, hits: int) -> None:
+    # 키의 앞 5개 차원이 /stats 조합(arm, leg, neck, face, body)과 같음
+    recommendation_aggregates.record_hits(DRESS_KEYS.decode(key)[:5], hits)
+
+
+# Global cache instances
+dress_cache = RecommendationCache(
+    "dress",
+    "recommendation",
+    RecommendationQuery,
+    DRESS_KEYS,
+    settings.memory_cache_enabled,
+    settings.memory_cache_flush_interval,
+    on_flush=_record_dress_hits
+)
+venue_cache = RecommendationCache(
+    "venue",
+    "venue",
+    VenueQuery,
+    VENUE_KEYS,
+    settings.memory_cache_enabled,
+    settings.memory_cache_flush_interval
+)
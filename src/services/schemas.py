@@ -255,3 +255,61 @@ class VenueRecommendationResponse(BaseModel):
     overall_advice: str = Field(..., description="Overall advice")
     cached: bool = Field(default=False, description="Whether cached result")
     source: str = Field(default="ai_generated", description="Result source")
+
+
+# ============================================================================
+# Image Schemas
+# ============================================================================
+
+class ImageSizePreset(str, Enum):
+    THUMB = "thumb"
+    MEDIUM = "medium"
+    ORIGINAL = "original"
+
+
+class ImageRef(BaseModel):
+    """Single image reference (table/filename pair)"""
+    table_name: str = Field(..., description="Table name (tb_dress, tb_wedding_hall, ...)")
+    filename: str = Field(..., description="File name (with or without extension)")
+
+
+class BulkImageRequest(BaseModel):
+    """Bulk image fetch request"""
+    items: List[ImageRef] = Field(..., min_length=1, max_length=50, description="Images to fetch (max 50)")
+    size: Optional[ImageSizePreset] = Field(
+        default=None,
+        description="Size preset; falls back to the original file when the variant is missing"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [
+                    {"table_name": "tb_wedding_hall", "filename": "hall_1"},
+                    {"table_name": "tb_dress", "filename": "dress_3.png"}
+                ],
+                "size": "thumb"
+            }
+        }
+
+
+# ============================================================================
+# Cache Administration Schemas
+# ============================================================================
+
+class CacheKind(str, Enum):
+    DRESS = "dress"
+    VENUE = "venue"
+
+
+class CacheInvalidationRequest(BaseModel):
+    """Recommendation cache invalidation request"""
+    kind: CacheKind = Field(..., description="Cache to invalidate (dress/venue)")
+    query_keys: Optional[List[int]] = Field(
+        default=None,
+        description="Dense query keys to drop; omit to drop the whole cache"
+    )
+    delete_rows: bool = Field(
+        default=False,
+        description="Also delete the stored MySQL rows so the next request regenerates them"
+    )
@@ -1,28 +1,29 @@
 """Wedding venue recommendation engine - SQL query based"""
-import hashlib
 from sqlalchemy import text
-from src.database import AsyncSessionLocal
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.services.venue_query_builder import build_venue_query
+from src.services.venues_data import filter_venues
+from src.services.query_keys import VENUE_KEYS
 
 
 class VenueRecommender:
     """SQL query based venue recommendation engine"""
 
     @staticmethod
-    def generate_hash(
+    def generate_key(
         guest_count: str,
         budget: str,
         region: str,
         style: str,
         season: str,
         num: int = 3
-    ) -> str:
-        """Generate unique hash for request parameters"""
-        params = f"{guest_count}_{budget}_{region}_{style}_{season}_{num}"
-        return hashlib.sha256(params.encode()).hexdigest()
+    ) -> int:
+        """Get the dense integer key for request parameters"""
+        return VENUE_KEYS.encode(guest_count, budget, region, style, season, num)
 
     async def generate(
         self,
+        db: AsyncSession,
         guest_count: str,
         budget: str,
         region: str,
@@ -38,9 +39,8 @@ class VenueRecommender:
         )
 
         # Execute query with parameters
-        async with AsyncSessionLocal() as db:
-            result = await db.execute(text(query), params)
-            rows = result.mappings().fetchall()  # 컬럼명으로 접근 가능
+        result = await db.execute(text(query), params)
+        rows = result.mappings().fetchall()  # 컬럼명으로 접근 가능
 
         # Handle empty results - 조건 완화해서 비슷한 결과 찾기
         if not rows:
@@ -54,7 +54,18 @@ class VenueRecommender:
                 "overall_advice": "조건에 맞는 웨딩홀을 찾지 못했습니다. 다른 조건으로 검색해보세요."
             }
 
-        # Build response
+        return self.format_rows(rows, guest_count, budget, region, style_preference, season)
+
+    def format_rows(
+        self,
+        rows,
+        guest_count: str,
+        budget: str,
+        region: str,
+        style_preference: str,
+        season: str
+    ) -> dict:
+        """Build the recommendation payload from tb_wedding_hall rows"""
         recommendations = []
         for row in rows:
             # 컬럼명으로 접근 (인덱스 의존 제거)
@@ -120,6 +131,38 @@ class VenueRecommender:
             "overall_advice": overall_advice
         }
 
+    def fallback(
+        self,
+        guest_count: str,
+        budget: str,
+        region: str,
+        style_preference: str,
+        season: str,
+        num_recommendations: int = 3
+    ) -> dict:
+        """Score-based recommendation from the built-in venue catalog (no DB query), served under overload"""
+        recommendations = []
+        for venue in filter_venues(guest_count, budget, region, style_preference, season, num_recommendations):
+            capacity = venue["capacity"]
+            recommendations.append({
+                "venue_name": venue["venue_name"],
+                "description": venue["description"],
+                "capacity": f"{capacity['min']}~{capacity['max']}명",
+                "location": venue["location"],
+                "price_range": venue["price_range"],
+                "estimated_cost": "문의 필요",
+                "why_recommended": f"{guest_count} 하객, {budget} 예산대 조건에 맞는 웨딩홀입니다.",
+                "pros": venue.get("pros", []),
+                "cons": venue.get("cons", []),
+                "amenities": venue.get("amenities", []),
+                "food_style": venue.get("food_style", []),
+                "booking_tips": [f"{season} 시즌은 최소 6개월 전 예약 권장"]
+            })
+        return {
+            "recommendations": recommendations,
+            "overall_advice": "요청이 많아 기본 조건 기준으로 빠르게 추천드렸어요. 잠시 후 다시 요청하시면 더 많은 웨딩홀을 확인하실 수 있습니다."
+        }
+
     def _estimate_price_range(self, venue_type: str) -> str:
         """venueType 기반 가격대 추정"""
         price_map = {
@@ -206,7 +249,7 @@ class VenueRecommender:
 
     async def _find_fallback_venue(
         self,
-        db,
+        db: AsyncSession,
         guest_count: str,
         budget: str,
         region: str,
@@ -243,41 +286,40 @@ class VenueRecommender:
                 "스타일 조건만 적용"
             ))
 
-        async with AsyncSessionLocal() as new_db:
-            for query, params, relaxed_condition in fallback_queries:
-                result = await new_db.execute(text(query), params)
-                row = result.mappings().fetchone()
-
-                if row:
-                    # 결과 포맷팅
-                    venue_type = row["venueType"]
-                    venue_type_kr = {
-                        "HOTEL": "호텔", "WEDDING_HALL": "웨딩홀", "OUTDOOR": "야외",
-                        "RESTAURANT": "레스토랑", "HOUSE_STUDIO": "하우스스튜디오",
-                        "GARDEN": "가든", "OTHER": "기타"
-                    }.get(venue_type, venue_type)
-
-                    recommendation = {
-                        "venue_name": row["name"],
-                        "description": f"{venue_type_kr} 타입의 웨딩홀입니다.",
-                        "capacity": f"주차 {row['parking']}대 가능",
-                        "location": row["address"] or "정보 없음",
-                        "price_range": self._estimate_price_range(venue_type),
-                        "estimated_cost": self._estimate_cost(venue_type, guest_count),
-                        "why_recommended": f"정확히 일치하는 결과가 없어 {relaxed_condition}하여 추천드립니다.",
-                        "pros": self._get_pros(venue_type),
-                        "cons": self._get_cons(venue_type),
-                        "amenities": [f"주차 {row['parking']}대"],
-                        "food_style": self._get_food_style(venue_type),
-                        "phone": row["phone"] or "",
-                        "image_url": row["imageUrl"] or "",
-                        "booking_tips": ["조건을 조정하시면 더 많은 옵션을 확인할 수 있습니다."]
-                    }
-
-                    return {
-                        "recommendations": [recommendation],
-                        "overall_advice": f"정확히 일치하는 결과가 없어 {relaxed_condition}하여 비슷한 웨딩홀을 추천드립니다."
-                    }
+        for query, params, relaxed_condition in fallback_queries:
+            result = await db.execute(text(query), params)
+            row = result.mappings().fetchone()
+
+            if row:
+                # 결과 포맷팅
+                venue_type = row["venueType"]
+                venue_type_kr = {
+                    "HOTEL": "호텔", "WEDDING_HALL": "웨딩홀", "OUTDOOR": "야외",
+                    "RESTAURANT": "레스토랑", "HOUSE_STUDIO": "하우스스튜디오",
+                    "GARDEN": "가든", "OTHER": "기타"
+                }.get(venue_type, venue_type)
+
+                recommendation = {
+                    "venue_name": row["name"],
+                    "description": f"{venue_type_kr} 타입의 웨딩홀입니다.",
+                    "capacity": f"주차 {row['parking']}대 가능",
+                    "location": row["address"] or "정보 없음",
+                    "price_range": self._estimate_price_range(venue_type),
+                    "estimated_cost": self._estimate_cost(venue_type, guest_count),
+                    "why_recommended": f"정확히 일치하는 결과가 없어 {relaxed_condition}하여 추천드립니다.",
+                    "pros": self._get_pros(venue_type),
+                    "cons": self._get_cons(venue_type),
+                    "amenities": [f"주차 {row['parking']}대"],
+                    "food_style": self._get_food_style(venue_type),
+                    "phone": row["phone"] or "",
+                    "image_url": row["imageUrl"] or "",
+                    "booking_tips": ["조건을 조정하시면 더 많은 옵션을 확인할 수 있습니다."]
+                }
+
+                return {
+                    "recommendations": [recommendation],
+                    "overall_advice": f"정확히 일치하는 결과가 없어 {relaxed_condition}하여 비슷한 웨딩홀을 추천드립니다."
+                }
 
         return None
 
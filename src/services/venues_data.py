@@ -1,4 +1,5 @@
 """Wedding venue database"""
+from functools import lru_cache
 
 WEDDING_VENUES = {
     "더 클래식 500": {
@@ -412,8 +413,9 @@ def get_all_venue_names() -> list[str]:
     return list(WEDDING_VENUES.keys())
 
 
+@lru_cache(maxsize=None)
 def get_venues_with_suitability() -> str:
-    """Get formatted list of venues with their suitability information"""
+    """Get formatted list of venues with their suitability information (built once per process)"""
     lines = []
     for venue_name, venue_info in WEDDING_VENUES.items():
         suitable = venue_info["suitable_for"]
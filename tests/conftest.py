@@ -0,0 +1,23 @@
+"""
+Shared test setup
+
+Settings are read on first import, so the environment is pinned here before
+any src module is imported: a throwaway SQLite database, no Redis, and no
+background event/retention jobs.
+"""
+import os
+import tempfile
+
+_TEST_DB = os.path.join(tempfile.gettempdir(), f"wedding_api_test_{os.getpid()}.db")
+
+for key, value in {
+    "DB_URL": f"sqlite+aiosqlite:///{_TEST_DB}",
+    "DB_PASSWORD": "test",
+    "OPENAI_API_KEY": "test",
+    "DB_CREATE_TABLES_ON_STARTUP": "true",
+    "DB_POOL_WARMUP": "0",
+    "REDIS_BACKEND": "none",
+    "EVENTS_ENABLED": "false",
+    "CACHE_RETENTION_ENABLED": "false",
+}.items():
+    os.environ.setdefault(key, value)
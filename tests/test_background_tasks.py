@@ -0,0 +1,29 @@
+import asyncio
+
+from src.database import maintenance
+from src.database.maintenance import RetentionScheduler
+
+
+def test_stop_waits_for_running_retention_pass(monkeypatch):
+    events = []
+
+    async def slow_retention(optimize: bool = False):
+        events.append("started")
+        try:
+            await asyncio.sleep(10)
+        finally:
+            # 정리 작업이 stop() 반환 전에 끝나야 엔진 dispose와 겹치지 않음
+            await asyncio.sleep(0.01)
+            events.append("cleaned up")
+
+    monkeypatch.setattr(maintenance, "run_retention", slow_retention)
+
+    async def run():
+        scheduler = RetentionScheduler(interval=0, optimize_every=0)
+        scheduler.start()
+        await asyncio.sleep(0.01)
+        await scheduler.stop()
+        events.append("stopped")
+
+    asyncio.run(run())
+    assert events == ["started", "cleaned up", "stopped"]
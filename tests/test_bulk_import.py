@@ -0,0 +1,58 @@
+import asyncio
+import io
+import json
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.database.models import Survey, WeddingDress
+from src.database.session import Base
+from src.services.bulk_import import ImportFormat, ImportTarget, import_records
+
+SURVEY = {"arm_length": "short", "leg_length": "long", "neck_length": "medium", "face_shape": "oval", "body_type": "thin"}
+
+
+def run_import(tmp_path, target: ImportTarget, lines: list, chunk_size: int):
+    async def run():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'import.db'}")
+
+        # MySQL처럼 외래 키 위반을 오류로 처리
+        @event.listens_for(engine.sync_engine, "connect")
+        def _foreign_keys(dbapi_connection, _):
+            dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        sessions = async_sessionmaker(engine, class_=AsyncSession)
+        async with sessions() as db:
+            await import_records(db, ImportTarget.DRESSES, io.StringIO(json.dumps({"id": 1, "name": "A"})), ImportFormat.NDJSON)
+            stream = io.StringIO("\n".join(json.dumps(line) for line in lines))
+            report = await import_records(db, target, stream, ImportFormat.NDJSON, chunk_size)
+            stored = await db.scalar(select(func.count()).select_from(Survey))
+        await engine.dispose()
+        return report, stored
+
+    return asyncio.run(run())
+
+
+def test_database_error_fails_only_its_chunk(tmp_path):
+    lines = [
+        {**SURVEY, "dress_id": 1}, {**SURVEY},
+        {**SURVEY, "dress_id": 999}, {**SURVEY},  # 존재하지 않는 드레스 - 청크 2 실패
+        {**SURVEY, "dress_id": 1}
+    ]
+    report, stored = run_import(tmp_path, ImportTarget.SURVEYS, lines, chunk_size=2)
+
+    assert (report["imported"], report["failed"], report["rejected"], report["chunks"]) == (3, 2, 0, 3)
+    assert stored == 3
+    assert report["failed_chunks"][0]["lines"] == [3, 4]
+    assert "FOREIGN KEY" in report["failed_chunks"][0]["error"]
+
+
+def test_invalid_rows_are_rejected_not_failed(tmp_path):
+    lines = [{**SURVEY}, {**SURVEY, "body_type": "unknown"}, {**SURVEY}]
+    report, stored = run_import(tmp_path, ImportTarget.SURVEYS, lines, chunk_size=10)
+
+    assert (report["imported"], report["rejected"], report["failed"]) == (2, 1, 0)
+    assert report["errors"][0]["line"] == 2
+    assert stored == 2
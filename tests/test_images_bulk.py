@@ -0,0 +1,62 @@
+import asyncio
+from pathlib import Path
+
+from src.api.routes import images
+from src.config import settings
+from src.services.schemas import BulkImageRequest
+
+
+def stream(request: BulkImageRequest) -> bytes:
+    async def collect():
+        return b"".join([part async for part in images._stream_multipart(request, "b")])
+    return asyncio.run(collect())
+
+
+def test_file_deleted_after_resolve_becomes_404_part(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "image_base_path", str(tmp_path))
+    (tmp_path / "tb_dress").mkdir()
+    (tmp_path / "tb_dress" / "a.png").write_bytes(b"A" * 10)
+    (tmp_path / "tb_dress" / "b.png").write_bytes(b"B" * 5)
+
+    resolve = images._resolve_image_path
+
+    def resolve_then_delete(table_name, filename, size=None):
+        path = resolve(table_name, filename, size)
+        if filename == "a.png":
+            path.unlink()  # 경로 확인 직후 삭제됨
+        return path
+
+    monkeypatch.setattr(images, "_resolve_image_path", resolve_then_delete)
+    body = stream(BulkImageRequest(items=[
+        {"table_name": "tb_dress", "filename": "a"},
+        {"table_name": "tb_dress", "filename": "b"}
+    ]))
+
+    parts = body.split(b"--b\r\n")[1:]
+    assert b"X-Status: 404" in parts[0] and b"Content-Length: 0" in parts[0]
+    assert b"X-Status: 200" in parts[1] and b"Content-Length: 5\r\n\r\nBBBBB\r\n" in parts[1]
+    assert body.endswith(b"--b--\r\n")
+
+
+def test_bulk_response_is_not_marked_cacheable():
+    response = asyncio.run(images.get_images_bulk(BulkImageRequest(items=[{"table_name": "t", "filename": "x"}])))
+    assert "cache-control" not in response.headers
+
+
+def test_paths_are_resolved_off_the_event_loop(tmp_path, monkeypatch):
+    import threading
+
+    monkeypatch.setattr(settings, "image_base_path", str(tmp_path))
+    (tmp_path / "tb_dress").mkdir()
+    (tmp_path / "tb_dress" / "a.png").write_bytes(b"A")
+
+    resolve = images._resolve_image_path
+    threads = []
+
+    def recording_resolve(*args):
+        threads.append(threading.current_thread())
+        return resolve(*args)
+
+    monkeypatch.setattr(images, "_resolve_image_path", recording_resolve)
+    stream(BulkImageRequest(items=[{"table_name": "tb_dress", "filename": "a"}] * 2))
+    assert len(threads) == 2 and threading.main_thread() not in threads
@@ -0,0 +1,76 @@
+import asyncio
+import json
+import os
+
+from src.services.metrics import Counter, Gauge, Histogram, MetricsRegistry
+from src.services.metrics_multiprocess import MultiprocessCollector, _snapshot
+
+# 존재하지 않는 PID (강제 종료된 워커)
+DEAD_PID = 4_000_000
+
+
+def worker_registry(requests: int, in_flight: int) -> MetricsRegistry:
+    registry = MetricsRegistry()
+    Counter("requests_total", "Requests", ("route",), registry=registry).inc(requests, route="/recommend")
+    Gauge("in_flight", "In flight", registry=registry).set(in_flight)
+    Histogram("latency_seconds", "Latency", buckets=(0.1, 1.0), registry=registry).observe(0.05)
+    return registry
+
+
+def write_worker(directory, pid: int, registry: MetricsRegistry) -> None:
+    (directory / f"worker-{pid}.json").write_text(json.dumps({"pid": pid, "metrics": _snapshot(registry)}))
+
+
+def test_counters_are_summed_and_gauges_labeled_per_worker(tmp_path):
+    collector = MultiprocessCollector(str(tmp_path), registry=worker_registry(3, 1))
+    write_worker(tmp_path, os.getppid(), worker_registry(2, 5))
+
+    merged = collector.merged_registry()
+    assert merged.get("requests_total").value(route="/recommend") == 5
+    assert merged.get("latency_seconds").series()[()].count == 2
+    gauge = merged.get("in_flight")
+    assert gauge.value(pid=str(os.getpid())) == 1 and gauge.value(pid=str(os.getppid())) == 5
+
+
+def test_dead_worker_counters_are_kept_but_gauges_dropped(tmp_path):
+    collector = MultiprocessCollector(str(tmp_path), registry=worker_registry(3, 1))
+    write_worker(tmp_path, DEAD_PID, worker_registry(10, 7))
+
+    for _ in range(2):
+        merged = collector.merged_registry()
+        assert merged.get("requests_total").value(route="/recommend") == 13
+        assert merged.get("in_flight").value(pid=str(DEAD_PID)) == 0
+    assert not (tmp_path / f"worker-{DEAD_PID}.json").exists()
+
+
+def test_stopped_worker_counters_survive_in_archive(tmp_path):
+    async def run():
+        collector = MultiprocessCollector(str(tmp_path), interval=60, registry=worker_registry(4, 1))
+        collector.start()
+        await collector.stop()
+
+    asyncio.run(run())
+    # 재시작된 워커는 새 레지스트리로 시작
+    replacement = MultiprocessCollector(str(tmp_path), registry=worker_registry(1, 0))
+    assert replacement.merged_registry().get("requests_total").value(route="/recommend") == 5
+
+
+def test_concurrent_writers_do_not_clash(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    collector = MultiprocessCollector(str(tmp_path), registry=worker_registry(1, 1))
+    # 주기 쓰기 스레드와 스크레이프 스레드가 동시에 쓰는 상황
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: collector.write(), range(200)))
+    assert [path.name for path in tmp_path.iterdir()] == [f"worker-{os.getpid()}.json"]
+
+
+def test_scrape_survives_snapshot_write_failure(tmp_path, monkeypatch):
+    collector = MultiprocessCollector(str(tmp_path), registry=worker_registry(3, 1))
+    write_worker(tmp_path, os.getppid(), worker_registry(2, 5))
+
+    def fail():
+        raise FileNotFoundError("tmp file renamed by another thread")
+
+    monkeypatch.setattr(collector, "write", fail)
+    assert "requests_total" in collector.render()
@@ -0,0 +1,39 @@
+import base64
+import json
+from datetime import datetime
+
+import pytest
+
+from src.database.pagination import CURSOR_VERSION, decode_cursor, encode_cursor
+
+
+def token(*values) -> str:
+    raw = json.dumps([CURSOR_VERSION, *values]).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def test_round_trip():
+    created_at = datetime(2026, 5, 1, 12, 30)
+    assert decode_cursor(encode_cursor(created_at, 7), (datetime, int)) == (created_at, 7)
+    assert decode_cursor(None, (int,)) is None
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-base64!!",
+    token({"dt": 12345}, 7),          # dt가 문자열이 아님
+    token({"dt": "yesterday"}, 7),    # 날짜 형식이 아님
+    token("2026-05-01T12:30:00", 7),  # dt 객체가 아님
+    token({"dt": "2026-05-01T12:30:00"}, "7"),
+    token({"dt": "2026-05-01T12:30:00"}, True),
+    token({"dt": "2026-05-01T12:30:00"}, [1]),
+    token({"dt": "2026-05-01T12:30:00"}),  # 값 개수 부족
+])
+def test_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor, (datetime, int))
+
+
+@pytest.mark.parametrize("value", [1.5, "3", None, {"id": 3}])
+def test_id_cursor_requires_an_int(value):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(token(value), (int,))
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from src.config.settings import Settings
+from src.services.metrics import current_request_scope
+from src.services.rate_limit import RateLimited, RateLimiter, TokenBucketStore
+
+
+def scope(ip: str, api_key: str = None, end_user: str = None) -> dict:
+    headers = [(b"content-type", b"application/json")]
+    if api_key is not None:
+        headers.append((b"x-api-key", api_key.encode()))
+    if end_user is not None:
+        headers.append((b"x-end-user-id", end_user.encode()))
+    return {"type": "http", "headers": headers, "client": (ip, 5000)}
+
+
+def limiter(api_keys=()) -> RateLimiter:
+    return RateLimiter({"generation": (0.001, 3)}, TokenBucketStore(), "memory", api_keys)
+
+
+def outcomes(rate_limiter: RateLimiter, scopes: list) -> list:
+    async def run():
+        results = []
+        for request_scope in scopes:
+            token = current_request_scope.set(request_scope)
+            try:
+                await rate_limiter.check("generation")
+                results.append(200)
+            except RateLimited:
+                results.append(429)
+            finally:
+                current_request_scope.reset(token)
+        return results
+    return asyncio.run(run())
+
+
+def test_unregistered_api_keys_fall_back_to_client_ip():
+    rotating = [scope("10.0.0.1", f"random-{i}") for i in range(5)]
+    assert outcomes(limiter(), rotating) == [200, 200, 200, 429, 429]
+
+
+def test_registered_api_key_gets_its_own_bucket():
+    rate_limiter = limiter({"partner"})
+    assert outcomes(rate_limiter, [scope("10.0.0.1")] * 4) == [200, 200, 200, 429]
+    # 같은 IP여도 등록된 키는 별도 버킷
+    assert outcomes(rate_limiter, [scope("10.0.0.1", "partner")] * 4) == [200, 200, 200, 429]
+
+
+@pytest.mark.parametrize("api_key", [None, "unknown"])
+def test_identity_is_ip_without_registered_key(api_key):
+    assert limiter({"partner"}).client_identity(scope("10.0.0.9", api_key)) == ("ip", "10.0.0.9")
+
+
+def test_api_key_identity_does_not_expose_key():
+    identity, value = limiter({"partner"}).client_identity(scope("10.0.0.9", "partner"))
+    assert identity == "api_key" and "partner" not in value
+
+
+def test_rate_limiting_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("RATE_LIMIT_ENABLED", raising=False)
+    assert Settings().rate_limit_enabled is False
+
+
+def test_single_upstream_ip_gets_a_bucket_per_end_user():
+    # 모든 요청이 백엔드 IP 하나에서 옴
+    rate_limiter = limiter({"backend"})
+    assert outcomes(rate_limiter, [scope("172.18.0.5", "backend", "user-1")] * 4) == [200, 200, 200, 429]
+    assert outcomes(rate_limiter, [scope("172.18.0.5", "backend", "user-2")] * 3) == [200, 200, 200]
+    assert outcomes(rate_limiter, [scope("172.18.0.5", "backend")] * 3) == [200, 200, 200]
+
+
+def test_end_user_header_is_ignored_without_registered_key():
+    spoofed = [scope("10.0.0.1", None, f"user-{i}") for i in range(4)]
+    assert outcomes(limiter({"backend"}), spoofed) == [200, 200, 200, 429]
@@ -0,0 +1,51 @@
+import asyncio
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.database.models import RecommendationQuery, VenueQuery
+from src.database.repositories.dress import recommendation_repo
+from src.database.repositories.venue import venue_repo
+from src.database.session import Base
+
+
+def concurrent_creates(tmp_path, create, model):
+    """Two workers (separate sessions) that both missed the cache store the same key at once"""
+    async def run():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'repos.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        sessions = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        async with sessions() as first, sessions() as second:
+            records = await asyncio.gather(
+                create(first, {"worker": 1}),
+                create(second, {"worker": 2})
+            )
+        async with sessions() as db:
+            stored = await db.scalar(select(func.count()).select_from(model))
+        await engine.dispose()
+        return records, stored
+
+    return asyncio.run(run())
+
+
+def test_concurrent_dress_creates_return_the_stored_row(tmp_path):
+    records, stored = concurrent_creates(
+        tmp_path,
+        lambda db, rec: recommendation_repo.create(db, 42, "short", "long", "medium", "oval", rec, "thin"),
+        RecommendationQuery
+    )
+    assert stored == 1
+    assert records[0].id == records[1].id
+    assert records[0].recommendation == records[1].recommendation
+
+
+def test_concurrent_venue_creates_return_the_stored_row(tmp_path):
+    records, stored = concurrent_creates(
+        tmp_path,
+        lambda db, rec: venue_repo.create(db, 42, "중규모", "중", "서울", "모던", "봄", rec),
+        VenueQuery
+    )
+    assert stored == 1
+    assert records[0].id == records[1].id
+    assert records[0].recommendation == records[1].recommendation
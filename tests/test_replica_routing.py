@@ -0,0 +1,69 @@
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.database.models import RecommendationQuery, VenueQuery
+from src.database.repositories.dress import recommendation_repo
+from src.database.routing import ReplicaRouter, RoutingSession
+from src.database.session import Base
+
+
+def make_router(tmp_path, window: float = 5.0):
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    router = ReplicaRouter(primary, [replica], read_your_writes_window=window)
+    router.replicas[0].healthy = True
+    return router
+
+
+def session_factory(router: ReplicaRouter):
+    session_class = type("TestRoutingSession", (RoutingSession,), {"router": router})
+    return async_sessionmaker(router.primary, class_=AsyncSession, sync_session_class=session_class)
+
+
+def by_key(model, query_key: int):
+    return select(model).where(model.query_key == query_key)
+
+
+async def insert_dress_row(router: ReplicaRouter, query_key: int) -> None:
+    async with router.primary.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with session_factory(router)() as session:
+        await recommendation_repo.create(
+            session, query_key, "short", "short", "short", "oval", {"recommendations": []}, "thin"
+        )
+
+
+def target(router: ReplicaRouter, statement) -> str:
+    session = session_factory(router)().sync_session
+    bind = router.get_bind(session, statement)
+    return "primary" if bind is router.primary.sync_engine else "replica"
+
+
+def test_new_row_is_read_from_primary_only_for_its_key(tmp_path):
+    router = make_router(tmp_path)
+    asyncio.run(insert_dress_row(router, 5))
+
+    assert target(router, by_key(RecommendationQuery, 5)) == "primary"
+    # 다른 키, 다른 테이블의 같은 키 번호는 계속 replica
+    assert target(router, by_key(RecommendationQuery, 6)) == "replica"
+    assert target(router, by_key(VenueQuery, 5)) == "replica"
+
+
+def test_window_expires(tmp_path):
+    router = make_router(tmp_path, window=0.05)
+    asyncio.run(insert_dress_row(router, 5))
+    assert target(router, by_key(RecommendationQuery, 5)) == "primary"
+    asyncio.run(asyncio.sleep(0.06))
+    assert target(router, by_key(RecommendationQuery, 5)) == "replica"
+    assert not router._recent_inserts
+
+
+def test_additional_conditions_still_match_key(tmp_path):
+    router = make_router(tmp_path)
+    router.mark_insert("recommendation_queries", 9)
+    statement = select(RecommendationQuery).where(
+        RecommendationQuery.access_count > 0, RecommendationQuery.query_key == 9
+    )
+    assert target(router, statement) == "primary"
@@ -0,0 +1,16 @@
+import pytest
+
+from src.api import server
+from src.config import settings
+
+
+@pytest.mark.parametrize("workers, backend, warned", [
+    (4, "none", True),
+    (4, "fake", True),
+    (4, "redis", False),
+    (1, "none", False),
+])
+def test_warns_when_workers_cannot_share_single_flight(monkeypatch, capsys, workers, backend, warned):
+    monkeypatch.setattr(settings, "redis_backend", backend)
+    server.warn_uncoordinated_generation(workers)
+    assert ("⚠️" in capsys.readouterr().out) is warned
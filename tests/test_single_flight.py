@@ -0,0 +1,153 @@
+import asyncio
+
+import pytest
+
+from src.config import settings
+from src.services.admission import AdmissionRejected
+from src.services.cache_coordination import CacheCoordinator
+from src.services.events import served_from_cache
+from src.services.recommendation_cache import dress_cache, venue_cache
+from src.services.schemas import VenueRecommendation
+from src.services.venue_recommender import venue_recommender
+
+
+class Loaders:
+    """generate()/reload() pair for one simulated request"""
+
+    def __init__(self, name: str, release: asyncio.Event = None, error: Exception = None):
+        self.name = name
+        self.release = release
+        self.error = error
+        self.calls = 0
+
+    async def generate(self):
+        self.calls += 1
+        if self.release is not None:
+            await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return {"generated_by": self.name}
+
+    async def reload(self):
+        return None
+
+
+def start(coordinator: CacheCoordinator, loaders: Loaders) -> asyncio.Task:
+    return asyncio.create_task(coordinator.single_flight(dress_cache, 7, loaders.generate, loaders.reload))
+
+
+def test_concurrent_requests_share_one_generation():
+    async def run():
+        coordinator = CacheCoordinator([dress_cache])
+        release = asyncio.Event()
+        leader, follower = Loaders("leader", release), Loaders("follower")
+        tasks = [start(coordinator, leader), start(coordinator, follower)]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*tasks), leader, follower
+
+    (first, second), leader, follower = asyncio.run(run())
+    assert first == ({"generated_by": "leader"}, True)
+    assert second == ({"generated_by": "leader"}, False)
+    assert (leader.calls, follower.calls) == (1, 0)
+
+
+def test_cancelled_leader_does_not_cancel_waiters():
+    async def run():
+        coordinator = CacheCoordinator([dress_cache])
+        leader = Loaders("leader", asyncio.Event())
+        follower = Loaders("follower")
+        leader_task = start(coordinator, leader)
+        await asyncio.sleep(0)
+        follower_task = start(coordinator, follower)
+        await asyncio.sleep(0)
+        # 리더 요청의 클라이언트 연결이 끊김
+        leader_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader_task
+        return await follower_task, follower, coordinator
+
+    result, follower, coordinator = asyncio.run(run())
+    assert result == ({"generated_by": "follower"}, True)
+    assert follower.calls == 1
+    assert not coordinator._inflight
+
+
+def test_cancelled_leader_hands_over_to_a_single_waiter():
+    async def run():
+        coordinator = CacheCoordinator([dress_cache])
+        leader_task = start(coordinator, Loaders("leader", asyncio.Event()))
+        await asyncio.sleep(0)
+        release = asyncio.Event()
+        followers = [Loaders(f"follower-{i}", release) for i in range(3)]
+        tasks = [start(coordinator, loaders) for loaders in followers]
+        await asyncio.sleep(0)
+        leader_task.cancel()
+        await asyncio.sleep(0.01)
+        release.set()
+        return await asyncio.gather(*tasks), followers
+
+    results, followers = asyncio.run(run())
+    assert sum(loaders.calls for loaders in followers) == 1
+    assert sum(generated for _, generated in results) == 1
+    assert len({result["generated_by"] for result, _ in results}) == 1
+
+
+def test_generation_error_reaches_waiters():
+    async def run():
+        coordinator = CacheCoordinator([dress_cache])
+        release = asyncio.Event()
+        tasks = [
+            start(coordinator, Loaders("leader", release, RuntimeError("LLM failed"))),
+            start(coordinator, Loaders("follower"))
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_saturated_generation_is_served_degraded_and_uncached():
+    async def run():
+        coordinator = CacheCoordinator([venue_cache])
+        saturated = Loaders("leader", error=AdmissionRejected("venue_generation", "queue_full", 1))
+        fallback = lambda: venue_recommender.fallback("대규모", "고", "서울", "럭셔리", "봄", 2)
+        return await coordinator.serve_generated(venue_cache, 11, saturated.generate, saturated.reload, fallback)
+
+    result, source = asyncio.run(run())
+    assert source == "degraded" and not served_from_cache(source)
+    assert venue_cache.get(11) is None
+    assert [VenueRecommendation(**rec) for rec in result["recommendations"]]
+
+
+def test_saturated_generation_raises_without_degraded_responses(monkeypatch):
+    monkeypatch.setattr(settings, "admission_degraded_responses", False)
+
+    async def run():
+        coordinator = CacheCoordinator([venue_cache])
+        saturated = Loaders("leader", error=AdmissionRejected("venue_generation", "queue_full", 1))
+        return await coordinator.serve_generated(venue_cache, 12, saturated.generate, saturated.reload, dict)
+
+    with pytest.raises(AdmissionRejected):
+        asyncio.run(run())
+
+
+def test_served_sources_report_cached_consistently():
+    async def run():
+        coordinator = CacheCoordinator([dress_cache])
+        release = asyncio.Event()
+        leader, follower = Loaders("leader", release), Loaders("follower")
+        tasks = [
+            asyncio.create_task(coordinator.serve_generated(dress_cache, 13, loaders.generate, loaders.reload, dict))
+            for loaders in (leader, follower)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    (_, leader_source), (_, follower_source) = asyncio.run(run())
+    assert (leader_source, follower_source) == ("ai_generated", "coalesced")
+    assert not served_from_cache(leader_source) and served_from_cache(follower_source)
+    assert dress_cache.get(13) == {"generated_by": "leader"}
@@ -0,0 +1,40 @@
+import pytest
+
+from src.database import instrumentation
+from src.database.instrumentation import normalize_statement
+
+
+@pytest.mark.parametrize("statement, expected", [
+    ("SELECT * FROM t WHERE id IN (?, ?, ?)", "SELECT * FROM t WHERE id IN (...)"),
+    ("SELECT * FROM t WHERE id IN (%s)", "SELECT * FROM t WHERE id IN (...)"),
+    ("DELETE FROM t WHERE k IN (%s, %s) AND a = %s", "DELETE FROM t WHERE k IN (...) AND a = %s"),
+    ("INSERT INTO t (a, b) VALUES (?, ?), (?, ?), (?, ?)", "INSERT INTO t (a, b) VALUES (...)"),
+    ("INSERT INTO t (a) VALUES (%s),(%s)", "INSERT INTO t (a) VALUES (...)"),
+    ("SELECT count(*) FROM t", "SELECT count(*) FROM t"),
+])
+def test_placeholder_lists_collapse(statement, expected):
+    assert normalize_statement(statement) == expected
+
+
+def test_list_lengths_share_one_entry():
+    lengths = [normalize_statement("SELECT 1 FROM t WHERE id IN (" + ", ".join(["?"] * n) + ")") for n in range(1, 500)]
+    assert len(set(lengths)) == 1
+
+
+def test_tracked_statements_are_capped(monkeypatch):
+    class Cursor:
+        rowcount = 0
+
+    class Conn:
+        info = {}
+
+    monkeypatch.setattr(instrumentation, "MAX_TRACKED_STATEMENTS", 3)
+    instrumentation.reset_statement_stats()
+    for i in range(10):
+        Conn.info["query_start_time"] = [0.0]
+        instrumentation._after_cursor_execute(Conn, Cursor, f"SELECT {i} FROM t", (), None, False)
+
+    statements = {row["statement"]: row["calls"] for row in instrumentation.top_statements(100)}
+    assert len(statements) == 4
+    assert statements[instrumentation.OTHER_STATEMENTS] == 7
+    instrumentation.reset_statement_stats()